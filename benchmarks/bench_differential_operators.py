@@ -0,0 +1,78 @@
+"""Benchmark the fused differential operators.
+
+``Field.grad``, ``Field.div``, ``Field.curl``, and ``Field.laplace`` write
+all directional derivatives directly to the resulting array, reading the
+components as views of the field array. They are compared with the previous
+implementations, which composed them from ``Field.derivative`` on component
+fields (copies) and concatenated the results with ``<<`` or summed them with
+``+``. Without a halo, only the boundary layers are gathered with ghost cells
+in every derivative. Fields with a halo (``halo=1``) refresh its ghost layers
+once per operator and apply all stencils to views of the padded buffer; they
+are timed as well. Results are checked to be identical for all boundary
+conditions.
+
+Usage::
+
+    python benchmarks/bench_differential_operators.py
+
+"""
+import timeit
+import numpy as np
+import discretisedfield as df
+
+
+def grad(f):
+    return f.derivative('x') << f.derivative('y') << f.derivative('z')
+
+
+def div(f):
+    return f.x.derivative('x') + f.y.derivative('y') + f.z.derivative('z')
+
+
+def curl(f):
+    curl_x = f.z.derivative('y') - f.y.derivative('z')
+    curl_y = f.x.derivative('z') - f.z.derivative('x')
+    curl_z = f.y.derivative('x') - f.x.derivative('y')
+    return curl_x << curl_y << curl_z
+
+
+def laplace(f):
+    if f.dim == 1:
+        return (f.derivative('x', n=2) + f.derivative('y', n=2) +
+                f.derivative('z', n=2))
+    else:
+        return laplace(f.x) << laplace(f.y) << laplace(f.z)
+
+
+def best(function, number):
+    """Best time per call in milliseconds."""
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 1e3
+
+
+def main():
+    n = (200, 200, 50)
+    for bc in ['', 'xyz', 'neumann']:
+        mesh = df.Mesh(p1=(0, 0, 0), p2=n, cell=(1, 1, 1), bc=bc)
+        scalar = df.Field(mesh, dim=1, value=np.random.random((*n, 1)))
+        vector = df.Field(mesh, dim=3, value=np.random.random((*n, 3)))
+        print(f'{n=}, {bc=}')
+
+        operators = [('grad', grad, scalar), ('div', div, vector),
+                     ('curl', curl, vector), ('laplace', laplace, vector)]
+        for name, reference, field in operators:
+            assert np.array_equal(getattr(field, name).array,
+                                  reference(field).array)
+            fused = best(lambda: getattr(field, name), 5)
+            composed = best(lambda: reference(field), 5)
+            padded = df.Field(mesh, dim=field.dim, value=field.array)
+            padded.halo = 1
+            assert np.array_equal(getattr(padded, name).array,
+                                  reference(field).array)
+            halo = best(lambda: getattr(padded, name), 5)
+            print(f'  {name}: composed {composed:.0f} ms, '
+                  f'fused {fused:.0f} ms, speedup {composed/fused:.1f}x, '
+                  f'fused with halo {halo:.0f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark deferred evaluation of field expressions.
+
+The expression ``m @ (m.derivative('x') & m.derivative('y'))`` is evaluated
+eagerly with fields and with ``discretisedfield.Expression``. Time and peak
+memory allocated during the evaluation (measured with ``tracemalloc``) are
+reported. The eager evaluation allocates a full-size temporary field for
+every sub-expression, whereas the deferred evaluation allocates only the
+result and a few blocks of layers.
+
+Usage::
+
+    python benchmarks/bench_expression.py
+
+"""
+import time
+import tracemalloc
+import numpy as np
+import discretisedfield as df
+
+
+def measure(function):
+    """Time in seconds and peak memory in MB."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    for n in [(100, 100, 20), (200, 200, 50)]:
+        mesh = df.Mesh(p1=(0, 0, 0), p2=n, cell=(1, 1, 1))
+        field = df.Field(mesh, dim=3, value=np.random.random((*mesh.n, 3)))
+        size = field.array.nbytes / 2**20
+        print(f'{n=} (field size {size:.0f} MB)')
+
+        def eager():
+            return field @ (field.derivative('x') & field.derivative('y'))
+
+        def deferred():
+            m = df.Expression(field)
+            return (m @ (m.derivative('x') & m.derivative('y'))).evaluate()
+
+        for name, function in [('eager', eager), ('deferred', deferred)]:
+            elapsed, peak = measure(function)
+            print(f'  {name}: {elapsed:.3f} s, peak {peak:.0f} MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark the overhead of creating fields in field operations.
+
+The time of creating a field from an existing array with
+``Field(mesh, dim, value=array)`` (typesystem checks, value conversion, and
+norm setting) is compared with the trusted constructor ``Field._fromarray``
+used internally. The time of a few common operations, whose results are now
+created with ``Field._fromarray``, is reported as well. Both small and large
+meshes are used: for small meshes the construction overhead dominates.
+
+Usage::
+
+    python benchmarks/bench_field_construction.py
+
+"""
+import timeit
+import numpy as np
+import discretisedfield as df
+
+
+def best(function, number):
+    """Best time per call in microseconds."""
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    for n in [(5, 5, 5), (100, 100, 100)]:
+        mesh = df.Mesh(p1=(0, 0, 0), p2=n, cell=(1, 1, 1))
+        array = np.random.random((*mesh.n, 3))
+        field = df.Field(mesh, dim=3, value=array)
+        number = 10000 if len(mesh) < 1000 else 10
+        print(f'{n=}')
+
+        init = best(lambda: df.Field(mesh, dim=3, value=array), number)
+        fast = best(lambda: df.Field._fromarray(mesh, array), number)
+        print(f'  construction: Field {init:.1f} us, '
+              f'_fromarray {fast:.1f} us, speedup {init/fast:.1f}x')
+
+        operations = {'f + f': lambda: field + field,
+                      'f * 2': lambda: field * 2,
+                      'f.x': lambda: field.x,
+                      'f.norm': lambda: field.norm,
+                      'f.orientation': lambda: field.orientation,
+                      "f.derivative('x')": lambda: field.derivative('x')}
+        for name, operation in operations.items():
+            print(f'  {name}: {best(operation, number // 10):.1f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark decoding binary OVF data.
+
+The current decoding of the binary data block (``numpy.frombuffer``, as in
+``Field.fromfile``) is compared with the previous implementation, which
+decoded it with ``struct.iter_unpack``. Both are timed on the same, already
+read, data block, so that only the decoding is compared. The time of the
+whole ``Field.fromfile`` (reading the file, parsing the header, and creating
+the field) is reported for reference.
+
+Usage::
+
+    python benchmarks/bench_ovf_read.py [nx ny nz]
+
+"""
+import os
+import sys
+import struct
+import timeit
+import tempfile
+import numpy as np
+import discretisedfield as df
+
+
+def data_block(filename):
+    """File contents, data block boundaries, and the data format."""
+    with open(filename, 'rb') as ovffile:
+        f = ovffile.read()
+
+    mdatalines = [line for line in f.split(b'\n') if line.startswith(b'#')]
+    endian = '<' if b'2.0' in mdatalines[0] else '>'
+
+    header = b'# Begin: Data Binary '
+    data_start = f.find(header)
+    header = f[data_start:(data_start + len(header) + 1)]
+    data_start += len(header)
+    data_end = f.find(b'# End: Data Binary ')
+
+    if b'4' in header:
+        nbytes, formatstr = 4, endian + 'f'
+    else:
+        nbytes, formatstr = 8, endian + 'd'
+
+    for nl in [b'\n\r', b'\r\n', b'\n']:
+        if f.startswith(nl, data_start):
+            data_start += len(nl)
+            break
+    data_end -= (data_end - data_start) % nbytes
+
+    return f, data_start, data_end, nbytes, formatstr
+
+
+def legacy_decode(f, data_start, data_end, nbytes, formatstr):
+    """Decode the data block as the previous reader did."""
+    listdata = list(struct.iter_unpack(formatstr, f[data_start:data_end]))
+    return np.array(listdata)[1:, 0]
+
+
+def current_decode(f, data_start, data_end, nbytes, formatstr):
+    """Decode the data block as ``Field.fromfile`` does."""
+    count = (data_end - data_start) // nbytes
+    return np.frombuffer(f, dtype=formatstr, count=count,
+                         offset=data_start).astype(float)[1:]
+
+
+def best(function):
+    """Best time of a single call in milliseconds."""
+    return min(timeit.repeat(function, number=1, repeat=3)) * 1e3
+
+
+def main(n):
+    mesh = df.Mesh(p1=(0, 0, 0), p2=n, cell=(1, 1, 1))
+    field = df.Field(mesh, dim=3, value=np.random.random((*mesh.n, 3)))
+    print(f'{n=}, {field.array.size} values')
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for representation in ['bin4', 'bin8']:
+            filename = os.path.join(tmpdir, f'{representation}.omf')
+            field.write(filename, representation=representation)
+
+            block = data_block(filename)
+            assert np.array_equal(legacy_decode(*block),
+                                  current_decode(*block))
+            legacy = best(lambda: legacy_decode(*block))
+            current = best(lambda: current_decode(*block))
+            fromfile = best(lambda: df.Field.fromfile(filename))
+            print(f'{representation}: decoding legacy {legacy:.1f} ms, '
+                  f'current {current:.1f} ms, speedup {legacy/current:.0f}x; '
+                  f'Field.fromfile {fromfile:.1f} ms')
+
+
+if __name__ == '__main__':
+    n = tuple(map(int, sys.argv[1:4])) if len(sys.argv) > 3 else (100, 100, 50)
+    main(n)
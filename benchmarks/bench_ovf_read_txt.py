@@ -0,0 +1,80 @@
+"""Benchmark reading text OVF files.
+
+A text OVF file with a multi-million-cell mesh is generated (by default
+200 x 100 x 100 cells, 2 million cells with 3 components each). The
+current parsing of the data (``np.loadtxt`` on the contiguous data block, as
+in ``Field.fromfile``) is compared with the previous implementation, which
+read all lines into a list and passed a filter over them to ``np.loadtxt``.
+Both read the file and parse the data only. The time of the whole
+``Field.fromfile`` is reported for reference.
+
+Usage::
+
+    python benchmarks/bench_ovf_read_txt.py [nx ny nz]
+
+"""
+import io
+import os
+import sys
+import timeit
+import tempfile
+import numpy as np
+import discretisedfield as df
+
+
+def make_txt_file(filename, n):
+    """Generate a text OVF file with random unit vectors on ``n`` cells."""
+    mesh = df.Mesh(p1=(0, 0, 0), p2=n, cell=(1, 1, 1))
+    rng = np.random.default_rng(0)
+    with df.OVFWriter(filename, mesh, dim=3, representation='txt') as writer:
+        for _ in range(mesh.n[2]):
+            layer = rng.normal(size=(mesh.n[0], mesh.n[1], 3))
+            layer /= np.linalg.norm(layer, axis=-1)[..., np.newaxis]
+            writer.write_slab(layer)
+
+    return mesh
+
+
+def legacy_read_txt(filename):
+    """Decode the data block as the previous reader did (data only)."""
+    with open(filename, 'r', encoding='utf-8') as ovffile:
+        lines = ovffile.readlines()
+
+    return np.loadtxt(filter(lambda s: not s.startswith('#'), lines))
+
+
+def current_read_txt(filename):
+    """Decode the data block as ``Field.fromfile`` does (data only)."""
+    with open(filename, 'rb') as ovffile:
+        f = ovffile.read()
+
+    data_start = f.find(b'# Begin: Data Text')
+    data_start = f.find(b'\n', data_start) + 1
+    data_end = f.find(b'# End: Data Text', data_start)
+    return np.loadtxt(io.BytesIO(f[data_start:data_end]), dtype=float)
+
+
+def main(n):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'txt.omf')
+        mesh = make_txt_file(filename, n)
+        size = os.path.getsize(filename) / 1024**2
+        print(f'{n=}, {len(mesh)} cells, {size:.1f} MB')
+
+        assert np.array_equal(legacy_read_txt(filename),
+                              current_read_txt(filename))
+        legacy = min(timeit.repeat(lambda: legacy_read_txt(filename),
+                                   number=1, repeat=1))
+        current = min(timeit.repeat(lambda: current_read_txt(filename),
+                                    number=1, repeat=3))
+        fromfile = min(timeit.repeat(lambda: df.Field.fromfile(filename),
+                                     number=1, repeat=3))
+        print(f'txt: legacy {legacy:.3f} s, current {current:.3f} s, '
+              f'speedup {legacy/current:.1f}x; '
+              f'Field.fromfile {fromfile:.3f} s')
+
+
+if __name__ == '__main__':
+    n = tuple(map(int, sys.argv[1:4])) if len(sys.argv) > 3 else (200, 100,
+                                                                  100)
+    main(n)
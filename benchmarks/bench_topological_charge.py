@@ -0,0 +1,133 @@
+"""Benchmark the Berg-Luescher topological charge density and charge.
+
+``discretisedfield.tools.topological_charge_density`` with
+``method='berg-luescher'`` computes the solid angles of all triangles on the
+plane at once using shifted views of the orientation array. It is compared
+with the previous implementation, which looped over cells in Python and
+computed up to four triangles per cell one by one.
+
+``discretisedfield.tools.topological_charge`` with ``direction`` computes the
+charges of all layers of a three-dimensional field in one call. It is
+compared with slicing every layer with ``plane`` and looping over its
+plaquettes in Python. Results are checked to be the same. As in the other
+benchmarks, the previous implementations are kept here, so that the
+benchmark does not depend on the tests.
+
+Usage::
+
+    python benchmarks/bench_topological_charge.py
+
+"""
+import cmath
+import timeit
+import itertools
+import numpy as np
+import discretisedfield as df
+import discretisedfield.tools as dft
+import discretisedfield.util as dfu
+
+
+def bergluescher_angle(v1, v2, v3):
+    if np.dot(v1, np.cross(v2, v3)) == 0:
+        return 0.0
+    rho = (2 *
+           (1 + np.dot(v1, v2)) *
+           (1 + np.dot(v2, v3)) *
+           (1 + np.dot(v3, v1)))**0.5
+    numerator = (1 + np.dot(v1, v2) + np.dot(v2, v3) + np.dot(v3, v1) +
+                 1j*(np.dot(v1, np.cross(v2, v3))))
+    return 2 * cmath.log(numerator/rho).imag / (4*np.pi)
+
+
+def density_loop(field):
+    axis1 = field.mesh.info['axis1']
+    axis2 = field.mesh.info['axis2']
+    of = field.orientation
+    n1, n2 = of.mesh.n[axis1], of.mesh.n[axis2]
+    area = 0.5 * field.mesh.cell[axis1] * field.mesh.cell[axis2]
+    q = np.zeros((*field.mesh.n, 1))
+
+    def vector(i, j):
+        if 0 <= i < n1 and 0 <= j < n2:
+            return of.array[dfu.assemble_index(0, 3, {axis1: i, axis2: j})]
+
+    for i, j in itertools.product(range(n1), range(n2)):
+        v0 = vector(i, j)
+        v1, v2, v3, v4 = (vector(i+1, j), vector(i, j+1),
+                          vector(i-1, j), vector(i, j-1))
+        charge = 0
+        triangle_count = 0
+        for va, vb in [(v1, v2), (v2, v3), (v3, v4), (v4, v1)]:
+            if va is not None and vb is not None:
+                triangle_count += 1
+                charge += bergluescher_angle(v0, va, vb)
+        if triangle_count > 0:
+            q[dfu.assemble_index(0, 3, {axis1: i, axis2: j})] = \
+                charge / (area * triangle_count)
+
+    return q
+
+
+def charge_loop(field):
+    axis1 = field.mesh.info['axis1']
+    axis2 = field.mesh.info['axis2']
+    of = field.orientation
+
+    def vector(i, j):
+        return of.array[dfu.assemble_index(0, 3, {axis1: i, axis2: j})]
+
+    charge = 0
+    for i, j in itertools.product(range(of.mesh.n[axis1] - 1),
+                                  range(of.mesh.n[axis2] - 1)):
+        v1, v2, v3, v4 = (vector(i, j), vector(i+1, j),
+                          vector(i+1, j+1), vector(i, j+1))
+        charge += (bergluescher_angle(v1, v2, v4) +
+                   bergluescher_angle(v2, v3, v4))
+
+    return charge
+
+
+def best(function, number):
+    """Best time per call in milliseconds."""
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 1e3
+
+
+def main():
+    for n in [(50, 50, 1), (100, 100, 1)]:
+        mesh = df.Mesh(p1=(0, 0, 0), p2=n, cell=(1, 1, 1))
+        field = df.Field(mesh, dim=3, value=np.random.random((*n, 3)) - 0.5)
+        plane = field.plane('z')
+        print(f'{n=}')
+
+        def vectorised():
+            return dft.topological_charge_density(plane,
+                                                  method='berg-luescher')
+
+        assert np.allclose(vectorised().array, density_loop(plane))
+        loop = best(lambda: density_loop(plane), 1)
+        fast = best(vectorised, 10)
+        print(f'  density: loop {loop:.0f} ms, vectorised {fast:.1f} ms, '
+              f'speedup {loop/fast:.0f}x')
+
+    n = (50, 50, 20)
+    mesh = df.Mesh(p1=(0, 0, 0), p2=n, cell=(1, 1, 1))
+    field = df.Field(mesh, dim=3, value=np.random.random((*n, 3)) - 0.5)
+    print(f'{n=}')
+
+    def layers_loop():
+        return [charge_loop(field.plane(z=z))
+                for z in field.mesh.axis_points('z')]
+
+    def layers():
+        return dft.topological_charge(field, method='berg-luescher',
+                                      direction='z')
+
+    assert np.allclose(layers(), layers_loop())
+    loop = best(layers_loop, 1)
+    fast = best(layers, 10)
+    print(f'  charge of all layers: loop {loop:.0f} ms, vectorised '
+          f'{fast:.1f} ms, speedup {loop/fast:.0f}x')
+
+
+if __name__ == '__main__':
+    main()
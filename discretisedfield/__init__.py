@@ -5,6 +5,9 @@ import pkg_resources
 from .region import Region
 from .mesh import Mesh
 from .field import Field
+from .ovfwriter import OVFWriter
+from .timeseries import TimeSeries
+from .expression import Expression
 from .line import Line
 from .operators import DValue, dx, dy, dz, dV, dS, integral
 from .interact import interact
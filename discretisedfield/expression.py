@@ -0,0 +1,342 @@
+import numbers
+import operator
+import numpy as np
+import discretisedfield as df
+import discretisedfield.util as dfu
+
+# Operations of expression nodes, applied to fields defined on a block of the
+# mesh.
+operations = {'+': operator.add,
+              '-': operator.sub,
+              '*': operator.mul,
+              '/': operator.truediv,
+              '@': operator.matmul,
+              '&': operator.and_,
+              '**': operator.pow,
+              'neg': operator.neg,
+              'component': lambda f, name: f.component(name),
+              'derivative': lambda f, direction, n: f.derivative(direction,
+                                                                 n=n),
+              'norm': lambda f: f.norm}
+
+
+class Expression:
+    """Deferred field expression.
+
+    Arithmetic on fields allocates a full-size temporary field for every
+    sub-expression. For instance, ``of @ (of.derivative('x') &
+    of.derivative('y'))`` creates four of them. Wrapping a field in
+    ``Expression`` enables a lazy mode: the operators (``+``, ``-``, ``*``,
+    ``/``, ``@``, ``&``, ``**``, unary ``-``), components (``x``, ``y``,
+    ``z``), ``norm``, and ``derivative`` do not compute anything. Instead, they
+    build an expression tree, which is evaluated by calling ``evaluate``.
+
+    The evaluation is a single fused pass over blocks of layers of the mesh.
+    For every block, the whole tree is evaluated using the same field
+    operations as in the eager mode, and the result is written to the output
+    field. Therefore, the peak memory is the output field and a few blocks
+    instead of one full-size temporary field per operation. Identical
+    sub-expressions (the same operation on the same operands) are computed
+    only once per block. The mesh is split along an axis no derivative in the
+    expression is computed along. If derivatives along all three axes are
+    present, the expression is evaluated on the whole mesh at once (with
+    repeated sub-expressions still computed once).
+
+    Fields, numbers, ``array_like`` constants, and ``discretisedfield.DValue``
+    objects can be used as the other operand, in which case fields are
+    wrapped in ``Expression`` automatically. All fields in an expression must
+    be defined on the same mesh.
+
+    Parameters
+    ----------
+    field : discretisedfield.Field
+
+        Field wrapped in the expression.
+
+    Raises
+    ------
+    TypeError
+
+        If ``field`` is not ``discretisedfield.Field``.
+
+    Examples
+    --------
+    1. Deferred evaluation of an expression.
+
+    >>> import discretisedfield as df
+    ...
+    >>> p1 = (0, 0, 0)
+    >>> p2 = (100e-9, 50e-9, 10e-9)
+    >>> cell = (5e-9, 5e-9, 5e-9)
+    >>> mesh = df.Mesh(p1=p1, p2=p2, cell=cell)
+    >>> def value_fun(point):
+    ...     x, y, z = point
+    ...     return (x, y, 1e-8)
+    >>> field = df.Field(mesh, dim=3, value=value_fun, norm=1)
+    ...
+    >>> of = df.Expression(field)
+    >>> expression = of @ (of.derivative('x') & of.derivative('y'))
+    >>> expression
+    Expression(operation='@', dim=1)
+    >>> result = expression.evaluate()
+    >>> result
+    Field(...)
+    >>> result.allclose(field @ (field.derivative('x') &
+    ...                          field.derivative('y')))
+    True
+
+    """
+    def __init__(self, field, /):
+        if not isinstance(field, df.Field):
+            msg = f'Cannot create expression from {type(field)=}.'
+            raise TypeError(msg)
+
+        self.operation = 'field'
+        self.args = (field,)
+        self.dim = field.dim
+        self.mesh = field.mesh
+
+    @classmethod
+    def _node(cls, operation, args, dim):
+        # Expression node applying operation to args.
+        node = cls.__new__(cls)
+        node.operation = operation
+        node.args = args
+        node.dim = dim
+        node.mesh = next(arg.mesh for arg in args if isinstance(arg, cls))
+        return node
+
+    def _operand(self, other):
+        # Wrap fields and resolve differentials. Other operands are constants.
+        if isinstance(other, df.DValue):
+            other = other(self)
+        if isinstance(other, df.Field):
+            other = self.__class__(other)
+        if isinstance(other, self.__class__) and other.mesh != self.mesh:
+            msg = 'Cannot combine expressions defined on different meshes.'
+            raise ValueError(msg)
+        if isinstance(other, (tuple, list)):
+            other = tuple(other)
+        return other
+
+    def _binary(self, operation, other, reflected=False):
+        other = self._operand(other)
+        args = (other, self) if reflected else (self, other)
+
+        dims = [arg.dim if isinstance(arg, self.__class__) else
+                1 if isinstance(arg, numbers.Real) else len(arg)
+                for arg in args]
+        if operation in '+-':
+            dim = self.dim
+        elif operation == '*':
+            dim = max(dims)
+        elif operation == '/':
+            dim = dims[0]
+        elif operation == '@':
+            dim = 1
+        else:  # '&'
+            dim = 3
+
+        return self._node(operation, args, dim)
+
+    def __add__(self, other):
+        return self._binary('+', other)
+
+    def __radd__(self, other):
+        return self._binary('+', other, reflected=True)
+
+    def __sub__(self, other):
+        return self._binary('-', other)
+
+    def __rsub__(self, other):
+        return self._binary('-', other, reflected=True)
+
+    def __mul__(self, other):
+        return self._binary('*', other)
+
+    def __rmul__(self, other):
+        return self._binary('*', other, reflected=True)
+
+    def __truediv__(self, other):
+        return self._binary('/', other)
+
+    def __rtruediv__(self, other):
+        return self._binary('/', other, reflected=True)
+
+    def __matmul__(self, other):
+        return self._binary('@', other)
+
+    def __rmatmul__(self, other):
+        return self._binary('@', other, reflected=True)
+
+    def __and__(self, other):
+        return self._binary('&', other)
+
+    def __rand__(self, other):
+        return self._binary('&', other, reflected=True)
+
+    def __pow__(self, other):
+        return self._node('**', (self, other), dim=1)
+
+    def __neg__(self):
+        return self._node('neg', (self,), dim=self.dim)
+
+    def __pos__(self):
+        return self
+
+    @property
+    def x(self):
+        """Deferred x-component (refer to ``discretisedfield.Field.x``)."""
+        return self._node('component', (self, 'x'), dim=1)
+
+    @property
+    def y(self):
+        """Deferred y-component (refer to ``discretisedfield.Field.y``)."""
+        return self._node('component', (self, 'y'), dim=1)
+
+    @property
+    def z(self):
+        """Deferred z-component (refer to ``discretisedfield.Field.z``)."""
+        return self._node('component', (self, 'z'), dim=1)
+
+    @property
+    def norm(self):
+        """Deferred norm (refer to ``discretisedfield.Field.norm``)."""
+        return self._node('norm', (self,), dim=1)
+
+    def derivative(self, direction, n=1):
+        """Deferred directional derivative.
+
+        Refer to ``discretisedfield.Field.derivative``.
+
+        """
+        return self._node('derivative', (self, direction, n), dim=self.dim)
+
+    def __repr__(self):
+        """Representation string.
+
+        Returns
+        -------
+        str
+
+            Representation string.
+
+        """
+        return f"Expression(operation='{self.operation}', dim={self.dim})"
+
+    def _key(self, keys):
+        # Structural key of the node. Identical sub-expressions have equal
+        # keys. Keys of already visited nodes are memoised in keys.
+        if id(self) not in keys:
+            if self.operation == 'field':
+                key = ('field', id(self.args[0]))
+            else:
+                key = (self.operation,
+                       *(arg._key(keys) if isinstance(arg, self.__class__)
+                         else ('array', id(arg)) if isinstance(arg,
+                                                               np.ndarray)
+                         else arg for arg in self.args))
+            keys[id(self)] = key
+        return keys[id(self)]
+
+    def _nodes(self):
+        # Unique nodes in the evaluation order (operands before operations)
+        # and the number of uses of each node as an operand, both by key.
+        keys, nodes, uses = {}, {}, {}
+
+        def visit(node):
+            key = node._key(keys)
+            if key in nodes:
+                return key
+            for arg in node.args:
+                if isinstance(arg, self.__class__):
+                    arg_key = visit(arg)
+                    uses[arg_key] = uses.get(arg_key, 0) + 1
+            nodes[key] = node
+            return key
+
+        visit(self)
+        return nodes, uses
+
+    def evaluate(self, size=2**24):
+        """Evaluate the expression.
+
+        Parameters
+        ----------
+        size : int, optional
+
+            Approximate size in bytes of a three-dimensional (``dim=3``) block
+            of the mesh. Defaults to 16MB.
+
+        Returns
+        -------
+        discretisedfield.Field
+
+            Resulting field.
+
+        """
+        nodes, uses = self._nodes()
+        keys = {}
+
+        # Split the mesh along an axis without derivatives.
+        derivative_axes = {dfu.axesdict[node.args[1]]
+                           for node in nodes.values()
+                           if node.operation == 'derivative'}
+        axes = [axis for axis in (2, 1, 0) if axis not in derivative_axes]
+        mesh = self.mesh
+        if axes:
+            axis = axes[0]
+            layer = 3 * 8 * len(mesh) // mesh.n[axis]
+            step = max(1, size // layer)
+        else:
+            axis, step = 2, mesh.n[2]
+
+        res_array = np.empty((*mesh.n, self.dim))
+        for start in range(0, mesh.n[axis], step):
+            stop = min(start + step, mesh.n[axis])
+            index = dfu.assemble_index(slice(None), 3,
+                                       {axis: slice(start, stop)})
+            block_mesh = self._block_mesh(axis, start, stop)
+
+            values = {}
+            remaining = dict(uses)
+            for key, node in nodes.items():
+                if node.operation == 'field':
+                    field = node.args[0]
+                    if field.lazy:
+                        array = field._read(index)
+                    else:
+                        array = field._data[index]
+                    values[key] = df.Field._fromarray(block_mesh, array)
+                    continue
+
+                args = []
+                for arg in node.args:
+                    if isinstance(arg, self.__class__):
+                        arg_key = arg._key(keys)
+                        args.append(values[arg_key])
+                        remaining[arg_key] -= 1
+                        if remaining[arg_key] == 0:
+                            del values[arg_key]  # release the block
+                    else:
+                        args.append(arg)
+                values[key] = operations[node.operation](*args)
+
+            res_array[index] = values[self._key(keys)].array
+
+        return df.Field._fromarray(mesh, res_array)
+
+    def _block_mesh(self, axis, start, stop):
+        # Mesh of the block of layers start:stop along axis.
+        mesh = self.mesh
+        if start == 0 and stop == mesh.n[axis]:
+            return mesh
+
+        p1 = list(mesh.region.pmin)
+        p2 = list(mesh.region.pmax)
+        n = list(mesh.n)
+        p1[axis] = mesh.region.pmin[axis] + start * mesh.cell[axis]
+        if stop < mesh.n[axis]:
+            p2[axis] = mesh.region.pmin[axis] + stop * mesh.cell[axis]
+        n[axis] = stop - start
+        return df.Mesh(p1=p1, p2=p2, n=n, bc=mesh.bc)
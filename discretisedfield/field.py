@@ -1,16 +1,21 @@
+import io
+import re
 import k3d
 import h5py
-import struct
+import base64
 import numbers
 import inspect
+import weakref
 import itertools
 import matplotlib
+import collections
 import numpy as np
 import discretisedfield as df
 import ubermagutil.units as uu
 import matplotlib.pyplot as plt
 import ubermagutil.typesystem as ts
 import discretisedfield.util as dfu
+from xml.etree import ElementTree
 
 # TODO: tutorials, fft, line operations
 
@@ -116,6 +121,58 @@ class Field:
         self.value = value
         self.norm = norm
 
+    @classmethod
+    def _fromarray(cls, mesh, array):
+        """Create a field adopting ``array`` without validation.
+
+        This is a fast constructor for internal operations, whose results are
+        already arrays with shape ``(*mesh.n, dim)``. The array is neither
+        copied nor checked and the typesystem descriptors, value conversion,
+        and norm setting are bypassed. Therefore, it must be used only with
+        trusted arguments. For all other purposes,
+        ``discretisedfield.Field(mesh, dim, value=array)`` should be used.
+
+        This is a ``classmethod`` and should be called as, for instance,
+        ``discretisedfield.Field._fromarray(mesh, array)``.
+
+        Parameters
+        ----------
+        mesh : discretisedfield.Mesh
+
+            Finite-difference rectangular mesh.
+
+        array : numpy.ndarray
+
+            Array with shape ``(*mesh.n, dim)``.
+
+        Returns
+        -------
+        discretisedfield.Field
+
+            Field, whose array is ``array``.
+
+        Example
+        -------
+        1. Creating a field from an array.
+
+        >>> import numpy as np
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(5, 5, 5), cell=(1, 1, 1))
+        >>> array = np.ones((5, 5, 5, 3))
+        >>> field = df.Field._fromarray(mesh, array)
+        >>> field.dim
+        3
+        >>> field.array is array
+        True
+
+        """
+        field = cls.__new__(cls)
+        # Descriptors store their values in the instance dictionary.
+        field.__dict__.update(mesh=mesh, dim=array.shape[-1], _value=array,
+                              _array=array, _value_dirty=False)
+        return field
+
     @property
     def value(self):
         """Field value representation.
@@ -134,6 +191,22 @@ class Field:
         another ``discretisedfield.Field``. Finally, ``numpy.ndarray`` with
         shape ``(*self.mesh.n, dim)`` can be passed.
 
+        Calling a Python function for every point can be slow for large
+        meshes. If the function is decorated with
+        ``discretisedfield.util.vectorised``, it is called only once with a
+        tuple of coordinate arrays ``(x, y, z)``, each with shape
+        ``mesh.n``. It must return either an array with shape ``(*mesh.n,
+        dim)`` (``mesh.n`` is also allowed for ``dim=1``) or a tuple of
+        ``dim`` components, which are broadcast to the mesh shape.
+
+        The representation is not evaluated again on every read. It is
+        checked against the array only once after ``array`` has been accessed
+        or set (or the field has been changed in place, e.g. with ``+=``), so
+        reading ``value`` is O(1) otherwise. Changes made through a reference
+        to ``array`` obtained before the last read of ``value`` are not
+        tracked. Such changes should be made through ``field.array`` (e.g.
+        ``field.array[0, 0, 0] = ...``) instead.
+
         Parameters
         ----------
         value : numbers.Real, array_like, callable
@@ -199,19 +272,43 @@ class Field:
         >>> field.value.shape
         (2, 2, 1, 3)
 
+        2. Setting the field value using a vectorised Python function.
+
+        >>> import discretisedfield.util as dfu
+        ...
+        >>> @dfu.vectorised
+        ... def value_function(point):
+        ...     x, y, z = point
+        ...     return (x, 0, 1)
+        >>> field.value = value_function
+        >>> field.average
+        (1.0, 0.0, 1.0)
+
         .. seealso:: :py:func:`~discretisedfield.Field.array`
 
         """
-        value_array = dfu.as_array(self.mesh, self.dim, self._value)
-        if np.array_equal(self.array, value_array):
-            return self._value
-        else:
+        if self._value_dirty:
+            # The array might have been changed since the value was set, so
+            # the representation is checked once.
+            value_array = dfu.as_array(self.mesh, self.dim, self._value)
+            if not np.array_equal(self._data, value_array):
+                self._value = self._array
+            self._value_dirty = False
+
+        if self._value is self._array:
             return self.array
+        return self._value
 
     @value.setter
     def value(self, val):
         self._value = val
-        self.array = dfu.as_array(self.mesh, self.dim, val)
+        self.array = val
+        if self._array is not val and getattr(val, 'shape', None) == \
+                self._array.shape:
+            # The array has been copied (into the halo buffer or converted to
+            # float), so that val can change independently of the field.
+            self._value = self._array
+        self._value_dirty = False
 
     @property
     def array(self):
@@ -266,11 +363,355 @@ class Field:
         .. seealso:: :py:func:`~discretisedfield.Field.value`
 
         """
+        if self._value is not self._array:
+            # In-place changes of the array cannot be tracked. Therefore, the
+            # value representation is marked as dirty whenever the array is
+            # accessed.
+            self._value_dirty = True
+        cached = self.__dict__.pop('_cached', False)
+        if cached and not self._data.flags.writeable:
+            # The read-only array is shared with the cache this field was
+            # stored in. The field gets its own copy, so that it can be
+            # changed, and it is not returned from the cache anymore.
+            array = self._array.copy()
+            if self._value is self._array:
+                self._value = array
+            self._array = array
+            self.__dict__.pop('_cache_root', None)
+        return self._data
+
+    @property
+    def _data(self):
+        # Field array for internal operations, which do not change it in
+        # place. Unlike array, this does not mark the value as dirty or copy
+        # the array of a cached quantity.
+        if isinstance(self._array, h5py.Dataset):
+            # Lazy field: the whole dataset is read on the first access.
+            dataset = self._array
+            self._array = dataset[...].astype(float, copy=False)
+            if self._value is dataset:
+                self._value = self._array  # release the handle to the file
         return self._array
 
     @array.setter
     def array(self, val):
-        self._array = dfu.as_array(self.mesh, self.dim, val)
+        array = dfu.as_array(self.mesh, self.dim, val)
+        if self.halo:
+            self._array[...] = array  # interior of the halo buffer
+        else:
+            self._array = array
+        self._value_dirty = True
+        self._changed()
+
+    @property
+    def halo(self):
+        """Width of the ghost-cell halo.
+
+        By default, ``array`` holds only the values in the mesh cells. If
+        ``halo`` is set to a positive integer, the field owns a buffer padded
+        with ``halo`` ghost layers on each side of every axis and ``array`` is
+        a view of its interior. Setting ``array`` (or ``value``) copies values
+        into the interior. For axes with periodic or Neumann boundary
+        conditions, directional derivatives refresh the ghost layers in the
+        direction of the derivative in place (wrapped or mirrored values) and
+        apply the stencil to views of the buffer. Differential operators
+        (``grad``, ``div``, ``curl``, and ``laplace``) refresh the ghost layers
+        in all directions once and apply all stencils to views of the buffer.
+        No padded array is gathered in every call, so that a field
+        differentiated repeatedly (e.g. along x, y, and z in turn, or in a time
+        loop) reuses the same buffer. Derivatives with stencils wider than the
+        halo (``accuracy > 2 * halo``) and derivatives without boundary
+        conditions do not use the halo. Setting ``halo`` to 0 releases the
+        buffer.
+
+        Parameters
+        ----------
+        halo : int
+
+            Number of ghost layers. Defaults to 0 (no halo).
+
+        Returns
+        -------
+        int
+
+            Number of ghost layers.
+
+        Raises
+        ------
+        ValueError
+
+            If ``halo`` is not a non-negative integer.
+
+        Example
+        -------
+        1. Differentiating a field with a halo.
+
+        >>> import discretisedfield as df
+        ...
+        >>> p1 = (0, 0, 0)
+        >>> p2 = (10, 10, 10)
+        >>> cell = (1, 1, 1)
+        >>> mesh = df.Mesh(p1=p1, p2=p2, cell=cell, bc='xyz')
+        >>> field = df.Field(mesh, dim=3, value=lambda point: point)
+        >>> derivative = field.derivative('x')
+        ...
+        >>> field.halo = 1
+        >>> field.halo
+        1
+        >>> field.array.shape
+        (10, 10, 10, 3)
+        >>> field.derivative('x') == derivative
+        True
+
+        """
+        return self.__dict__.get('_halo', 0)
+
+    @halo.setter
+    def halo(self, val):
+        if not isinstance(val, numbers.Integral) or val < 0:
+            msg = f'Halo {val=} must be a non-negative integer.'
+            raise ValueError(msg)
+
+        value_is_array = self._value is self._array
+        if val == 0:
+            array = np.array(self._data)  # contiguous copy of the interior
+            self.__dict__.pop('_halo_array', None)
+        else:
+            buffer = np.empty(tuple(n + 2*val for n in self.mesh.n) +
+                              (self.dim,))
+            interior = (slice(val, -val),) * 3
+            buffer[interior] = self._data
+            array = buffer[interior]
+            self._halo_array = buffer
+        self._halo = val
+        self._array = array
+        if value_is_array:
+            self._value = array
+
+    @property
+    def cache_size(self):
+        """Memory budget of the cache of derived quantities.
+
+        Derived quantities of a field are often computed many times from the
+        same values. For instance, computing the topological charge density,
+        the emergent magnetic field, and the exchange energy density of one
+        snapshot repeats the same directional derivatives. If ``cache_size`` is
+        set to a positive number of bytes, directional derivatives (for every
+        direction, order, and accuracy), ``norm``, and ``orientation`` are
+        cached after they are computed for the first time. When the cache
+        exceeds ``cache_size``, the least recently used quantities are evicted.
+        Cached quantities are returned as the same fields, whose quantities are
+        cached as well and share the budget of the field. For instance,
+        derivatives of a cached ``orientation`` are cached and ``cache_size``
+        bounds all of them together. The arrays of cached quantities are shared
+        with the cache and, therefore, they are read-only. Accessing ``array``
+        of a cached quantity (which in-place operators, such as ``+=``, do as
+        well) gives the quantity its own copy of the array, which can be
+        changed, and the quantity is not returned from the cache anymore.
+        Setting ``cache_size`` of a cached quantity gives it its own cache.
+
+        Cached quantities are used only as long as the values of the field
+        are not changed through the field: every time ``array``, ``value``, or
+        ``norm`` is set and on in-place operators (e.g. ``+=``), the field
+        gets a new write version and quantities cached for earlier versions
+        are not used anymore. Reading the field (including ``array``) and
+        field operations do not invalidate the cache. Writing to the array in
+        place (e.g. ``field.array[0, 0, 0] = 1``) is not tracked. After such
+        changes, ``array`` should be set (e.g. ``field.array =
+        field.array``). The array of the field itself is never made
+        read-only. Setting ``cache_size`` to 0 (default) disables the cache.
+
+        Parameters
+        ----------
+        cache_size : numbers.Real
+
+            Memory budget in bytes.
+
+        Returns
+        -------
+        numbers.Real
+
+            Memory budget in bytes.
+
+        Raises
+        ------
+        ValueError
+
+            If ``cache_size`` is negative or not a number.
+
+        Example
+        -------
+        1. Caching derivatives.
+
+        >>> import discretisedfield as df
+        ...
+        >>> p1 = (0, 0, 0)
+        >>> p2 = (10, 10, 10)
+        >>> cell = (1, 1, 1)
+        >>> mesh = df.Mesh(p1=p1, p2=p2, cell=cell)
+        >>> field = df.Field(mesh, dim=3, value=lambda point: point)
+        >>> field.cache_size = 2**20  # 1MB
+        >>> dx = field.derivative('x')
+        >>> field.derivative('x') is dx  # from the cache
+        True
+        >>> field.value = lambda point: (point[0]**2, 0, 0)
+        >>> field.derivative('x') is dx  # computed again
+        False
+
+        """
+        return self._cache_owner.__dict__.get('_cache_size', 0)
+
+    @cache_size.setter
+    def cache_size(self, val):
+        if not isinstance(val, numbers.Real) or val < 0:
+            msg = f'Cache size {val=} must be a non-negative number.'
+            raise ValueError(msg)
+
+        # The field gets its own cache (and budget) instead of sharing the
+        # cache it is stored in.
+        self.__dict__.pop('_cache_root', None)
+        self._cache_size = val
+        if val == 0:
+            self.__dict__.pop('_cache', None)
+        elif '_cache' not in self.__dict__:
+            self._cache = collections.OrderedDict()
+            self._cache_nbytes = 0
+        else:
+            self._cache_evict()
+
+    @property
+    def _cache_owner(self):
+        # Field owning the cache (and the budget) this field uses. Cached
+        # quantities use the cache they are stored in.
+        return self.__dict__.get('_cache_root', self)
+
+    def _changed(self):
+        # The values of the field have been changed through the field. Cached
+        # quantities of earlier write versions are not used anymore. The
+        # cache owned by the field is cleared, because its quantities are
+        # derived from the field.
+        self._version = self.__dict__.get('_version', 0) + 1
+        cache = self.__dict__.get('_cache')
+        if cache:
+            cache.clear()
+            self._cache_nbytes = 0
+
+    def _cache_get(self, key):
+        # Cached derived quantity or None if it is not cached. Quantities
+        # cached for an earlier write version of this field, and quantities
+        # whose array has been replaced (e.g. by setting value or by
+        # accessing the array of the quantity) are dropped.
+        owner = self._cache_owner
+        cache = owner.__dict__.get('_cache')
+        key = (id(self), key)
+        if cache is None or key not in cache:
+            return None
+        ref, version, field, array = cache[key]
+        if (ref() is not self or version != self.__dict__.get('_version', 0)
+                or field._array is not array):
+            owner._cache_pop(key)
+            return None
+        cache.move_to_end(key)
+        return field
+
+    def _cache_put(self, key, field):
+        # Cache a derived quantity (if the cache is enabled and it fits in the
+        # budget) and return it. Its array is made read-only and its own
+        # quantities are stored in the same cache (e.g. derivatives of the
+        # orientation), so that all of them share one budget. Entries are
+        # keyed by the id of this field, which is checked with a weak
+        # reference, and record its write version.
+        owner = self._cache_owner
+        cache = owner.__dict__.get('_cache')
+        if cache is not None and field._data.nbytes <= owner.cache_size:
+            array = field._data
+            array.flags.writeable = False
+            field._cache_root = owner
+            field._cached = True
+            cache[(id(self), key)] = (weakref.ref(self),
+                                      self.__dict__.get('_version', 0),
+                                      field, array)
+            owner._cache_nbytes += array.nbytes
+            owner._cache_evict()
+        return field
+
+    def _cache_pop(self, key=None):
+        # Remove a quantity (the least recently used one if key is None).
+        cache = self._cache
+        if key is None:
+            _, (*_, array) = cache.popitem(last=False)
+        else:
+            *_, array = cache.pop(key)
+        self._cache_nbytes -= array.nbytes
+
+    def _cache_evict(self):
+        # Evict the least recently used quantities exceeding the budget.
+        while self._cache_nbytes > self.cache_size:
+            self._cache_pop()
+
+    @property
+    def lazy(self):
+        """Lazy field flag.
+
+        A field read from an HDF5 file with
+        ``discretisedfield.Field.fromfile(filename, lazy=True)`` keeps a handle
+        to the dataset in the file instead of reading its values. Extracting
+        the field on a subregion (``field[item]``), sampling it (e.g.
+        ``plane`` or ``line``), and computing ``average`` and ``integral``
+        read only the required parts of the dataset (one block of z-layers at
+        a time), so that fields larger than the available memory can be
+        analysed. Any other operation reads the whole dataset into ``array``
+        and the field is not lazy anymore.
+
+        Returns
+        -------
+        bool
+
+            ``True`` if the values of the field have not been read.
+
+        Examples
+        --------
+        1. Reading a lazy field.
+
+        >>> import os
+        >>> import discretisedfield as df
+        ...
+        >>> dirname = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample')
+        >>> filename = os.path.join(dirname, 'hdf5-file.hdf5')
+        >>> field = df.Field.fromfile(filename, lazy=True)
+        >>> field.lazy
+        True
+        >>> field.average
+        (...)
+        >>> field.lazy
+        True
+        >>> field.array
+        array(...)
+        >>> field.lazy
+        False
+
+        .. seealso:: :py:func:`~discretisedfield.Field.fromfile`
+
+        """
+        return isinstance(self._array, h5py.Dataset)
+
+    def _read(self, slices):
+        # Copy of a part of the field array. For lazy fields, only the
+        # hyperslab is read from the file.
+        if self.lazy:
+            return self._array[slices].astype(float, copy=False)
+        return np.array(self._data[slices])
+
+    def _slabs(self, size=2**26):
+        # Field array in blocks of z-layers of about size bytes, aligned with
+        # the chunks of a lazy field's dataset.
+        step = max(1, size // (8 * self.mesh.n[0] * self.mesh.n[1] * self.dim))
+        if self.lazy and self._array.chunks is not None:
+            chunk = self._array.chunks[2]
+            step = max(chunk, step // chunk * chunk)
+        for k in range(0, self.mesh.n[2], step):
+            yield self._read((slice(None), slice(None), slice(k, k + step)))
 
     @property
     def norm(self):
@@ -339,12 +780,15 @@ class Field:
         .. seealso:: :py:func:`~discretisedfield.Field.__abs__`
 
         """
+        res = self._cache_get(('norm',))
+        if res is not None:
+            return res
+
         if self.dim == 1:
-            res = abs(self.value)
+            res = np.abs(self._data)
         else:
-            res = np.linalg.norm(self.array, axis=-1)[..., np.newaxis]
-
-        return self.__class__(self.mesh, dim=1, value=res)
+            res = np.linalg.norm(self._data, axis=-1)[..., np.newaxis]
+        return self._cache_put(('norm',), self._fromarray(self.mesh, res))
 
     @norm.setter
     def norm(self, val):
@@ -353,12 +797,15 @@ class Field:
                 msg = f'Cannot set norm for field with dim={self.dim}.'
                 raise ValueError(msg)
 
-            if not np.all(self.norm.array):
+            norm_array = self.norm._data
+            if not np.all(norm_array):
                 msg = 'Cannot normalise field with zero values.'
                 raise ValueError(msg)
 
-            self.array /= self.norm.array  # normalise to 1
-            self.array *= dfu.as_array(self.mesh, dim=1, val=val)
+            array = self.array
+            array /= norm_array  # normalise to 1
+            array *= dfu.as_array(self.mesh, dim=1, val=val)
+            self._changed()
 
     def __abs__(self):
         """Field norm.
@@ -423,7 +870,7 @@ class Field:
         (0.0, 0.0, 0.0)
 
         """
-        return self.__class__(self.mesh, dim=self.dim, value=0)
+        return self._fromarray(self.mesh, np.zeros((*self.mesh.n, self.dim)))
 
     @property
     def orientation(self):
@@ -471,11 +918,17 @@ class Field:
                    f'dim={self.dim} field.')
             raise ValueError(msg)
 
-        orientation_array = np.divide(self.array,
-                                      self.norm.array,
-                                      out=np.zeros_like(self.array),
-                                      where=(self.norm.array != 0))
-        return self.__class__(self.mesh, dim=self.dim, value=orientation_array)
+        res = self._cache_get(('orientation',))
+        if res is not None:
+            return res
+
+        norm_array = self.norm._data
+        orientation_array = np.divide(self._data,
+                                      norm_array,
+                                      out=np.zeros_like(self._data),
+                                      where=(norm_array != 0))
+        return self._cache_put(('orientation',),
+                               self._fromarray(self.mesh, orientation_array))
 
     @property
     def average(self):
@@ -513,7 +966,11 @@ class Field:
         55.0
 
         """
-        return dfu.array2tuple(self.array.mean(axis=(0, 1, 2)))
+        if self.lazy:
+            total = sum(slab.sum(axis=(0, 1, 2)) for slab in self._slabs())
+            return dfu.array2tuple(total / len(self.mesh))
+
+        return dfu.array2tuple(self._data.mean(axis=(0, 1, 2)))
 
     def __repr__(self):
         """Representation string.
@@ -579,7 +1036,159 @@ class Field:
         (1.0, 3.0, 4.0)
 
         """
-        return dfu.array2tuple(self.array[self.mesh.point2index(point)])
+        return dfu.array2tuple(self._read(self.mesh.point2index(point)))
+
+    def sample(self, points, /, fill_value=None, interpolation='nearest'):
+        """Sample the field values at multiple points.
+
+        This is a vectorised version of ``discretisedfield.Field.__call__``.
+        By default (``interpolation='nearest'``), for each of the :math:`N`
+        points, the value of the field in the discretisation cell to which the
+        point belongs is returned. With ``interpolation='linear'`` the values
+        are trilinearly interpolated between the cell centres and with
+        ``interpolation='cubic'`` tricubic (Catmull-Rom) interpolation is used.
+        Along the directions in which the mesh is periodic (``mesh.bc``), the
+        interpolation wraps around the mesh region. Along all other
+        directions, values outside the outermost cell centres are equal to the
+        values at the outermost cell centres.
+
+        If ``fill_value`` is passed, points outside the mesh region get that
+        value. Otherwise, ``ValueError`` is raised.
+
+        Parameters
+        ----------
+        points : (N, 3) array_like
+
+            The point coordinates :math:`\\mathbf{p} = (p_{x}, p_{y},
+            p_{z})`.
+
+        fill_value : numbers.Real, array_like, optional
+
+            The value assigned to points outside the mesh region. Defaults to
+            ``None``.
+
+        interpolation : str, optional
+
+            Interpolation method: ``'nearest'``, ``'linear'``, or
+            ``'cubic'``. Defaults to ``'nearest'``.
+
+        Returns
+        -------
+        numpy.ndarray
+
+            An array with shape ``(N, dim)``.
+
+        Raises
+        ------
+        ValueError
+
+            If ``points`` do not have shape ``(N, 3)``, if any point is outside
+            the mesh region and ``fill_value`` is not passed, or if
+            ``interpolation`` is not valid.
+
+        Example
+        -------
+        1. Sampling the field at multiple points.
+
+        >>> import discretisedfield as df
+        ...
+        >>> p1 = (0, 0, 0)
+        >>> p2 = (20, 20, 20)
+        >>> n = (20, 20, 20)
+        >>> mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), n=n)
+        ...
+        >>> field = df.Field(mesh, dim=3, value=(1, 3, 4))
+        >>> field.sample([(10, 2, 3), (0, 0, 0)])
+        array([[1., 3., 4.],
+               [1., 3., 4.]])
+        >>> field.sample([(10, 2, 3), (30, 0, 0)], fill_value=0)
+        array([[1., 3., 4.],
+               [0., 0., 0.]])
+
+        2. Interpolating the field between cell centres.
+
+        >>> field = df.Field(mesh, dim=1, value=lambda point: point[0])
+        >>> field.sample([(10, 2, 3), (10.25, 2, 3)], interpolation='linear')
+        array([[10.  ],
+               [10.25]])
+
+        .. seealso:: :py:func:`~discretisedfield.Field.__call__`
+
+        """
+        points = np.asarray(points, dtype=float)
+        if points.ndim != 2 or points.shape[1] != 3:
+            msg = f'Points must have shape (N, 3), not {points.shape}.'
+            raise ValueError(msg)
+
+        pmin = np.array(self.mesh.region.pmin)
+        pmax = np.array(self.mesh.region.pmax)
+        inside = np.logical_and(points >= pmin, points <= pmax).all(axis=1)
+        if fill_value is None and not inside.all():
+            msg = (f'{np.count_nonzero(~inside)} point(s) are outside the '
+                   'mesh region.')
+            raise ValueError(msg)
+
+        # Position in the units of cells relative to the first cell centre.
+        # Out-of-region points (including nan) are clipped and filled later.
+        position = np.nan_to_num((points - pmin) / self.mesh.cell - 0.5)
+
+        if interpolation == 'nearest':
+            index = np.round(position).astype(int)
+            index = np.clip(index, 0, np.subtract(self.mesh.n, 1))
+            array, offset = self._array_block(*index.T)
+            index -= offset
+            values = array[index[:, 0], index[:, 1], index[:, 2]]
+        elif interpolation in ['linear', 'cubic']:
+            # Indices and weights of neighbouring cells along each axis.
+            stencils = []
+            for i in range(3):
+                base = np.floor(position[:, i])
+                t = position[:, i] - base
+                if interpolation == 'linear':
+                    offsets = [0, 1]
+                    weights = [1 - t, t]
+                else:
+                    offsets = [-1, 0, 1, 2]
+                    weights = [(-t**3 + 2*t**2 - t) / 2,
+                               (3*t**3 - 5*t**2 + 2) / 2,
+                               (-3*t**3 + 4*t**2 + t) / 2,
+                               (t**3 - t**2) / 2]
+                index = base.astype(int)[:, np.newaxis] + offsets
+                if dfu.raxesdict[i] in self.mesh.bc:
+                    index = np.mod(index, self.mesh.n[i])
+                else:
+                    index = np.clip(index, 0, self.mesh.n[i] - 1)
+                stencils.append((index, np.stack(weights, axis=-1)))
+
+            (ix, wx), (iy, wy), (iz, wz) = stencils
+            array, offset = self._array_block(ix, iy, iz)
+            ix, iy, iz = ix - offset[0], iy - offset[1], iz - offset[2]
+            values = np.zeros((len(points), self.dim),
+                              dtype=np.result_type(array, float))
+            for a, b, c in itertools.product(range(len(offsets)), repeat=3):
+                weight = wx[:, a] * wy[:, b] * wz[:, c]
+                values += (weight[:, np.newaxis] *
+                           array[ix[:, a], iy[:, b], iz[:, c]])
+        else:
+            msg = f'Interpolation {interpolation=} is not supported.'
+            raise ValueError(msg)
+
+        if fill_value is not None:
+            values[~inside] = fill_value
+
+        return values
+
+    def _array_block(self, *indices):
+        # The smallest block of the field array containing all cells with
+        # indices (one index array per axis) and the index of its first cell.
+        # Only that block is read for lazy fields.
+        if not self.lazy or indices[0].size == 0:
+            return self._data, (0, 0, 0)
+
+        lower = [int(index.min()) for index in indices]
+        upper = [int(index.max()) + 1 for index in indices]
+        slices = tuple(slice(i, j) for i, j in zip(lower, upper))
+        return self._read(slices), tuple(lower)
 
     def __getattr__(self, attr):
         """Extracting the component of the vector field.
@@ -629,12 +1238,83 @@ class Field:
 
         """
         if attr in list(dfu.axesdict.keys())[:self.dim] and self.dim in (2, 3):
-            attr_array = self.array[..., dfu.axesdict[attr]][..., np.newaxis]
-            return self.__class__(mesh=self.mesh, dim=1, value=attr_array)
+            return self.component(attr)
         else:
             msg = f'Object has no attribute {attr}.'
             raise AttributeError(msg)
 
+    def component(self, name, /, out=None):
+        """Extract the component of the vector field.
+
+        This method returns the same scalar field as ``field.x``, ``field.y``,
+        or ``field.z``. If ``out`` is passed, the component values are written
+        to the array of that field and no new array is allocated.
+
+        Parameters
+        ----------
+        name : str
+
+            Vector field component (``'x'``, ``'y'``, or ``'z'``).
+
+        out : discretisedfield.Field, optional
+
+            Scalar field defined on the same mesh, to which the result is
+            written. Defaults to ``None``.
+
+        Returns
+        -------
+        discretisedfield.Field
+
+            Scalar field with vector field component values (``out`` if
+            passed).
+
+        Raises
+        ------
+        ValueError
+
+            If ``name`` is not a component of the field or ``out`` is not
+            valid.
+
+        Examples
+        --------
+        1. Extracting the vector field component into an existing field.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(5, 5, 5), cell=(1, 1, 1))
+        >>> field = df.Field(mesh, dim=3, value=(0, 2, 1))
+        >>> buffer = df.Field(mesh, dim=1)
+        >>> field.component('y', out=buffer) is buffer
+        True
+        >>> buffer.average
+        2.0
+
+        """
+        if (name not in list(dfu.axesdict.keys())[:self.dim] or
+                self.dim not in (2, 3)):
+            msg = f'Field with {self.dim=} has no component {name}.'
+            raise ValueError(msg)
+
+        component_array = self._data[..., dfu.axesdict[name]]
+        if out is None:
+            return self._fromarray(self.mesh,
+                                   component_array[..., np.newaxis].copy())
+
+        self._check_out(out, dim=1)
+        out.array[..., 0] = component_array
+        out._value = out.array
+        return out
+
+    def _check_out(self, out, dim):
+        # Validate the output field of an operation on self.
+        if not isinstance(out, self.__class__):
+            msg = f'Output must be discretisedfield.Field, not {type(out)=}.'
+            raise TypeError(msg)
+        if out.mesh != self.mesh or out.dim != dim:
+            msg = (f'Output field must be defined on the same mesh and have '
+                   f'dim={dim}.')
+            raise ValueError(msg)
+
     def __dir__(self):
         """Extension of the ``dir(self)`` list.
 
@@ -654,7 +1334,7 @@ class Field:
             dirlist += list(dfu.axesdict.keys())[:self.dim]
         if self.dim == 1:
             need_removing = ['div', 'curl', 'orientation', 'mpl_vector',
-                             'k3d_vector']
+                             'k3d_vector', 'component', 'dot', 'cross']
         if self.dim == 3:
             need_removing = ['grad', 'mpl_scalar', 'k3d_scalar', 'k3d_nonzero']
 
@@ -696,8 +1376,8 @@ class Field:
         .. seealso:: :py:func:`~discretisedfield.Mesh.indices`
 
         """
-        for point in self.mesh:
-            yield point, self(point)
+        for index, point in zip(self.mesh.indices, self.mesh):
+            yield point, dfu.array2tuple(self._data[index])
 
     def __eq__(self, other):
         """Relational operator ``==``.
@@ -750,7 +1430,7 @@ class Field:
         if not isinstance(other, self.__class__):
             return False
         elif (self.mesh == other.mesh and self.dim == other.dim and
-              np.array_equal(self.array, other.array)):
+              np.array_equal(self._data, other._data)):
             return True
         else:
             return False
@@ -818,7 +1498,7 @@ class Field:
             raise TypeError(msg)
 
         if (self.mesh == other.mesh and self.dim == other.dim):
-            return np.allclose(self.array, other.array, rtol=rtol, atol=atol)
+            return np.allclose(self._data, other._data, rtol=rtol, atol=atol)
         else:
             return False
 
@@ -977,8 +1657,7 @@ class Field:
                    f'{type(self)=} and {type(other)=}.')
             raise TypeError(msg)
 
-        return self.__class__(self.mesh, dim=1,
-                              value=np.power(self.array, other))
+        return self._fromarray(self.mesh, np.power(self._data, other))
 
     def __add__(self, other):
         """Binary ``+`` operator.
@@ -1039,6 +1718,8 @@ class Field:
         .. seealso:: :py:func:`~discretisedfield.Field.__sub__`
 
         """
+        if isinstance(other, df.Expression):
+            return NotImplemented  # deferred evaluation
         if isinstance(other, self.__class__):
             if self.dim != other.dim:
                 msg = (f'Cannot apply operator + on {self.dim=} '
@@ -1057,8 +1738,7 @@ class Field:
                    f'{type(self)=} and {type(other)=}.')
             raise TypeError(msg)
 
-        return self.__class__(self.mesh, dim=self.dim,
-                              value=self.array + other.array)
+        return self._fromarray(self.mesh, self._data + other._data)
 
     def __radd__(self, other):
         return self + other
@@ -1194,6 +1874,8 @@ class Field:
         .. seealso:: :py:func:`~discretisedfield.Field.__truediv__`
 
         """
+        if isinstance(other, df.Expression):
+            return NotImplemented  # deferred evaluation
         if isinstance(other, self.__class__):
             if self.dim == 3 and other.dim == 3:
                 msg = (f'Cannot apply operator * on {self.dim=} '
@@ -1204,7 +1886,7 @@ class Field:
                        'defined on different meshes.')
                 raise ValueError(msg)
         elif isinstance(other, numbers.Real):
-            return self * self.__class__(self.mesh, dim=1, value=other)
+            return self._fromarray(self.mesh, np.multiply(self._data, other))
         elif self.dim == 1 and isinstance(other, (tuple, list, np.ndarray)):
             return self * self.__class__(self.mesh, dim=3, value=other)
         elif isinstance(other, df.DValue):
@@ -1214,9 +1896,8 @@ class Field:
                    f'{type(self)=} and {type(other)=}.')
             raise TypeError(msg)
 
-        res_array = np.multiply(self.array, other.array)
-        return self.__class__(self.mesh, dim=res_array.shape[-1],
-                              value=res_array)
+        res_array = np.multiply(self._data, other._data)
+        return self._fromarray(self.mesh, res_array)
 
     def __rmul__(self, other):
         return self * other
@@ -1275,7 +1956,7 @@ class Field:
         2. Divide vector field by a scalar.
 
         >>> f1 = df.Field(mesh, dim=3, value=(0, 10, 5))
-        >>> res = f1 / 5  # discretisedfield.Field.__mul__ is called
+        >>> res = f1 / 5
         >>> res.average
         (0.0, 2.0, 1.0)
         >>> 10 / f1  # division by a vector is not allowed
@@ -1286,10 +1967,255 @@ class Field:
         .. seealso:: :py:func:`~discretisedfield.Field.__mul__`
 
         """
-        return self * other**(-1)
+        if isinstance(other, df.Expression):
+            return NotImplemented  # deferred evaluation
+        # Values are divided directly, without computing the reciprocal field
+        # first.
+        if isinstance(other, self.__class__):
+            if other.dim != 1:
+                msg = (f'Cannot apply operator / on {self.dim=} '
+                       f'and {other.dim=} fields.')
+                raise ValueError(msg)
+            if self.mesh != other.mesh:
+                msg = ('Cannot apply operator / on fields '
+                       'defined on different meshes.')
+                raise ValueError(msg)
+            return self._fromarray(self.mesh,
+                                   np.divide(self._data, other._data))
+        elif isinstance(other, numbers.Real):
+            return self._fromarray(self.mesh, np.divide(self._data, other))
+        else:
+            msg = (f'Unsupported operand type(s) for /: '
+                   f'{type(self)=} and {type(other)=}.')
+            raise TypeError(msg)
 
     def __rtruediv__(self, other):
-        return self**(-1) * other
+        if self.dim != 1:
+            msg = f'Cannot apply operator / on {self.dim=} field.'
+            raise ValueError(msg)
+
+        if isinstance(other, numbers.Real):
+            return self._fromarray(self.mesh, np.divide(other, self._data))
+        elif isinstance(other, (tuple, list, np.ndarray)):
+            return self.__class__(self.mesh, dim=3, value=other) / self
+        else:
+            msg = (f'Unsupported operand type(s) for /: '
+                   f'{type(other)=} and {type(self)=}.')
+            raise TypeError(msg)
+
+    def __iadd__(self, other):
+        """In-place ``+=`` operator.
+
+        The second operand is added to the field values without allocating a
+        new array. The same operands as for the binary ``+`` operator are
+        allowed.
+
+        Parameters
+        ----------
+        other : discretisedfield.Field, numbers.Real, tuple, list, np.ndarray
+
+            Second operand.
+
+        Returns
+        -------
+        discretisedfield.Field
+
+            The field itself.
+
+        Raises
+        ------
+        ValueError, TypeError
+
+            If the operator cannot be applied.
+
+        Example
+        -------
+        1. Add to a vector field in place.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(5, 5, 5), cell=(1, 1, 1))
+        >>> f = df.Field(mesh, dim=3, value=(0, 1, 2))
+        >>> array = f.array
+        >>> f += (1, 1, 1)
+        >>> f.average
+        (1.0, 2.0, 3.0)
+        >>> f.array is array
+        True
+
+        .. seealso:: :py:func:`~discretisedfield.Field.__add__`
+
+        """
+        return self._inplace(other, '+')
+
+    def __isub__(self, other):
+        """In-place ``-=`` operator.
+
+        The second operand is subtracted from the field values without
+        allocating a new array. The same operands as for the binary ``-``
+        operator are allowed.
+
+        Parameters
+        ----------
+        other : discretisedfield.Field, numbers.Real, tuple, list, np.ndarray
+
+            Second operand.
+
+        Returns
+        -------
+        discretisedfield.Field
+
+            The field itself.
+
+        Raises
+        ------
+        ValueError, TypeError
+
+            If the operator cannot be applied.
+
+        Example
+        -------
+        1. Subtract a field in place.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(5, 5, 5), cell=(1, 1, 1))
+        >>> f1 = df.Field(mesh, dim=1, value=5)
+        >>> f2 = df.Field(mesh, dim=1, value=2)
+        >>> f1 -= f2
+        >>> f1.average
+        3.0
+
+        .. seealso:: :py:func:`~discretisedfield.Field.__sub__`
+
+        """
+        return self._inplace(other, '-')
+
+    def __imul__(self, other):
+        """In-place ``*=`` operator.
+
+        The field values are multiplied by the second operand without
+        allocating a new array. The second operand can be ``numbers.Real``, a
+        scalar (``dim=1``) field, or an "abstract" integration variable (e.g.
+        ``df.dV``) which evaluates to a number or a scalar field, so that the
+        dimension of the field does not change.
+
+        Parameters
+        ----------
+        other : discretisedfield.Field, numbers.Real, discretisedfield.DValue
+
+            Second operand.
+
+        Returns
+        -------
+        discretisedfield.Field
+
+            The field itself.
+
+        Raises
+        ------
+        ValueError, TypeError
+
+            If the operator cannot be applied.
+
+        Example
+        -------
+        1. Scale a vector field in place.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(5, 5, 5), cell=(1, 1, 1))
+        >>> f = df.Field(mesh, dim=3, value=(0, 1, 2))
+        >>> f *= 2
+        >>> f.average
+        (0.0, 2.0, 4.0)
+        >>> f *= df.Field(mesh, dim=1, value=0.5)
+        >>> f.average
+        (0.0, 1.0, 2.0)
+
+        .. seealso:: :py:func:`~discretisedfield.Field.__mul__`
+
+        """
+        return self._inplace(other, '*')
+
+    def __itruediv__(self, other):
+        """In-place ``/=`` operator.
+
+        The field values are divided by the second operand without
+        allocating a new array. The second operand can be ``numbers.Real`` or
+        a scalar (``dim=1``) field.
+
+        Parameters
+        ----------
+        other : discretisedfield.Field, numbers.Real
+
+            Second operand.
+
+        Returns
+        -------
+        discretisedfield.Field
+
+            The field itself.
+
+        Raises
+        ------
+        ValueError, TypeError
+
+            If the operator cannot be applied.
+
+        Example
+        -------
+        1. Divide a vector field in place.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(5, 5, 5), cell=(1, 1, 1))
+        >>> f = df.Field(mesh, dim=3, value=(0, 2, 4))
+        >>> f /= 2
+        >>> f.average
+        (0.0, 1.0, 2.0)
+
+        .. seealso:: :py:func:`~discretisedfield.Field.__truediv__`
+
+        """
+        return self._inplace(other, '/')
+
+    def _inplace(self, other, operator):
+        # Apply binary operator (+, -, *, or /) with the result written to the
+        # array of the field. The dimension of the field cannot change.
+        if operator == '*' and isinstance(other, df.DValue):
+            other = other(self)
+
+        if isinstance(other, self.__class__):
+            if (other.dim != self.dim if operator in '+-' else other.dim != 1):
+                msg = (f'Cannot apply operator {operator}= on {self.dim=} '
+                       f'and {other.dim=} fields.')
+                raise ValueError(msg)
+            if self.mesh != other.mesh:
+                msg = (f'Cannot apply operator {operator}= on fields '
+                       'defined on different meshes.')
+                raise ValueError(msg)
+            other = other._data
+        elif isinstance(other, numbers.Real):
+            if operator in '+-' and self.dim != 1:
+                msg = (f'Unsupported operand type(s) for {operator}=: '
+                       f'{type(self)=} and {type(other)=}.')
+                raise TypeError(msg)
+        elif (operator in '+-' and self.dim == 3 and
+              isinstance(other, (tuple, list, np.ndarray))):
+            other = np.asarray(other)
+        else:
+            msg = (f'Unsupported operand type(s) for {operator}=: '
+                   f'{type(self)=} and {type(other)=}.')
+            raise TypeError(msg)
+
+        ufunc = {'+': np.add, '-': np.subtract,
+                 '*': np.multiply, '/': np.divide}[operator]
+        array = self.array
+        ufunc(array, other, out=array)
+        self._value = array  # the representation is not valid anymore
+        self._changed()
+        return self
 
     def __matmul__(self, other):
         """Binary ``@`` operator, defined as dot product.
@@ -1331,6 +2257,61 @@ class Field:
         >>> (f1@f2).average
         5.0
 
+        """
+        if isinstance(other, df.Expression):
+            return NotImplemented  # deferred evaluation
+        return self.dot(other)
+
+    def __rmatmul__(self, other):
+        return self @ other
+
+    def dot(self, other, /, out=None):
+        """Dot product.
+
+        This method computes the same dot product as the ``@`` operator. If
+        ``out`` is passed, the result is written to the array of that field and
+        no new array is allocated.
+
+        Parameters
+        ----------
+        other : discretisedfield.Field, tuple, list, numpy.ndarray
+
+            Second operand.
+
+        out : discretisedfield.Field, optional
+
+            Scalar field defined on the same mesh, to which the result is
+            written. Defaults to ``None``.
+
+        Returns
+        -------
+        discretisedfield.Field
+
+            Resulting field (``out`` if passed).
+
+        Raises
+        ------
+        ValueError, TypeError
+
+            If the dot product cannot be computed or ``out`` is not valid.
+
+        Example
+        -------
+        1. Compute the dot product into an existing field.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(5, 5, 5), cell=(1, 1, 1))
+        >>> f1 = df.Field(mesh, dim=3, value=(1, 3, 6))
+        >>> f2 = df.Field(mesh, dim=3, value=(-1, -2, 2))
+        >>> res = df.Field(mesh, dim=1)
+        >>> f1.dot(f2, out=res) is res
+        True
+        >>> res.average
+        5.0
+
+        .. seealso:: :py:func:`~discretisedfield.Field.__matmul__`
+
         """
         if isinstance(other, self.__class__):
             if self.mesh != other.mesh:
@@ -1342,19 +2323,24 @@ class Field:
                        f'and {other.dim=} fields.')
                 raise ValueError(msg)
         elif isinstance(other, (tuple, list, np.ndarray)):
-            return self @ self.__class__(self.mesh, dim=3, value=other)
+            return self.dot(self.__class__(self.mesh, dim=3, value=other),
+                            out=out)
         elif isinstance(other, df.DValue):
-            return self @ other(self)
+            return self.dot(other(self), out=out)
         else:
             msg = (f'Unsupported operand type(s) for @: '
                    f'{type(self)=} and {type(other)=}.')
             raise TypeError(msg)
 
-        res_array = np.einsum('ijkl,ijkl->ijk', self.array, other.array)
-        return df.Field(self.mesh, dim=1, value=res_array[..., np.newaxis])
+        if out is None:
+            res_array = np.einsum('ijkl,ijkl->ijk', self._data, other._data)
+            return self._fromarray(self.mesh, res_array[..., np.newaxis])
 
-    def __rmatmul__(self, other):
-        return self @ other
+        self._check_out(out, dim=1)
+        np.einsum('ijkl,ijkl->ijk', self._data, other._data,
+                  out=out.array[..., 0])
+        out._value = out.array
+        return out
 
     def __and__(self, other):
         """Binary ``&`` operator, defined as cross product.
@@ -1398,6 +2384,61 @@ class Field:
         >>> (f1 & (0, 0, 1)).average
         (0.0, -1.0, 0.0)
 
+        """
+        if isinstance(other, df.Expression):
+            return NotImplemented  # deferred evaluation
+        return self.cross(other)
+
+    def __rand__(self, other):
+        return self & other
+
+    def cross(self, other, /, out=None):
+        """Cross product.
+
+        This method computes the same cross product as the ``&`` operator. If
+        ``out`` is passed, the result is written to the array of that field.
+        Only one temporary component array is allocated in that case.
+
+        Parameters
+        ----------
+        other : discretisedfield.Field, tuple, list, numpy.ndarray
+
+            Second operand.
+
+        out : discretisedfield.Field, optional
+
+            Vector field defined on the same mesh, to which the result is
+            written. It can be one of the operands. Defaults to ``None``.
+
+        Returns
+        -------
+        discretisedfield.Field
+
+            Resulting field (``out`` if passed).
+
+        Raises
+        ------
+        ValueError, TypeError
+
+            If the cross product cannot be computed or ``out`` is not valid.
+
+        Example
+        -------
+        1. Compute the cross product into an existing field.
+
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(5, 5, 5), cell=(1, 1, 1))
+        >>> f1 = df.Field(mesh, dim=3, value=(1, 0, 0))
+        >>> f2 = df.Field(mesh, dim=3, value=(0, 1, 0))
+        >>> res = df.Field(mesh, dim=3)
+        >>> f1.cross(f2, out=res) is res
+        True
+        >>> res.average
+        (0.0, 0.0, 1.0)
+
+        .. seealso:: :py:func:`~discretisedfield.Field.__and__`
+
         """
         if isinstance(other, self.__class__):
             if self.mesh != other.mesh:
@@ -1409,17 +2450,29 @@ class Field:
                        f'and {other.dim=} fields.')
                 raise ValueError(msg)
         elif isinstance(other, (tuple, list, np.ndarray)):
-            return self & self.__class__(self.mesh, dim=3, value=other)
+            return self.cross(self.__class__(self.mesh, dim=3, value=other),
+                              out=out)
         else:
             msg = (f'Unsupported operand type(s) for &: '
                    f'{type(self)=} and {type(other)=}.')
             raise TypeError(msg)
 
-        res_array = np.cross(self.array, other.array)
-        return self.__class__(self.mesh, dim=3, value=res_array)
+        if out is None:
+            res_array = np.cross(self._data, other._data)
+            return self._fromarray(self.mesh, res_array)
 
-    def __rand__(self, other):
-        return self & other
+        self._check_out(out, dim=3)
+        a, b, res = self._data, other._data, out.array
+        if np.may_share_memory(res, a) or np.may_share_memory(res, b):
+            res[...] = np.cross(a, b)
+        else:
+            tmp = np.empty(self.mesh.n)
+            for i, j, k in [(0, 1, 2), (1, 2, 0), (2, 0, 1)]:
+                np.multiply(a[..., j], b[..., k], out=res[..., i])
+                np.multiply(a[..., k], b[..., j], out=tmp)
+                res[..., i] -= tmp
+        out._value = res
+        return out
 
     def __lshift__(self, other):
         """Stacks multiple scalar fields in a single vector field.
@@ -1492,10 +2545,9 @@ class Field:
                    f'{type(self)=} and {type(other)=}.')
             raise TypeError(msg)
 
-        array_list = [self.array[..., i] for i in range(self.dim)]
-        array_list += [other.array[..., i] for i in range(other.dim)]
-        return self.__class__(self.mesh, dim=len(array_list),
-                              value=np.stack(array_list, axis=3))
+        array_list = [self._data[..., i] for i in range(self.dim)]
+        array_list += [other._data[..., i] for i in range(other.dim)]
+        return self._fromarray(self.mesh, np.stack(array_list, axis=3))
 
     def __rlshift__(self, other):
         if isinstance(other, numbers.Real):
@@ -1564,15 +2616,15 @@ class Field:
         d = {}
         for key, value in pad_width.items():
             d[dfu.axesdict[key]] = value
-        padding_sequence = dfu.assemble_index((0, 0), len(self.array.shape), d)
+        padding_sequence = dfu.assemble_index((0, 0), len(self._data.shape), d)
 
-        padded_array = np.pad(self.array, padding_sequence,
+        padded_array = np.pad(self._data, padding_sequence,
                               mode=mode, **kwargs)
         padded_mesh = self.mesh.pad(pad_width)
 
-        return self.__class__(padded_mesh, dim=self.dim, value=padded_array)
+        return self._fromarray(padded_mesh, padded_array)
 
-    def derivative(self, direction, n=1):
+    def derivative(self, direction, n=1, accuracy=2):
         """Directional derivative.
 
         This method computes a directional derivative of the field and returns
@@ -1590,8 +2642,16 @@ class Field:
         the boundary are different for periodic, Neumann, or no boundary
         conditions. For details on boundary conditions, please refer to the
         ``disretisedfield.Mesh`` class. The derivatives are computed using
-        central differences inside the sample and using forward/backward
-        differences at the boundaries.
+        central differences of order ``accuracy`` (with 3, 5, or 7-point
+        stencils). Higher orders are more accurate for smooth fields, so that
+        the same error can be reached with coarser meshes. For periodic
+        boundary conditions, the stencils wrap around the mesh. For Neumann
+        boundary conditions, the field is mirrored at the boundary (zero
+        normal derivative at the face of the boundary cell). Without boundary
+        conditions, off-centred stencils with ``accuracy + n - 1`` points,
+        which are one order less accurate, are used in the cells where the
+        central stencil does not fit (forward/backward differences at the
+        boundaries for ``accuracy=2``).
 
         Parameters
         ----------
@@ -1604,6 +2664,11 @@ class Field:
 
             The order of the derivative. It can be 1 or 2 and it defaults to 1.
 
+        accuracy : int
+
+            The order of accuracy of central differences. It can be 2, 4, or 6
+            and it defaults to 2.
+
         Returns
         -------
         discretisedfield.Field
@@ -1616,6 +2681,10 @@ class Field:
 
             If order ``n`` higher than 2 is asked for.
 
+        ValueError
+
+            If ``accuracy`` is not 2, 4, or 6.
+
         Example
         -------
         1. Compute the first-order directional derivative of a scalar field in
@@ -1661,68 +2730,165 @@ class Field:
         (0.0, 0.0, 0.0)
         >>> # second-order derivatives
 
+        3. Compute the derivative of a periodic field with a higher-order
+        accuracy.
+
+        >>> import numpy as np
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(2*np.pi, 1, 1), n=(16, 1, 1),
+        ...                bc='x')
+        >>> f = df.Field(mesh, dim=1, value=lambda point: np.sin(point[0]))
+        >>> exact = df.Field(mesh, dim=1, value=lambda point: np.cos(point[0]))
+        >>> for accuracy in [2, 4, 6]:
+        ...     derivative = f.derivative('x', accuracy=accuracy)
+        ...     error = abs(derivative.array - exact.array).max()
+        ...     print(f'{accuracy=}: {error:.0e}')
+        accuracy=2: 3e-02
+        accuracy=4: 8e-04
+        accuracy=6: 2e-05
+
         """
         direction = dfu.axesdict[direction]
 
+        if n not in (1, 2):
+            msg = f'Derivative of the n={n} order is not implemented.'
+            raise NotImplementedError(msg)
+
+        if accuracy not in (2, 4, 6):
+            msg = f'Accuracy {accuracy=} is not supported.'
+            raise ValueError(msg)
+
+        key = ('derivative', direction, n, accuracy)
+        res = self._cache_get(key)
+        if res is not None:
+            return res
+
         # If there are no neighbouring cells in the specified direction, zero
         # field is returned.
         if self.mesh.n[direction] == 1:
-            return self.zero
-
-        # Preparation (padding) for computing the derivative, depending on the
-        # boundary conditions (PBC, Neumann, or no BC). Depending on the BC,
-        # the field array is padded.
-        if dfu.raxesdict[direction] in self.mesh.bc:  # PBC
-            pad_width = {dfu.raxesdict[direction]: (1, 1)}
-            padding_mode = 'wrap'
-        elif self.mesh.bc == 'neumann':
-            pad_width = {dfu.raxesdict[direction]: (1, 1)}
-            padding_mode = 'edge'
-        else:  # No BC - no padding
-            pad_width = {}
-            padding_mode = 'constant'
+            return self._cache_put(key, self.zero)
 
-        padded_array = self.pad(pad_width, mode=padding_mode).array
+        derivative_array = np.empty(self._data.shape)
+        self._derivative(self._data, direction, n, accuracy,
+                         out=derivative_array)
 
-        if n not in (1, 2):
-            msg = f'Derivative of the n={n} order is not implemented.'
-            raise NotImplementedError(msg)
+        return self._cache_put(key, self._fromarray(self.mesh,
+                                                    derivative_array))
 
-        elif n == 1:
-            if self.dim == 1:
-                derivative_array = np.gradient(padded_array[..., 0],
-                                               self.mesh.cell[direction],
-                                               axis=direction)[..., np.newaxis]
+    def _ghost(self, direction):
+        # Ghost cells depending on the boundary conditions (PBC, Neumann, or
+        # no BC). Index j of a cell outside the mesh is mapped to the cell
+        # inside the mesh it takes the value from. None is returned if there
+        # are no BCs in direction.
+        n_cells = self.mesh.n[direction]
+        if dfu.raxesdict[direction] in self.mesh.bc:  # PBC
+            def ghost(j):
+                return j % n_cells
+        elif self.mesh.bc == 'neumann':
+            def ghost(j):
+                j %= 2*n_cells
+                return j if j < n_cells else 2*n_cells - 1 - j
+        else:  # No BC
+            ghost = None
+
+        return ghost
+
+    def _derivative(self, array, direction, n, accuracy, out, pad=0):
+        # Directional derivative of array (with any number of components)
+        # defined on self.mesh, written to out. Refer to derivative. If pad
+        # is positive, array is padded with pad filled ghost layers on both
+        # sides in direction (refer to _padded_view). Arguments are not
+        # checked.
+        n_cells = self.mesh.n[direction]
+        ghost = self._ghost(direction)
+
+        # Derivative cannot be computed.
+        if n_cells == 1 or ghost is None and n_cells <= n:
+            out[...] = 0
+            return
+
+        h = self.mesh.cell[direction]
+        width = accuracy // 2
+        central = tuple(range(-width, width+1))
+        halo = self.halo
+
+        def layers(array, start, stop):
+            index = dfu.assemble_index(slice(None), 4,
+                                       {direction: slice(start, stop)})
+            return array[index]
+
+        def stencil(array, offsets, start, res):
+            # Apply the stencil to layers start, start+1, ... of array and
+            # write the result to res.
+            weights, d = dfu.fd_weights(offsets, n)
+            count = res.shape[direction]
+            terms = [(layers(array, start+offset, start+offset+count), weight)
+                     for offset, weight in sorted(zip(offsets, weights),
+                                                  reverse=True)
+                     if weight != 0]
+
+            # The first two terms are combined in one operation.
+            (values0, weight0), (values1, weight1) = terms[:2]
+            if weight0 == 1 and weight1 in (1, -1):
+                operation = np.add if weight1 == 1 else np.subtract
+                operation(values0, values1, out=res)
             else:
-                derivative_array = np.gradient(padded_array,
-                                               self.mesh.cell[direction],
-                                               axis=direction)
-
-        elif n == 2:
-            derivative_array = np.zeros_like(padded_array)
-            for i in range(padded_array.shape[direction]):
-                if i == 0:
-                    i1, i2, i3 = i+2, i+1, i
-                elif i == padded_array.shape[direction] - 1:
-                    i1, i2, i3 = i, i-1, i-2
+                np.multiply(values1, weight1, out=res)
+                if weight0 == 1:
+                    np.add(values0, res, out=res)
+                else:
+                    np.add(values0 * weight0, res, out=res)
+
+            tmp = None
+            for values, weight in terms[2:]:
+                if weight == 1:
+                    np.add(res, values, out=res)
+                elif weight == -1:
+                    np.subtract(res, values, out=res)
                 else:
-                    i1, i2, i3 = i+1, i, i-1
-                index1 = dfu.assemble_index(slice(None), 4, {direction: i1})
-                index2 = dfu.assemble_index(slice(None), 4, {direction: i2})
-                index3 = dfu.assemble_index(slice(None), 4, {direction: i3})
-                index = dfu.assemble_index(slice(None), 4, {direction: i})
-                derivative_array[index] = ((padded_array[index1] -
-                                           2*padded_array[index2] +
-                                           padded_array[index3]) /
-                                           self.mesh.cell[direction]**2)
-
-        # Remove padded values (if any).
-        if derivative_array.shape != self.array.shape:
-            derivative_array = np.delete(derivative_array,
-                                         (0, self.mesh.n[direction]+1),
-                                         axis=direction)
-
-        return self.__class__(self.mesh, dim=self.dim, value=derivative_array)
+                    if tmp is None:
+                        tmp = np.empty_like(res)
+                    np.multiply(values, weight, out=tmp)
+                    np.add(res, tmp, out=res)
+            np.divide(res, d * h**n, out=res)
+
+        if ghost is not None and halo >= width and array is self._array:
+            # Refresh the ghost layers of the halo buffer in the direction of
+            # the derivative (inside the mesh in other directions).
+            array = self._halo_array[dfu.assemble_index(
+                slice(halo, -halo), 3, {direction: slice(None)})]
+            for j in [*range(-width, 0), *range(n_cells, n_cells+width)]:
+                layers(array, halo+j, halo+j+1)[...] = layers(
+                    array, halo+ghost(j), halo+ghost(j)+1)
+            pad = halo
+
+        if ghost is not None and pad >= width:
+            # Central stencil applied to all cells at once.
+            stencil(array, central, pad, out)
+            return
+
+        if n_cells > 2*width:
+            # Central stencil in the inner cells.
+            stencil(array, central, width,
+                    layers(out, width, n_cells-width))
+            edges = [(0, width), (n_cells-width, n_cells)]
+        else:
+            edges = [(0, n_cells)]
+
+        for start, stop in edges:
+            if ghost is not None:
+                # Central stencil on the boundary layers with ghost cells.
+                index = dfu.assemble_index(slice(None), 4, {
+                    direction: [ghost(j)
+                                for j in range(start-width, stop+width)]})
+                stencil(array[index], central, width,
+                        layers(out, start, stop))
+            else:
+                # Off-centred stencils inside the mesh.
+                m = min(accuracy + n - 1, n_cells)
+                for i in range(start, stop):
+                    lowest = min(max(i - m//2, 0), n_cells - m)
+                    offsets = tuple(range(lowest - i, lowest - i + m))
+                    stencil(array, offsets, i, layers(out, i, i+1))
 
     @property
     def grad(self):
@@ -1796,9 +2962,14 @@ class Field:
             msg = f'Cannot compute gradient for dim={self.dim} field.'
             raise ValueError(msg)
 
-        return (self.derivative('x') <<
-                self.derivative('y') <<
-                self.derivative('z'))
+        # All derivatives are written to the resulting array directly.
+        buffer, pad = self._padded()
+        res_array = np.empty((*self.mesh.n, 3))
+        for i in range(3):
+            self._derivative(self._padded_view(buffer, pad, i), i, 1, 2,
+                             out=res_array[..., i:i+1], pad=pad)
+
+        return self._fromarray(self.mesh, res_array)
 
     @property
     def div(self):
@@ -1867,9 +3038,18 @@ class Field:
             msg = f'Cannot compute divergence for dim={self.dim} field.'
             raise ValueError(msg)
 
-        return (self.x.derivative('x') +
-                self.y.derivative('y') +
-                self.z.derivative('z'))
+        # Derivatives are computed from views of the components (which are
+        # read only once) and summed in place.
+        buffer, pad = self._padded()
+        res_array = np.empty((*self.mesh.n, 1))
+        tmp = np.empty_like(res_array)
+        for i in range(3):
+            self._derivative(self._padded_view(buffer[..., i:i+1], pad, i), i,
+                             1, 2, out=res_array if i == 0 else tmp, pad=pad)
+            if i > 0:
+                res_array += tmp
+
+        return self._fromarray(self.mesh, res_array)
 
     @property
     def curl(self):
@@ -1940,11 +3120,58 @@ class Field:
             msg = f'Cannot compute curl for dim={self.dim} field.'
             raise ValueError(msg)
 
-        curl_x = self.z.derivative('y') - self.y.derivative('z')
-        curl_y = self.x.derivative('z') - self.z.derivative('x')
-        curl_z = self.y.derivative('x') - self.x.derivative('y')
-
-        return curl_x << curl_y << curl_z
+        # Component i of the curl is d(v_b)/da - d(v_a)/db with a = i+1 and
+        # b = i+2 (cyclic). Derivatives are computed from views of the
+        # components and the result is assembled from contiguous components.
+        buffer, pad = self._padded()
+        res_components = np.empty((3, *self.mesh.n, 1))
+        tmp = np.empty_like(res_components[0])
+        for i in range(3):
+            a, b = (i + 1) % 3, (i + 2) % 3
+            self._derivative(self._padded_view(buffer[..., b:b+1], pad, a), a,
+                             1, 2, out=res_components[i], pad=pad)
+            self._derivative(self._padded_view(buffer[..., a:a+1], pad, b), b,
+                             1, 2, out=tmp, pad=pad)
+            res_components[i] -= tmp
+
+        res_array = np.moveaxis(res_components[..., 0], 0, -1).copy()
+        return self._fromarray(self.mesh, res_array)
+
+    def _padded(self):
+        # Field array for differential operators and its padding. If the
+        # field has a halo, the ghost layers adjacent to the mesh are
+        # refreshed once in all directions with BCs and the halo buffer is
+        # returned, so that central stencils in all directions are applied to
+        # views of it (refer to _padded_view). Otherwise, the field array is
+        # returned with pad=0 and _derivative gathers the boundary layers with
+        # ghost cells (building a padded copy of the whole field costs more
+        # than gathering the boundary layers).
+        ghosts = [self._ghost(direction) for direction in range(3)]
+        if not self.halo or all(ghost is None for ghost in ghosts):
+            return self._data, 0
+
+        pad, buffer = self.halo, self._halo_array
+        for direction, ghost in enumerate(ghosts):
+            if ghost is None:
+                continue
+            n_cells = self.mesh.n[direction]
+            for j in [-1, n_cells]:
+                dst, src = [dfu.assemble_index(slice(None), 4, {
+                    direction: slice(pad+k, pad+k+1)}) for k in (j, ghost(j))]
+                buffer[dst] = buffer[src]
+
+        return buffer, pad
+
+    def _padded_view(self, array, pad, direction):
+        # View of the padded array (refer to _padded) with the cells inside
+        # the mesh and, if there are BCs in direction, the ghost layers in
+        # direction.
+        if pad == 0:
+            return array
+        index = [slice(pad, -pad)] * 3 + [slice(None)]
+        if self._ghost(direction) is not None:
+            index[direction] = slice(None)
+        return array[tuple(index)]
 
     @property
     def laplace(self):
@@ -2006,12 +3233,17 @@ class Field:
         .. seealso:: :py:func:`~discretisedfield.Field.derivative`
 
         """
-        if self.dim == 1:
-            return (self.derivative('x', n=2) +
-                    self.derivative('y', n=2) +
-                    self.derivative('z', n=2))
-        else:
-            return self.x.laplace << self.y.laplace << self.z.laplace
+        # Second derivatives of all components at once, summed in place.
+        buffer, pad = self._padded()
+        res_array = np.empty(self._data.shape)
+        tmp = np.empty_like(res_array)
+        for i in range(3):
+            self._derivative(self._padded_view(buffer, pad, i), i, 2, 2,
+                             out=res_array if i == 0 else tmp, pad=pad)
+            if i > 0:
+                res_array += tmp
+
+        return self._fromarray(self.mesh, res_array)
 
     def integral(self, direction='xyz', improper=False):
         """Integral.
@@ -2135,19 +3367,27 @@ class Field:
         if not improper:
             for i in direction:
                 mesh = mesh.plane(i)
-            axes = [dfu.axesdict[i] for i in direction]
-            res_array = np.sum(self.array, axis=tuple(axes), keepdims=True)
+            axes = tuple(dfu.axesdict[i] for i in direction)
+            if self.lazy:
+                sums = (np.sum(slab, axis=axes, keepdims=True)
+                        for slab in self._slabs())
+                if dfu.axesdict['z'] in axes:
+                    res_array = sum(sums)
+                else:
+                    res_array = np.concatenate(list(sums), axis=2)
+            else:
+                res_array = np.sum(self._data, axis=axes, keepdims=True)
         else:
-            res_array = np.cumsum(self.array, axis=dfu.axesdict[direction])
+            res_array = np.cumsum(self._data, axis=dfu.axesdict[direction])
 
-        res = self.__class__(mesh, dim=self.dim, value=res_array)
+        res = self._fromarray(mesh, res_array)
 
         if len(direction) == 3:
             return dfu.array2tuple(res.array.squeeze())
         else:
             return res
 
-    def line(self, p1, p2, n=100):
+    def line(self, p1, p2, n=100, interpolation='nearest'):
         """Sampling the field along the line.
 
         Given two points :math:`p_{1}` and :math:`p_{2}`, :math:`n` position
@@ -2168,6 +3408,11 @@ class Field:
 
             Number of points on the line. Defaults to 100.
 
+        interpolation : str, optional
+
+            Interpolation method used to sample the field: ``'nearest'``,
+            ``'linear'``, or ``'cubic'``. Defaults to ``'nearest'``.
+
         Returns
         -------
         discretisedfield.Line
@@ -2194,13 +3439,17 @@ class Field:
         ...
         >>> line = field.line(p1=(0, 0, 0), p2=(2, 0, 0), n=5)
 
+        .. seealso:: :py:func:`~discretisedfield.Field.sample`
+
         """
         points = list(self.mesh.line(p1=p1, p2=p2, n=n))
-        values = [self(p) for p in points]
+        values = self.sample(points, interpolation=interpolation)
+        if self.dim == 1:
+            values = values[..., 0]
 
         return df.Line(points=points, values=values)
 
-    def plane(self, *args, n=None, **kwargs):
+    def plane(self, *args, n=None, interpolation='nearest', **kwargs):
         """Extracts field on the plane mesh.
 
         If one of the axes (``'x'``, ``'y'``, or ``'z'``) is passed as a
@@ -2218,6 +3467,11 @@ class Field:
 
             The number of points on the plane in two dimensions.
 
+        interpolation : str, optional
+
+            Interpolation method used to sample the field: ``'nearest'``,
+            ``'linear'``, or ``'cubic'``. Defaults to ``'nearest'``.
+
         Returns
         ------
         discretisedfield.Field
@@ -2249,11 +3503,20 @@ class Field:
         >>> f.plane('z', n=(10, 10))
         Field(...)
 
+        4. Interpolating the field on a finer plane mesh.
+
+        >>> f.plane('z', n=(10, 10), interpolation='linear')
+        Field(...)
+
         .. seealso:: :py:func:`~discretisedfield.Mesh.plane`
 
         """
         plane_mesh = self.mesh.plane(*args, n=n, **kwargs)
-        return self.__class__(plane_mesh, dim=self.dim, value=self)
+        points = np.stack(np.broadcast_arrays(*plane_mesh.meshgrid), axis=-1)
+        values = self.sample(points.reshape(-1, 3),
+                             interpolation=interpolation)
+        value = values.reshape((*plane_mesh.n, self.dim))
+        return self._fromarray(plane_mesh, value)
 
     def __getitem__(self, item):
         """Extracts the field on a subregion.
@@ -2330,8 +3593,7 @@ class Field:
         index_min = self.mesh.point2index(submesh.index2point((0, 0, 0)))
         index_max = np.add(index_min, submesh.n)
         slices = [slice(i, j) for i, j in zip(index_min, index_max)]
-        return self.__class__(submesh, dim=self.dim,
-                              value=self.array[tuple(slices)])
+        return self._fromarray(submesh, self._read(tuple(slices)))
 
     def project(self, direction):
         """Projects the field along one direction and averages it out along
@@ -2421,20 +3683,26 @@ class Field:
             msg = 'The field must be sliced before angle can be computed.'
             raise ValueError(msg)
 
-        angle_array = np.arctan2(self.array[..., self.mesh.info['axis2']],
-                                 self.array[..., self.mesh.info['axis1']])
+        angle_array = np.arctan2(self._data[..., self.mesh.info['axis2']],
+                                 self._data[..., self.mesh.info['axis1']])
 
         # Place all values in [0, 2pi] range
         angle_array[angle_array < 0] += 2 * np.pi
 
-        return self.__class__(self.mesh, dim=1,
-                              value=angle_array[..., np.newaxis])
+        return self._fromarray(self.mesh, angle_array[..., np.newaxis])
 
-    def write(self, filename, representation='txt', extend_scalar=False):
+    def write(self, filename, representation='txt', extend_scalar=False,
+              compression=None, chunks=None, dtype=None):
         """Write the field to OVF, HDF5, or VTK file.
 
-        If the extension of ``filename`` is ``.vtk``, a VTK file is written
-        (:py:func:`~discretisedfield.Field._writevtk`).
+        If the extension of ``filename`` is ``.vtk``, a legacy VTK file is
+        written (:py:func:`~discretisedfield.Field._writevtk`) and the
+        representation of data (``'txt'`` or ``'bin'``) is passed as
+        ``representation``. If the extension is ``.vtr``, an XML VTK file is
+        written (:py:func:`~discretisedfield.Field._writevtr`). In that case,
+        the representation of data (``'txt'``, ``'bin'``, or ``'base64'``) is
+        passed as ``representation`` and binary data can be compressed by
+        passing ``compression='zlib'``.
 
         For ``.ovf``, ``.omf``, or ``.ohf`` extensions, the field is saved to
         OVF file (:py:func:`~discretisedfield.Field._writeovf`). In that case,
@@ -2443,8 +3711,10 @@ class Field:
         field will be saved as a vector field. More precisely, if the value at
         a cell is X, that cell will be saved as (X, 0, 0).
 
-        Finally, if the extension of ``filename`` is ``.hdf5``, HDF5 file will
-        be written (:py:func:`~discretisedfield.Field._writehdf5`).
+        Finally, if the extension of ``filename`` is ``.hdf5`` or ``.h5``, HDF5
+        file will be written (:py:func:`~discretisedfield.Field._writehdf5`).
+        In that case, the layout of the stored array can be tuned with
+        ``chunks``, ``compression`` (``'gzip'`` or ``'lzf'``), and ``dtype``.
 
         Parameters
         ----------
@@ -2456,7 +3726,8 @@ class Field:
 
             In the case of OVF files (``.ovf``, ``.omf``, or ``.ohf``),
             representation can be specified (``'bin4'``, ``'bin8'``, or
-            ``'txt'``). Defaults to ``'txt'``.
+            ``'txt'``). For VTK files, it is ``'txt'`` or ``'bin'`` (and
+            ``'base64'`` for ``.vtr``). Defaults to ``'txt'``.
 
         extend_scalar : bool, optional
 
@@ -2465,6 +3736,22 @@ class Field:
             (3, 0, 0). This is valid only for the OVF file formats. Defaults to
             ``False``.
 
+        compression : str, optional
+
+            Compression of binary data in ``.vtr`` files (``'zlib'``) or of
+            the array in HDF5 files (``'gzip'`` or ``'lzf'``). Defaults to
+            ``None``.
+
+        chunks : tuple, bool, optional
+
+            Chunk shape of the array in HDF5 files. Defaults to ``None`` and
+            chunks aligned with z-planes are used.
+
+        dtype : str, optional
+
+            Data type of the array in HDF5 files (e.g. ``'float32'``). Defaults
+            to ``None`` and the array is stored as ``float64``.
+
         Example
         -------
         1. Write field to the OVF file.
@@ -2495,7 +3782,15 @@ class Field:
         True
         >>> os.remove(filename)  # delete the file
 
-        3. Write field to the HDF5 file.
+        3. Write field to the compressed XML VTK file.
+
+        >>> filename = 'mytestfile.vtr'
+        >>> field.write(filename, representation='bin', compression='zlib')
+        >>> os.path.isfile(filename)
+        True
+        >>> os.remove(filename)  # delete the file
+
+        4. Write field to the HDF5 file.
 
         >>> filename = 'mytestfile.hdf5'
         >>> field.write(filename)  # write the file
@@ -2506,6 +3801,15 @@ class Field:
         True
         >>> os.remove(filename)  # delete the file
 
+        5. Write field to the compressed HDF5 file in single precision.
+
+        >>> filename = 'mytestfile.h5'
+        >>> field.write(filename, compression='gzip', dtype='float32')
+        >>> field_read = df.Field.fromfile(filename)  # read the file
+        >>> field_read == field
+        True
+        >>> os.remove(filename)  # delete the file
+
         .. seealso:: :py:func:`~discretisedfield.Field.fromfile`
 
         """
@@ -2513,9 +3817,13 @@ class Field:
             self._writeovf(filename, representation=representation,
                            extend_scalar=extend_scalar)
         elif any([filename.endswith(ext) for ext in ['.hdf5', '.h5']]):
-            self._writehdf5(filename)
+            self._writehdf5(filename, chunks=chunks, compression=compression,
+                            dtype=dtype)
         elif filename.endswith('.vtk'):
-            self._writevtk(filename)
+            self._writevtk(filename, representation=representation)
+        elif filename.endswith('.vtr'):
+            self._writevtr(filename, representation=representation,
+                           compression=compression)
         else:
             msg = (f'Writing file with extension {filename.split(".")[-1]} '
                    f'not supported.')
@@ -2570,118 +3878,25 @@ class Field:
         >>> os.remove(filename)  # delete the file
 
         .. seealso:: :py:func:`~discretisedfield.Field.fromfile`
+        .. seealso:: :py:func:`~discretisedfield.OVFWriter`
 
         """
-        if self.dim != 1 and self.dim != 3:
-            msg = (f'Cannot write dim={self.dim} field.')
-            raise TypeError(msg)
+        with df.OVFWriter(filename, self.mesh, dim=self.dim,
+                          representation=representation,
+                          extend_scalar=extend_scalar) as writer:
+            writer.write_slab(self._data)
 
-        if extend_scalar and self.dim == 1:
-            write_dim = 3
-        else:
-            write_dim = self.dim
-
-        header = ['OOMMF OVF 2.0',
-                  '',
-                  'Segment count: 1',
-                  '',
-                  'Begin: Segment',
-                  'Begin: Header',
-                  '',
-                  'Title: Field',
-                  'Desc: File generated by Field class',
-                  'meshunit: m',
-                  'meshtype: rectangular',
-                  f'xbase: {self.mesh.region.pmin[0] + self.mesh.cell[0]/2}',
-                  f'ybase: {self.mesh.region.pmin[1] + self.mesh.cell[1]/2}',
-                  f'zbase: {self.mesh.region.pmin[2] + self.mesh.cell[2]/2}',
-                  f'xnodes: {self.mesh.n[0]}',
-                  f'ynodes: {self.mesh.n[1]}',
-                  f'znodes: {self.mesh.n[2]}',
-                  f'xstepsize: {self.mesh.cell[0]}',
-                  f'ystepsize: {self.mesh.cell[1]}',
-                  f'zstepsize: {self.mesh.cell[2]}',
-                  f'xmin: {self.mesh.region.pmin[0]}',
-                  f'ymin: {self.mesh.region.pmin[1]}',
-                  f'zmin: {self.mesh.region.pmin[2]}',
-                  f'xmax: {self.mesh.region.pmax[0]}',
-                  f'ymax: {self.mesh.region.pmax[1]}',
-                  f'zmax: {self.mesh.region.pmax[2]}',
-                  f'valuedim: {write_dim}',
-                  f'valuelabels: field_x field_y field_z',
-                  'valueunits: None None None',
-                  '',
-                  'End: Header',
-                  '']
-
-        if representation == 'bin4':
-            header.append('Begin: Data Binary 4')
-            footer = ['End: Data Binary 4',
-                      'End: Segment']
-        elif representation == 'bin8':
-            header.append('Begin: Data Binary 8')
-            footer = ['End: Data Binary 8',
-                      'End: Segment']
-        elif representation == 'txt':
-            header.append('Begin: Data Text')
-            footer = ['End: Data Text',
-                      'End: Segment']
-
-        # Write header lines
-        with open(filename, 'w') as f:
-            f.write(''.join(map(lambda line: f'# {line}\n', header)))
-
-        binary_reps = {'bin4': (1234567.0, 'f'),
-                       'bin8': (123456789012345.0, 'd')}
-
-        # Write data.
-        if representation in binary_reps:
-            # Reopen with binary write, appending to the end of the file.
-            with open(filename, 'ab') as f:
-                # Add the binary checksum.
-                packarray = [binary_reps[representation][0]]
-
-                # Write data to the ovf file.
-                for point, value in self:
-                    if self.dim == 3:
-                        v = value
-                    else:
-                        if extend_scalar:
-                            v = [value, 0.0, 0.0]
-                        else:
-                            v = [value]
-                    for vi in v:
-                        packarray.append(vi)
-
-                format = binary_reps[representation][1]*len(packarray)
-                f.write(struct.pack(format, *packarray))
-        else:
-            # Reopen with txt representation, appending to the end of the file.
-            with open(filename, 'a') as f:
-                for point, value in self:
-                    if self.dim == 3:
-                        v = value
-                    else:
-                        if extend_scalar:
-                            v = [value, 0.0, 0.0]
-                        else:
-                            v = [value]
-                    for vi in v:
-                        f.write(f' {str(vi)}')
-                    f.write('\n')
-
-        # Write footer lines to OOMMF file.
-        with open(filename, 'a') as f:
-            f.write(''.join(map(lambda line: f'# {line}\n', footer)))
-
-    def _writevtk(self, filename):
+    def _writevtk(self, filename, representation='txt'):
         """Write the field to a VTK file.
 
         The data is saved as a ``RECTILINEAR_GRID`` dataset. Scalar field
         (``dim=1``) is saved as ``SCALARS``. On the other hand, vector field
-        (``dim=3``) is saved as both ``VECTORS`` as well as ``SCALARS`` for all
-        three components to enable easy colouring of vectors in some
-        visualisation packages.
+        (``dim=3``) is saved as ``VECTORS``. In ASCII files
+        (``representation='txt'``), vector fields are additionally saved as
+        ``SCALARS`` for all three components to enable easy colouring of
+        vectors in some visualisation packages. Binary files
+        (``representation='bin'``) are written directly from the array as
+        big-endian ``double`` values.
 
         The saved VTK file can be opened with `Paraview
         <https://www.paraview.org/>`_ or `Mayavi
@@ -2693,6 +3908,20 @@ class Field:
 
             File name with an extension.
 
+        representation : str, optional
+
+            Representation; ``'txt'`` or ``'bin'``. Defaults to ``'txt'``.
+
+        Raises
+        ------
+        TypeError
+
+            If the field is not scalar (``dim=1``) or vector (``dim=3``).
+
+        ValueError
+
+            If ``representation`` is not valid.
+
         Example
         -------
         1. Write field to a VTK file.
@@ -2713,40 +3942,245 @@ class Field:
         True
         >>> os.remove(filename)  # delete the file
 
+        2. Write field to a binary VTK file.
+
+        >>> field._writevtk(filename, representation='bin')
+        >>> os.path.isfile(filename)
+        True
+        >>> os.remove(filename)  # delete the file
+
+        .. seealso:: :py:func:`~discretisedfield.Field._writevtr`
+
         """
-        header = ['# vtk DataFile Version 3.0',
-                  'Field',
-                  'ASCII',
-                  'DATASET RECTILINEAR_GRID',
-                  'DIMENSIONS {} {} {}'.format(*self.mesh.n),
-                  f'X_COORDINATES {self.mesh.n[0]} float',
-                  ' '.join(map(str, self.mesh.axis_points('x'))),
-                  f'Y_COORDINATES {self.mesh.n[1]} float',
-                  ' '.join(map(str, self.mesh.axis_points('y'))),
-                  f'Z_COORDINATES {self.mesh.n[2]} float',
-                  ' '.join(map(str, self.mesh.axis_points('z'))),
-                  f'POINT_DATA {len(self.mesh)}']
+        if self.dim != 1 and self.dim != 3:
+            msg = (f'Cannot write dim={self.dim} field.')
+            raise TypeError(msg)
 
-        if self.dim == 1:
-            data = dfu.vtk_scalar_data(self, 'field')
-        elif self.dim == 3:
-            data = dfu.vtk_scalar_data(self.x, 'x-component')
-            data += dfu.vtk_scalar_data(self.y, 'y-component')
-            data += dfu.vtk_scalar_data(self.z, 'z-component')
-            data += dfu.vtk_vector_data(self, 'field')
+        if representation == 'txt':
+            header = ['# vtk DataFile Version 3.0',
+                      'Field',
+                      'ASCII',
+                      'DATASET RECTILINEAR_GRID',
+                      'DIMENSIONS {} {} {}'.format(*self.mesh.n),
+                      f'X_COORDINATES {self.mesh.n[0]} float',
+                      ' '.join(map(str, self.mesh.coordinates[0].tolist())),
+                      f'Y_COORDINATES {self.mesh.n[1]} float',
+                      ' '.join(map(str, self.mesh.coordinates[1].tolist())),
+                      f'Z_COORDINATES {self.mesh.n[2]} float',
+                      ' '.join(map(str, self.mesh.coordinates[2].tolist())),
+                      f'POINT_DATA {len(self.mesh)}']
+
+            if self.dim == 1:
+                data = dfu.vtk_scalar_data(self, 'field')
+            elif self.dim == 3:
+                data = dfu.vtk_scalar_data(self.x, 'x-component')
+                data += dfu.vtk_scalar_data(self.y, 'y-component')
+                data += dfu.vtk_scalar_data(self.z, 'z-component')
+                data += dfu.vtk_vector_data(self, 'field')
+
+            with open(filename, 'w') as f:
+                f.write('\n'.join(header+data))
+
+        elif representation == 'bin':
+            header = ['# vtk DataFile Version 3.0',
+                      'Field',
+                      'BINARY',
+                      'DATASET RECTILINEAR_GRID',
+                      'DIMENSIONS {} {} {}'.format(*self.mesh.n)]
+
+            # Legacy VTK binary data is big-endian.
+            with open(filename, 'wb') as f:
+                f.write(''.join(f'{line}\n' for line in header).encode())
+                for axis, coordinates in zip('XYZ', self.mesh.coordinates):
+                    f.write(f'{axis}_COORDINATES {coordinates.size} '
+                            'double\n'.encode())
+                    f.write(coordinates.astype('>f8').tobytes() + b'\n')
+
+                f.write(f'POINT_DATA {len(self.mesh)}\n'.encode())
+                if self.dim == 1:
+                    f.write(b'SCALARS field double\nLOOKUP_TABLE default\n')
+                else:
+                    f.write(b'VECTORS field double\n')
+
+                # VTK order: x index changes fastest, then y, and z slowest.
+                values = self._data.transpose(2, 1, 0, 3).astype('>f8')
+                f.write(values.tobytes() + b'\n')
+
+        else:
+            msg = f'Representation {representation=} is not supported.'
+            raise ValueError(msg)
+
+    def _writevtr(self, filename, representation='txt', compression=None):
+        """Write the field to an XML VTK (``.vtr``) file.
+
+        The data is saved as a ``RectilinearGrid`` dataset with point data
+        defined at the cell centres. Data is written as ASCII
+        (``representation='txt'``), as raw binary data appended at the end of
+        the file (``representation='bin'``), or as inline base64-encoded binary
+        data (``representation='base64'``). Binary data can be compressed by
+        passing ``compression='zlib'``. Binary data is written directly from
+        the array as little-endian ``Float64`` values.
+
+        The saved file can be opened with `Paraview
+        <https://www.paraview.org/>`_.
+
+        Parameters
+        ----------
+        filename : str
+
+            File name with an extension.
+
+        representation : str, optional
+
+            Representation; ``'txt'``, ``'bin'``, or ``'base64'``. Defaults to
+            ``'txt'``.
+
+        compression : str, optional
+
+            Compression of binary data (``'zlib'``). Defaults to ``None``.
+
+        Raises
+        ------
+        ValueError
+
+            If ``representation`` or ``compression`` is not valid, or if
+            compression is requested for ASCII data.
+
+        Example
+        -------
+        1. Write field to a VTR file.
+
+        >>> import os
+        >>> import discretisedfield as df
+        ...
+        >>> p1 = (0, 0, 0)
+        >>> p2 = (10e-9, 5e-9, 3e-9)
+        >>> n = (10, 5, 3)
+        >>> mesh = df.Mesh(p1=p1, p2=p2, n=n)
+        >>> value_fun = lambda point: (point[0], point[1], point[2])
+        >>> field = df.Field(mesh, dim=3, value=value_fun)
+        ...
+        >>> filename = 'mytestfile.vtr'
+        >>> field._writevtr(filename, representation='bin')  # write the file
+        >>> os.path.isfile(filename)
+        True
+        >>> os.remove(filename)  # delete the file
+
+        .. seealso:: :py:func:`~discretisedfield.Field._writevtk`
+
+        """
+        formats = {'txt': 'ascii', 'bin': 'appended', 'base64': 'binary'}
+        if representation not in formats:
+            msg = f'Representation {representation=} is not supported.'
+            raise ValueError(msg)
+
+        if representation == 'txt' and compression is not None:
+            msg = 'Compression is supported only for binary data.'
+            raise ValueError(msg)
+
+        appended = []  # raw data blocks appended at the end of the file
+
+        def data_array(name, array):
+            ncomponents = array.shape[-1] if array.ndim == 2 else 1
+            start = (f'<DataArray type="Float64" Name="{name}" '
+                     f'NumberOfComponents="{ncomponents}" '
+                     f'format="{formats[representation]}"')
 
-        with open(filename, 'w') as f:
-            f.write('\n'.join(header+data))
+            if representation == 'txt':
+                text = ' '.join(map(str, array.ravel().tolist()))
+                return [f'{start}>', text, '</DataArray>']
 
-    def _writehdf5(self, filename):
+            header, data = dfu.vtk_binary_block(array, compression)
+            if representation == 'base64':
+                # As in VTK, the header of compressed data is encoded
+                # separately.
+                if compression is None:
+                    text = base64.b64encode(header + data).decode()
+                else:
+                    text = (base64.b64encode(header) +
+                            base64.b64encode(data)).decode()
+                return [f'{start}>', text, '</DataArray>']
+            else:
+                offset = sum(map(len, appended))
+                appended.append(header + data)
+                return [f'{start} offset="{offset}"/>']
+
+        vtkfile = ('<VTKFile type="RectilinearGrid" version="1.0" '
+                   'byte_order="LittleEndian" header_type="UInt64"')
+        if compression is not None:
+            vtkfile += ' compressor="vtkZLibDataCompressor"'
+        extent = ' '.join(f'0 {n - 1}' for n in self.mesh.n)
+        attribute = 'Scalars' if self.dim == 1 else 'Vectors'
+
+        # VTK order: x index changes fastest, then y, and z slowest.
+        values = self._data.transpose(2, 1, 0, 3).reshape(-1, self.dim)
+
+        lines = ['<?xml version="1.0"?>',
+                 f'{vtkfile}>',
+                 f'<RectilinearGrid WholeExtent="{extent}">',
+                 f'<Piece Extent="{extent}">',
+                 f'<PointData {attribute}="field">',
+                 *data_array('field', values),
+                 '</PointData>',
+                 '<Coordinates>',
+                 *data_array('x', self.mesh.coordinates[0]),
+                 *data_array('y', self.mesh.coordinates[1]),
+                 *data_array('z', self.mesh.coordinates[2]),
+                 '</Coordinates>',
+                 '</Piece>',
+                 '</RectilinearGrid>']
+
+        with open(filename, 'wb') as f:
+            f.write(''.join(f'{line}\n' for line in lines).encode())
+            if appended:
+                f.write(b'<AppendedData encoding="raw">\n_')
+                for block in appended:
+                    f.write(block)
+                f.write(b'\n</AppendedData>\n')
+            f.write(b'</VTKFile>\n')
+
+    def _writehdf5(self, filename, chunks=None, compression=None,
+                   dtype=None):
         """Write the field to an HDF5 file.
 
+        The field array is stored as a chunked dataset. By default, every chunk
+        contains a single z-layer (split along x and y if it is larger than
+        1MB), so that reading a plane reads only the chunks it intersects. If
+        ``compression`` is passed, the shuffle filter is applied before
+        compression, which usually improves the compression ratio of
+        floating-point data considerably.
+
         Parameters
         ----------
         filename : str
 
             Name with an extension of the file written.
 
+        chunks : tuple, bool, optional
+
+            Chunk shape ``(cx, cy, cz, cdim)`` of the array dataset. If
+            ``True``, chunk shape is chosen by ``h5py``. If ``False``, the
+            array is stored contiguously, which is not allowed together with
+            compression. Defaults to ``None`` and chunks aligned with z-planes
+            are used.
+
+        compression : str, optional
+
+            Compression filter, ``'gzip'`` or ``'lzf'``. Defaults to ``None``.
+
+        dtype : str, optional
+
+            Data type of the array dataset (e.g. ``'float32'`` to halve the
+            size of the file). Defaults to ``None`` and the array is stored as
+            ``float64``.
+
+        Raises
+        ------
+        ValueError
+
+            If ``compression`` is not valid or if compression is requested for
+            a contiguous array.
+
         Example
         -------
         1. Write field to an HDF5 file.
@@ -2770,9 +4204,31 @@ class Field:
         True
         >>> os.remove(filename)  # delete the file
 
+        2. Write field to a compressed HDF5 file.
+
+        >>> field._writehdf5(filename, compression='lzf')
+        >>> field_read = df.Field.fromfile(filename)  # read the file
+        >>> field_read == field
+        True
+        >>> os.remove(filename)  # delete the file
+
         .. seealso:: :py:func:`~discretisedfield.Field.fromfile`
 
         """
+        if compression not in [None, 'gzip', 'lzf']:
+            msg = f'Compression {compression=} is not supported.'
+            raise ValueError(msg)
+
+        if chunks is False and compression is not None:
+            msg = 'Compressed array cannot be stored contiguously.'
+            raise ValueError(msg)
+
+        dtype = np.dtype(float if dtype is None else dtype)
+        if chunks is None:
+            chunks = dfu.hdf5_chunks(self._data.shape, dtype.itemsize)
+        elif chunks is False:
+            chunks = None  # contiguous dataset in h5py
+
         with h5py.File(filename, 'w') as f:
             # Set up the file structure
             gfield = f.create_group('field')
@@ -2784,17 +4240,28 @@ class Field:
             gregion.create_dataset('p2', data=self.mesh.region.p2)
             gmesh.create_dataset('n', dtype='i4', data=self.mesh.n)
             gfield.create_dataset('dim', dtype='i4', data=self.dim)
-            gfield.create_dataset('array', data=self.array)
+            gfield.create_dataset('array', data=self._data, dtype=dtype,
+                                  chunks=chunks, compression=compression,
+                                  shuffle=compression is not None)
 
     @classmethod
-    def fromfile(cls, filename):
+    def fromfile(cls, filename, mmap=False, lazy=False):
         """Read the field from an OVF (1.0 or 2.0), VTK, or HDF5 file.
 
         The extension of the ``filename`` should correspond to either:
             - OVF (``.ovf``, ``.omf``, ``.ohf``, ``.oef``)
-            - VTK (``.vtk``), or
+            - VTK (``.vtk`` or ``.vtr``), or
             - HDF5 (``.hdf5`` or ``.h5``).
 
+        For binary OVF files, ``mmap=True`` can be passed so that only the
+        file header is read and the data is memory-mapped. Only the parts of
+        the data which are accessed (e.g. by ``discretisedfield.Field.plane``
+        or ``discretisedfield.Field.__getitem__``) are then read from the
+        disk. For all other files, ``mmap`` is ignored. Similarly, for HDF5
+        files, ``lazy=True`` can be passed so that the field keeps a handle to
+        the dataset in the file and reads only the parts required (refer to
+        ``discretisedfield.Field.lazy``).
+
         This is a ``classmethod`` and should be called as, for instance,
         ``discretisedfield.Field.fromfile('myfile.omf')``.
 
@@ -2804,6 +4271,16 @@ class Field:
 
             Name of the file to be read.
 
+        mmap : bool, optional
+
+            If ``True``, the data of binary OVF files is memory-mapped.
+            Defaults to ``False``.
+
+        lazy : bool, optional
+
+            If ``True``, the data of HDF5 files is read lazily. Defaults to
+            ``False``.
+
         Returns
         -------
         discretisedfield.Field
@@ -2839,30 +4316,40 @@ class Field:
         Field(mesh=...)
 
         .. seealso:: :py:func:`~discretisedfield.Field._fromovf`
-        .. seealso:: :py:func:`~discretisedfield.Field._fromhdf5`
+        .. seealso:: :py:func:`~discretisedfield.Field._fromvtk`
+        .. seealso:: :py:func:`~discretisedfield.Field._fromvtr`
         .. seealso:: :py:func:`~discretisedfield.Field._fromhdf5`
         .. seealso:: :py:func:`~discretisedfield.Field.write`
 
         """
         if any([filename.endswith(ext) for ext in ['.omf', '.ovf',
                                                    '.ohf', '.oef']]):
-            return cls._fromovf(filename)
+            return cls._fromovf(filename, mmap=mmap)
         elif any([filename.endswith(ext) for ext in ['.vtk']]):
             return cls._fromvtk(filename)
+        elif any([filename.endswith(ext) for ext in ['.vtr']]):
+            return cls._fromvtr(filename)
         elif any([filename.endswith(ext) for ext in ['.hdf5', '.h5']]):
-            return cls._fromhdf5(filename)
+            return cls._fromhdf5(filename, lazy=lazy)
         else:
             msg = (f'Reading file with extension {filename.split(".")[-1]} '
                    f'not supported.')
             raise ValueError(msg)
 
     @classmethod
-    def _fromovf(cls, filename):
+    def _fromovf(cls, filename, mmap=False):
         """Read the field from an OVF file.
 
         Data representation (``txt``, ``bin4``, or ``bin8``) as well as the OVF
         version (OVF1.0 or OVF2.0) are extracted from the file itself.
 
+        If ``mmap=True`` and the data is binary, only the header is read and
+        the field array is a lazily transposed view of a copy-on-write
+        ``numpy.memmap``. Data is then read from the disk only when it is
+        accessed and the array has the data type of the file (e.g. big-endian
+        ``float32`` for OVF1.0 ``bin4``). Files with text data are read as
+        usual.
+
         This is a ``classmethod`` and should be called as, for instance,
         ``discretisedfield.Field._fromovf('myfile.omf')``.
 
@@ -2872,6 +4359,10 @@ class Field:
 
             Name of the file to be read.
 
+        mmap : bool, optional
+
+            If ``True``, binary data is memory-mapped. Defaults to ``False``.
+
         Returns
         -------
         discretisedfield.Field
@@ -2892,6 +4383,12 @@ class Field:
         >>> field
         Field(mesh=...)
 
+        2. Memory-map the data of a binary OVF file.
+
+        >>> field = df.Field._fromovf(filename, mmap=True)
+        >>> field.average
+        (...)
+
         .. seealso:: :py:func:`~discretisedfield.Field._writeovf`
 
         """
@@ -2903,51 +4400,78 @@ class Field:
                      'valuedim']
         mdatadict = dict()
 
-        try:
-            # Encoding in open is important on Windows.
-            with open(filename, 'r', encoding='utf-8') as ovffile:
-                lines = ovffile.readlines()
-
-            mdatalines = list(filter(lambda s: s.startswith('#'), lines))
-            datalines = np.loadtxt(filter(lambda s: not s.startswith('#'),
-                                          lines))
-
-            if '1.0' in mdatalines[0]:
-                # valuedim is not in OVF1 file.
-                mdatadict['valuedim'] = datalines.shape[-1]
-
-            for line in mdatalines:
-                for mdatum in mdatalist:
-                    if mdatum in line:
-                        mdatadict[mdatum] = float(line.split()[-1])
-                        break
-
-        except UnicodeDecodeError:
+        binary = False
+        if mmap:
+            # Only the header is read. Data is memory-mapped if it is binary.
+            with open(filename, 'rb') as ovffile:
+                lines = []
+                line = ovffile.readline()
+                while line and not line.startswith(b'# Begin: Data'):
+                    lines.append(line)
+                    line = ovffile.readline()
+                header = line.strip()
+                data_start = ovffile.tell()
+                if ovffile.read(1) == b'\r':
+                    # '\n\r' line endings: readline stops at '\n'. (The
+                    # first byte of the binary check value is never '\r'.)
+                    data_start += 1
+
+                # The end of data is searched for only at the end of the file.
+                size = ovffile.seek(0, 2)
+                tail_start = ovffile.seek(max(size - 1024, data_start))
+                data_end = tail_start + ovffile.read().rfind(b'# End: Data')
+
+            binary = header.startswith(b'# Begin: Data Binary ')
+
+        if not binary:
+            mmap = False
             with open(filename, 'rb') as ovffile:
                 f = ovffile.read()
-                lines = f.split(b'\n')
 
-            mdatalines = list(filter(lambda s: s.startswith(bytes('#',
-                                                                  'utf-8')),
-                                     lines))
+            header = b'# Begin: Data Binary '
+            data_start = f.find(header)
+            binary = data_start != -1
 
-            if bytes('2.0', 'utf-8') in mdatalines[0]:
-                endian = '<'  # little-endian
-            elif bytes('1.0', 'utf-8') in mdatalines[0]:
-                endian = '>'  # big-endian
+            if binary:
+                # Only the header is split into lines, not the binary data.
+                lines = f[:data_start].split(b'\n')
+
+                header = f[data_start:(data_start + len(header) + 1)]
+                data_start += len(header)
+                data_end = f.find(b'# End: Data Binary ')
 
-            for line in mdatalines:
-                for mdatum in mdatalist:
-                    if bytes(mdatum, 'utf-8') in line:
-                        mdatadict[mdatum] = float(line.split()[-1])
+                newlines = [b'\n\r', b'\r\n', b'\n']  # ordered by length
+                for nl in newlines:
+                    if f.startswith(nl, data_start):
+                        data_start += len(nl)
                         break
+            else:
+                data_start = f.find(b'# Begin: Data Text')
+                lines = f[:data_start].split(b'\n')
 
-            header = b'# Begin: Data Binary '
-            data_start = f.find(header)
-            header = f[data_start:(data_start + len(header) + 1)]
+                # Data starts in the line after the "Begin: Data Text" line.
+                data_start = f.find(b'\n', data_start) + 1
+                data_end = f.find(b'# End: Data Text', data_start)
+
+                # The whole numeric block is parsed at once from a contiguous
+                # buffer.
+                datalines = np.loadtxt(io.BytesIO(f[data_start:data_end]),
+                                       dtype=float).ravel()
+
+        mdatalines = list(filter(lambda s: s.startswith(bytes('#', 'utf-8')),
+                                 lines))
+
+        for line in mdatalines:
+            for mdatum in mdatalist:
+                if bytes(mdatum, 'utf-8') in line:
+                    mdatadict[mdatum] = float(line.split()[-1])
+                    break
 
-            data_start += len(header)
-            data_end = f.find(b'# End: Data Binary ')
+        if binary:
+            if bytes('2.0', 'utf-8') in mdatalines[0]:
+                endian = '<'  # little-endian
+            elif bytes('1.0', 'utf-8') in mdatalines[0]:
+                endian = '>'  # big-endian
 
             if b'4' in header:
                 nbytes = 4
@@ -2958,23 +4482,22 @@ class Field:
                 formatstr = endian + 'd'
                 checkvalue = 123456789012345.0
 
-            newlines = [b'\n\r', b'\r\n', b'\n']  # ordered by length
-            for nl in newlines:
-                if f.startswith(nl, data_start):
-                    data_start += len(nl)
-                    # There is a difference between files written by OOMMF and
-                    # mumax3. OOMMF has a newline character before the "end
-                    # metadata line', whereas mumax3 does not. Therefore if the
-                    # length of the data stream is not a multiple of nbytes, we
-                    # have to subtract the length of newline character from
-                    # data_end.
-                    if (data_end - data_start) % nbytes != 0:
-                        data_end -= len(nl)
-                    break
-
-            listdata = list(struct.iter_unpack(formatstr,
-                                               f[data_start:data_end]))
-            datalines = np.array(listdata)
+            # There is a difference between files written by OOMMF and mumax3.
+            # OOMMF has a newline character before the "end metadata line',
+            # whereas mumax3 does not. Because the newline is shorter than
+            # nbytes, it is discarded by the integer division.
+            count = (data_end - data_start) // nbytes
+
+            if mmap:
+                # Copy-on-write: the array can be modified without changing
+                # the file.
+                datalines = np.memmap(filename, dtype=formatstr, mode='c',
+                                      offset=data_start, shape=(count,))
+            else:
+                # Data is decoded directly from the buffer and converted to
+                # the native float64 (the buffer itself is read-only).
+                datalines = np.frombuffer(f, dtype=formatstr, count=count,
+                                          offset=data_start).astype(float)
 
             if datalines[0] != checkvalue:
                 # These two lines cannot be accessed via tests. Therefore, they
@@ -2991,8 +4514,8 @@ class Field:
 
         mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), cell=cell)
 
-        # valuedim is not in OVF1 file and for binary data it has to be
-        # extracted here.
+        # valuedim is not in OVF1 file and it has to be extracted from the
+        # number of values.
         if 'valuedim' not in mdatadict.keys():
             mdatadict['valuedim'] = len(datalines) / len(mesh)
 
@@ -3006,8 +4529,10 @@ class Field:
     def _fromvtk(cls, filename):
         """Read the field from a VTK file.
 
-        This method reads the field from a VTK file defined on
-        STRUCTURED_POINTS written by ``discretisedfield._writevtk``.
+        This method reads the field from a legacy VTK file defined on
+        ``RECTILINEAR_GRID`` written by ``discretisedfield._writevtk``. Both
+        ASCII and binary files are supported. Coordinates and data are parsed
+        as contiguous numeric blocks.
 
         This is a ``classmethod`` and should be called as, for instance,
         ``discretisedfield.Field._fromvtk('myfile.vtk')``.
@@ -3041,62 +4566,200 @@ class Field:
         .. seealso:: :py:func:`~discretisedfield.Field._writevtk`
 
         """
-        with open(filename, 'r') as f:
+        with open(filename, 'rb') as f:
             content = f.read()
-        lines = content.split('\n')
+
+        binary = content.split(b'\n', 3)[2].strip() == b'BINARY'
+        vtktypes = {b'float': 'f4', b'double': 'f8'}
+        keyword = re.compile(rb'^\s*(SCALARS|VECTORS|LOOKUP_TABLE|POINT_DATA|'
+                             rb'CELL_DATA|FIELD|[XYZ]_COORDINATES)', re.M)
+
+        def read_block(match, count):
+            # Data starts in the line after the matched keyword line.
+            start = content.index(b'\n', match.end()) + 1
+            if binary:
+                # Legacy VTK binary data is big-endian.
+                dtype = '>' + vtktypes[match.group('type')]
+                return np.frombuffer(content, dtype=dtype, count=count,
+                                     offset=start).astype(float)
+            else:
+                # ASCII data is parsed up to the next keyword at once.
+                end = keyword.search(content, start)
+                end = len(content) if end is None else end.start()
+                return np.fromstring(content[start:end], sep=' ')[:count]
+
+        coordinates = []
+        for axis in 'XYZ':
+            pattern = rb'^%s_COORDINATES\s+(?P<n>\d+)\s+(?P<type>\w+)'
+            match = re.search(pattern % axis.encode(), content, re.M)
+            coordinates.append(read_block(match, int(match.group('n'))))
+
+        p1, p2, n = dfu.vtk_mesh_parameters(coordinates)
+        mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), n=n)
 
         # Determine the dimension of the field.
-        if 'VECTORS' in content:
+        match = re.search(rb'^VECTORS\s+\S+\s+(?P<type>\w+)', content, re.M)
+        if match is not None:
             dim = 3
-            data_marker = 'VECTORS'
-            skip = 0  # after how many lines data starts after marker
         else:
             dim = 1
-            data_marker = 'SCALARS'
-            skip = 1
-
-        # Extract the metadata
-        mdatalist = ['X_COORDINATES', 'Y_COORDINATES', 'Z_COORDINATES']
-        n = []
-        cell = []
-        origin = []
-        for i, line in enumerate(lines):
-            for mdatum in mdatalist:
-                if mdatum in line:
-                    n.append(int(line.split()[1]))
-                    coordinates = list(map(float, lines[i+1].split()))
-                    origin.append(coordinates[0])
-                    if len(coordinates) > 1:
-                        cell.append(coordinates[1] - coordinates[0])
-                    else:
-                        # If only one cell exists, 1nm cell is used by default.
-                        cell.append(1e-9)
-
-        # Create objects from metadata info
-        p1 = np.subtract(origin, np.multiply(cell, 0.5))
-        p2 = np.add(p1, np.multiply(n, cell))
+            match = re.search(rb'^SCALARS\s+\S+\s+(?P<type>\w+).*\n'
+                              rb'LOOKUP_TABLE.*$', content, re.M)
+
+        values = read_block(match, dim*len(mesh))
+        # VTK order: x index changes fastest, then y, and z slowest.
+        values = values.reshape((*reversed(mesh.n), dim)).transpose(2, 1, 0, 3)
+
+        return cls(mesh, dim=dim, value=values)
+
+    @classmethod
+    def _fromvtr(cls, filename):
+        """Read the field from an XML VTK (``.vtr``) file.
+
+        This method reads the field from a ``RectilinearGrid`` VTK file with
+        point data, such as the files written by
+        ``discretisedfield.Field._writevtr``. ASCII, inline base64
+        (``binary``), and raw or base64 appended data, optionally compressed
+        with zlib, are supported.
+
+        This is a ``classmethod`` and should be called as, for instance,
+        ``discretisedfield.Field._fromvtr('myfile.vtr')``.
+
+        Parameters
+        ----------
+        filename : str
+
+            Name of the file to be read.
+
+        Returns
+        -------
+        discretisedfield.Field
+
+            Field read from the file.
+
+        Example
+        -------
+        1. Write and read a field from the VTR file.
+
+        >>> import os
+        >>> import discretisedfield as df
+        ...
+        >>> mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 5, 3), cell=(1, 1, 1))
+        >>> field = df.Field(mesh, dim=3, value=(1, 2, 3))
+        >>> filename = 'mytestfile.vtr'
+        >>> field.write(filename, representation='bin', compression='zlib')
+        >>> field_read = df.Field._fromvtr(filename)
+        >>> field_read.average
+        (1.0, 2.0, 3.0)
+        >>> os.remove(filename)  # delete the file
+
+        .. seealso:: :py:func:`~discretisedfield.Field._writevtr`
+
+        """
+        with open(filename, 'rb') as f:
+            content = f.read()
+
+        # Only the XML part of the file is parsed. Raw appended data starts
+        # after the underscore.
+        appended = content.find(b'<AppendedData')
+        if appended != -1:
+            raw_start = content.index(b'_', appended) + 1
+            content_xml = content[:appended] + b'</VTKFile>'
+        else:
+            content_xml = content
+        root = ElementTree.fromstring(content_xml)
+
+        if root.get('byte_order', 'LittleEndian') == 'LittleEndian':
+            endian = '<'
+        else:
+            endian = '>'
+        if root.get('header_type') == 'UInt64':
+            header_type = endian + 'u8'
+        else:
+            header_type = endian + 'u4'
+        compressed = root.get('compressor') is not None
+        vtktypes = {'Float32': 'f4', 'Float64': 'f8',
+                    'Int32': 'i4', 'Int64': 'i8'}
+
+        if appended != -1:
+            encoding = re.search(rb'encoding="(\w+)"',
+                                 content[appended:raw_start])
+            base64_appended = encoding.group(1) == b'base64'
+
+        def read_base64(text):
+            # Raw block (header and data) of base64-encoded binary data.
+            itemsize = np.dtype(header_type).itemsize
+            nheader = 1
+            if compressed:
+                first = base64.b64decode(bytes(text[:4*((itemsize + 2)//3)]))
+                nheader = 3 + int(np.frombuffer(first, dtype=header_type,
+                                                count=1)[0])
+            nbytes = nheader*itemsize
+            nchars = 4*((nbytes + 2)//3)
+            header = base64.b64decode(bytes(text[:nchars]))[:nbytes]
+            header = np.frombuffer(header, dtype=header_type)
+            size = int(header[3:].sum()) if compressed else int(header[0])
+
+            if compressed or bytes(text[nchars-1:nchars]) == b'=':
+                # Header and data are encoded separately.
+                end = nchars + 4*((size + 2)//3)
+                data = base64.b64decode(bytes(text[nchars:end]))
+            else:
+                end = 4*((nbytes + size + 2)//3)
+                data = base64.b64decode(bytes(text[:end]))[nbytes:]
+
+            return header.tobytes() + data
+
+        def read_array(element):
+            if element.get('format') == 'ascii':
+                return np.fromstring(element.text, sep=' ')
+            elif element.get('format') == 'binary':
+                text = ''.join(element.text.split()).encode()
+                block = read_base64(text)
+                data = dfu.vtk_binary_data(block, 0, header_type, compressed)
+            else:
+                start = raw_start + int(element.get('offset'))
+                if base64_appended:
+                    block = read_base64(memoryview(content)[start:])
+                    data = dfu.vtk_binary_data(block, 0, header_type,
+                                               compressed)
+                else:
+                    data = dfu.vtk_binary_data(content, start, header_type,
+                                               compressed)
+
+            dtype = endian + vtktypes[element.get('type')]
+            return np.frombuffer(data, dtype=dtype).astype(float)
+
+        coordinates = [read_array(element)
+                       for element in root.find('.//Coordinates')]
+        p1, p2, n = dfu.vtk_mesh_parameters(coordinates)
         mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), n=n)
-        field = cls(mesh, dim=dim)
 
-        # Find where data starts.
-        for i, line in enumerate(lines):
-            if line.startswith(data_marker):
-                start_index = i
+        pointdata = root.find('.//PointData')
+        name = pointdata.get('Vectors', pointdata.get('Scalars'))
+        element = pointdata[0]
+        for dataarray in pointdata:
+            if dataarray.get('Name') == name:
+                element = dataarray
                 break
+        dim = int(element.get('NumberOfComponents', 1))
 
-        # Extract data.
-        for i, line in zip(mesh.indices, lines[start_index+skip+1:]):
-            if not line[0].isalpha():
-                field.array[i] = list(map(float, line.split()))
+        values = read_array(element)
+        # VTK order: x index changes fastest, then y, and z slowest.
+        values = values.reshape((*reversed(mesh.n), dim)).transpose(2, 1, 0, 3)
 
-        return field
+        return cls(mesh, dim=dim, value=values)
 
     @classmethod
-    def _fromhdf5(cls, filename):
+    def _fromhdf5(cls, filename, lazy=False):
         """Read the field from an HDF5 file.
 
         This method reads the field from an HDF5 file defined on written by
-        ``discretisedfield._writevtk``.
+        ``discretisedfield._writevtk``. If ``lazy=True``, the file is kept open
+        and the field holds a handle to the dataset, whose parts are read only
+        when they are needed (refer to ``discretisedfield.Field.lazy``). The
+        file is closed when the field's array is read or when the field is
+        deleted.
 
         This is a ``classmethod`` and should be called as, for instance,
         ``discretisedfield.Field._fromhdf5('myfile.h5')``.
@@ -3107,12 +4770,23 @@ class Field:
 
             Name of the file to be read.
 
+        lazy : bool, optional
+
+            If ``True``, the data is read lazily. Defaults to ``False``.
+
         Returns
         -------
         discretisedfield.Field
 
             Field read from the file.
 
+        Raises
+        ------
+        ValueError
+
+            If the file contains a time series written by
+            ``discretisedfield.TimeSeries``.
+
         Example
         -------
         1. Read a field from the HDF5 file.
@@ -3127,10 +4801,22 @@ class Field:
         >>> field
         Field(mesh=...)
 
+        2. Read a field lazily.
+
+        >>> field = df.Field._fromhdf5(filename, lazy=True)
+        >>> field.lazy
+        True
+
         .. seealso:: :py:func:`~discretisedfield.Field._writehdf5`
 
         """
-        with h5py.File(filename, 'r') as f:
+        f = h5py.File(filename, 'r')
+        try:
+            if 'time' in f['field']:
+                msg = (f'File {filename} contains a time series. Use '
+                       'discretisedfield.TimeSeries to read it.')
+                raise ValueError(msg)
+
             # Read data from the file.
             p1 = f['field/mesh/region/p1']
             p2 = f['field/mesh/region/p2']
@@ -3140,7 +4826,20 @@ class Field:
 
             # Create field.
             mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), n=n)
-            return cls(mesh, dim=dim, value=array[:])
+            if lazy:
+                value = array
+            else:
+                value = array[:].astype(float, copy=False)
+            field = cls(mesh, dim=dim, value=value)
+        except BaseException:
+            f.close()  # also with lazy=True
+            raise
+
+        if not lazy:
+            f.close()
+        # With lazy=True, the file stays open as long as the dataset is
+        # referenced.
+        return field
 
     def mpl_scalar(self, *, ax=None, figsize=None, filter_field=None,
                    lightness_field=None, colorbar=True, colorbar_label=None,
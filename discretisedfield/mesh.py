@@ -314,8 +314,9 @@ class Mesh:
         .. seealso:: :py:func:`~discretisedfield.Mesh.indices`
 
         """
-        for index in self.indices:
-            yield self.index2point(index)
+        x, y, z = (array.tolist() for array in self.coordinates)
+        for i, j, k in self.indices:
+            yield (x[i], y[j], z[k])
 
     def axis_points(self, axis, /):
         """Points (ticks) on ``axis``.
@@ -353,8 +354,102 @@ class Mesh:
         if isinstance(axis, str):
             axis = dfu.axesdict[axis]
 
-        for i in range(self.n[axis]):
-            yield self.index2point((0, 0, 0))[axis] + i*self.cell[axis]
+        yield from self.coordinates[axis].tolist()
+
+    @property
+    def coordinates(self):
+        """Cell-centre coordinates along all three axes.
+
+        This property returns a tuple of three one-dimensional
+        ``numpy.ndarray`` objects with cell-centre coordinates along x, y, and
+        z axes. The arrays are computed only once and cached on the mesh.
+        Therefore, they are read-only.
+
+        Returns
+        -------
+        tuple (3,)
+
+            Coordinate arrays with shapes ``(n[0],)``, ``(n[1],)``, and
+            ``(n[2],)``.
+
+        Examples
+        --------
+        1. Getting cell-centre coordinates.
+
+        >>> import discretisedfield as df
+        ...
+        >>> p1 = (0, 0, 0)
+        >>> p2 = (10, 4, 1)
+        >>> cell = (2, 2, 1)
+        >>> mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), cell=cell)
+        ...
+        >>> x, y, z = mesh.coordinates
+        >>> x
+        array([1., 3., 5., 7., 9.])
+        >>> y
+        array([1., 3.])
+        >>> z
+        array([0.5])
+
+        .. seealso:: :py:func:`~discretisedfield.Mesh.meshgrid`
+
+        """
+        # Region is not a constant attribute and the cache is invalidated if it
+        # changes.
+        key = (self.region.pmin, self.cell, self.n)
+        if getattr(self, '_coordinates_key', None) != key:
+            coordinates = []
+            for i in range(3):
+                array = np.add(self.region.pmin[i],
+                               np.multiply(np.arange(self.n[i]) + 0.5,
+                                           self.cell[i]))
+                array.flags.writeable = False
+                coordinates.append(array)
+
+            self._coordinates = tuple(coordinates)
+            self._coordinates_key = key
+
+        return self._coordinates
+
+    @property
+    def meshgrid(self):
+        """Broadcastable grid of cell-centre coordinates.
+
+        This property returns a tuple of three read-only ``numpy.ndarray``
+        objects with shapes ``(n[0], 1, 1)``, ``(1, n[1], 1)``, and ``(1, 1,
+        n[2])``. They are views of ``discretisedfield.Mesh.coordinates`` and
+        can be broadcast against each other and against arrays with shape ``n``
+        (e.g. ``x + y + z``) without allocating the full three-dimensional
+        grids.
+
+        Returns
+        -------
+        tuple (3,)
+
+            Broadcastable coordinate arrays.
+
+        Examples
+        --------
+        1. Computing the distance of all cell centres from the origin.
+
+        >>> import discretisedfield as df
+        >>> import numpy as np
+        ...
+        >>> p1 = (0, 0, 0)
+        >>> p2 = (10, 4, 1)
+        >>> cell = (2, 2, 1)
+        >>> mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), cell=cell)
+        ...
+        >>> x, y, z = mesh.meshgrid
+        >>> r = np.sqrt(x**2 + y**2 + z**2)
+        >>> r.shape
+        (5, 2, 1)
+
+        .. seealso:: :py:func:`~discretisedfield.Mesh.coordinates`
+
+        """
+        return tuple(np.meshgrid(*self.coordinates, indexing='ij',
+                                 sparse=True, copy=False))
 
     def __eq__(self, other):
         """Relational operator ``==``.
@@ -399,6 +494,9 @@ class Mesh:
         True
 
         """
+        if other is self:
+            # Fields created in operations share the mesh object.
+            return True
         if not isinstance(other, self.__class__):
             return False
         if self.region == other.region and self.n == other.n:
@@ -1079,8 +1177,9 @@ class Mesh:
             raise ValueError(msg)
 
         norm = self.cell[self.info['axis1']] * self.cell[self.info['axis2']]
-        dn = dfu.assemble_index(0, 3, {self.info['planeaxis']: 1})
-        return df.Field(self, dim=3, value=dn, norm=norm)
+        dn = dfu.assemble_index(0, 3, {self.info['planeaxis']: norm})
+        return df.Field._fromarray(self, np.full((*self.n, 3), dn,
+                                                 dtype=float))
 
     def mpl(self, *, ax=None, figsize=None, color=dfu.cp_hex[:2],
             multiplier=None, filename=None, **kwargs):
@@ -1382,12 +1481,13 @@ class Mesh:
         unit = f'({uu.rsi_prefixes[multiplier]}m)'
 
         plot_array = np.zeros(self.n)
-        for index in self.indices:
-            for i, subregion in enumerate(self.subregions.values()):
-                if self.index2point(index) in subregion:
-                    # +1 to avoid 0 value - invisible voxel
-                    plot_array[index] = (i % len(color)) + 1
-                    break
+        for i, subregion in enumerate(self.subregions.values()):
+            mask = plot_array == 0  # cells are coloured by the first subregion
+            for coordinate, pmin, pmax in zip(self.meshgrid, subregion.pmin,
+                                              subregion.pmax):
+                mask = mask & (pmin <= coordinate) & (coordinate <= pmax)
+            # +1 to avoid 0 value - invisible voxel
+            plot_array[mask] = (i % len(color)) + 1
         # swap axes for k3d.voxels and astypr to avoid k3d warning
         plot_array = np.swapaxes(plot_array, 0, 2).astype(np.uint8)
 
@@ -166,7 +166,7 @@ class DValue:
         """
         if isinstance(other, self.__class__):
             return self.__class__(lambda f: self(f) * other(f))
-        elif isinstance(other, df.Field):
+        elif isinstance(other, (df.Field, df.Expression)):
             return other * self
         elif isinstance(other, numbers.Real):
             return self.__class__(lambda f: self(f) * other)
@@ -234,7 +234,7 @@ class DValue:
         """
         if isinstance(other, self.__class__):
             return self.__class__(lambda f: self(f) @ other(f))
-        elif isinstance(other, df.Field):
+        elif isinstance(other, (df.Field, df.Expression)):
             return other @ self
         elif isinstance(other, (list, tuple, np.ndarray)):
             return self.__class__(lambda f: self(f) @ other)
@@ -1,42 +1,120 @@
 """OVF to VTK file conversion"""
+import os
+import glob
 import argparse
+import concurrent.futures
 import discretisedfield as df
 
+ovf_extensions = ['.omf', '.ovf', '.ohf', '.oef']
 
-def ovf2vtk():
+# Output format: (extension, representation)
+formats = {'vtk': ('.vtk', 'txt'),
+           'vtk-bin': ('.vtk', 'bin'),
+           'vtr': ('.vtr', 'bin'),
+           'hdf5': ('.hdf5', 'txt')}
+
+
+def input_files(patterns):
+    """Expand input files.
+
+    Directories are expanded to all OVF files they contain and glob patterns
+    (e.g. ``'run/m*.omf'``) to all matching files, in sorted order. All other
+    entries are used as they are.
+
+    """
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            files += sorted(os.path.join(pattern, filename)
+                            for filename in os.listdir(pattern)
+                            if os.path.splitext(filename)[1] in
+                            ovf_extensions)
+        elif glob.has_magic(pattern):
+            files += sorted(glob.glob(pattern))
+        else:
+            files.append(pattern)
+
+    return files
+
+
+def convert(input_file, output_file, representation='txt', force=False):
+    """Convert a single file.
+
+    The conversion is skipped if ``output_file`` is newer than
+    ``input_file``, unless ``force=True``. It returns ``True`` if the file was
+    converted.
+
+    """
+    if (not force and os.path.isfile(output_file) and
+            os.path.getmtime(output_file) >= os.path.getmtime(input_file)):
+        return False
+
+    field = df.Field.fromfile(input_file)
+    field.write(output_file, representation=representation)
+    return True
+
+
+def ovf2vtk(argv=None):
     """OVF to VTK conversion function.
 
-    This method is used for command-line conversion of OVF files to VTK.
+    This method is used for command-line conversion of OVF files to VTK. Input
+    files can be passed as file names, glob patterns, or directories. Outputs
+    which are newer than their inputs are not converted again (unless
+    ``--force`` is passed), and files are converted by ``--jobs`` worker
+    processes. The output format is ASCII (``vtk``) or binary (``vtk-bin``)
+    legacy VTK, XML VTK (``vtr``), or HDF5 (``hdf5``).
 
     """
     parser = argparse.ArgumentParser(
         prog='ovf2vtk',
         description='ovf2vtk - OVF to VTK file format conversion.'
     )
-    parser.add_argument('--input', '-i', type=argparse.FileType('r'),
-                        nargs='+', required=True, help='Input OVF file(s).')
-    parser.add_argument('--output', '-o', type=argparse.FileType('w'),
-                        nargs='+', required=False, help='Output VTK file(s).')
-    args = parser.parse_args()
+    parser.add_argument('--input', '-i', nargs='+', required=True,
+                        help='Input OVF file(s), glob pattern(s), or '
+                        'directory(ies).')
+    parser.add_argument('--output', '-o', nargs='+', required=False,
+                        help='Output file(s).')
+    parser.add_argument('--format', '-f', choices=formats, default='vtk',
+                        help='Output file format (default: vtk).')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Number of worker processes (0 for the number '
+                        'of CPUs, default: 1).')
+    parser.add_argument('--force', action='store_true',
+                        help='Convert files with up-to-date outputs.')
+    args = parser.parse_args(argv)
 
-    input_files = [f.name for f in args.input]
+    inputs = input_files(args.input)
+    if not inputs:
+        msg = f'No input files found in {args.input}.'
+        raise ValueError(msg)
 
+    extension, representation = formats[args.format]
     if args.output:
         # Output filenames provided.
-        if len(args.input) == len(args.output):
-            output_files = [f.name for f in args.output]
+        if len(inputs) == len(args.output):
+            outputs = args.output
         else:
-            msg = (f'The number of input files ({len(args.input)}) does not '
+            msg = (f'The number of input files ({len(inputs)}) does not '
                    f'match the number of output files ({len(args.output)}).')
             raise ValueError(msg)
     else:
         # Output filenames are not provided and they are generated
         # automatically.
-        output_files = [f'{filename[:-4]}.vtk' for filename in input_files]
+        outputs = [f'{os.path.splitext(filename)[0]}{extension}'
+                   for filename in inputs]
 
-    for input_file, output_file in zip(input_files, output_files):
-        field = df.Field.fromfile(input_file)
-        field.write(output_file)
+    representations = [representation] * len(inputs)
+    force = [args.force] * len(inputs)
+    if args.jobs == 1:
+        list(map(convert, inputs, outputs, representations, force))
+    else:
+        jobs = args.jobs if args.jobs > 0 else os.cpu_count()
+        with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+            # Several files are sent to a worker at once to reduce the
+            # communication overhead for many small files.
+            chunksize = max(1, len(inputs) // (4 * jobs))
+            list(executor.map(convert, inputs, outputs, representations,
+                              force, chunksize=chunksize))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,284 @@
+import numpy as np
+import discretisedfield as df
+import ubermagutil.typesystem as ts
+
+
+@ts.typesystem(mesh=ts.Typed(expected_type=df.Mesh, const=True),
+               dim=ts.Scalar(expected_type=int, positive=True, const=True))
+class OVFWriter:
+    """Streaming OVF2.0 writer.
+
+    This class writes an OVF2.0 file incrementally, so that the whole field
+    array does not have to be in memory at any time. When the object is
+    created, the file is opened and the header is written. Data is then passed
+    in chunks using ``write`` (values already in OVF order) or ``write_slab``
+    (arrays in ``discretisedfield.Field.array`` order with one or more
+    z-layers). Finally, ``close`` writes the footer and closes the file. The
+    object can be used as a context manager, in which case ``close`` is called
+    on exit.
+
+    In OVF order, the x index changes fastest, then y, and z slowest. The peak
+    memory is bounded by the size of the chunks passed.
+
+    Parameters
+    ----------
+    filename : str
+
+        Name with an extension of the file written.
+
+    mesh : discretisedfield.Mesh
+
+        Finite-difference mesh on which the field is defined.
+
+    dim : int
+
+        Dimension of the field's value. Only ``dim=1`` and ``dim=3`` fields can
+        be written.
+
+    representation : str, optional
+
+        Representation; ``'bin4'``, ``'bin8'``, or ``'txt'``. Defaults to
+        ``'txt'``.
+
+    extend_scalar : bool, optional
+
+        If ``True``, a scalar field will be saved as a vector field. More
+        precisely, if the value at a cell is 3, that cell will be saved as (3,
+        0, 0). Defaults to ``False``.
+
+    Raises
+    ------
+    TypeError
+
+        If ``dim`` is not 1 or 3.
+
+    ValueError
+
+        If ``representation`` is not valid.
+
+    Examples
+    --------
+    1. Writing a field z-layer by z-layer.
+
+    >>> import os
+    >>> import numpy as np
+    >>> import discretisedfield as df
+    ...
+    >>> p1 = (0, 0, 0)
+    >>> p2 = (10e-9, 5e-9, 3e-9)
+    >>> n = (10, 5, 3)
+    >>> mesh = df.Mesh(p1=p1, p2=p2, n=n)
+    ...
+    >>> filename = 'mytestfile.omf'
+    >>> with df.OVFWriter(filename, mesh, dim=3,
+    ...                   representation='bin8') as writer:
+    ...     for k in range(mesh.n[2]):
+    ...         writer.write_slab(np.full((10, 5, 3), (0, 0, k)))
+    >>> field = df.Field.fromfile(filename)
+    >>> field.average
+    (0.0, 0.0, 1.0)
+    >>> os.remove(filename)  # delete the file
+
+    .. seealso:: :py:func:`~discretisedfield.Field.write`
+
+    """
+    binary_reps = {'bin4': (1234567.0, '<f4'),
+                   'bin8': (123456789012345.0, '<f8')}
+
+    def __init__(self, filename, mesh, dim, representation='txt',
+                 extend_scalar=False):
+        if dim != 1 and dim != 3:
+            msg = (f'Cannot write dim={dim} field.')
+            raise TypeError(msg)
+
+        if representation not in ['bin4', 'bin8', 'txt']:
+            msg = f'Representation {representation=} is not supported.'
+            raise ValueError(msg)
+
+        self.mesh = mesh
+        self.dim = dim
+        self.representation = representation
+
+        if extend_scalar and dim == 1:
+            self.write_dim = 3
+        else:
+            self.write_dim = dim
+
+        # The number of cells written so far.
+        self.count = 0
+
+        header = ['OOMMF OVF 2.0',
+                  '',
+                  'Segment count: 1',
+                  '',
+                  'Begin: Segment',
+                  'Begin: Header',
+                  '',
+                  'Title: Field',
+                  'Desc: File generated by Field class',
+                  'meshunit: m',
+                  'meshtype: rectangular',
+                  f'xbase: {mesh.region.pmin[0] + mesh.cell[0]/2}',
+                  f'ybase: {mesh.region.pmin[1] + mesh.cell[1]/2}',
+                  f'zbase: {mesh.region.pmin[2] + mesh.cell[2]/2}',
+                  f'xnodes: {mesh.n[0]}',
+                  f'ynodes: {mesh.n[1]}',
+                  f'znodes: {mesh.n[2]}',
+                  f'xstepsize: {mesh.cell[0]}',
+                  f'ystepsize: {mesh.cell[1]}',
+                  f'zstepsize: {mesh.cell[2]}',
+                  f'xmin: {mesh.region.pmin[0]}',
+                  f'ymin: {mesh.region.pmin[1]}',
+                  f'zmin: {mesh.region.pmin[2]}',
+                  f'xmax: {mesh.region.pmax[0]}',
+                  f'ymax: {mesh.region.pmax[1]}',
+                  f'zmax: {mesh.region.pmax[2]}',
+                  f'valuedim: {self.write_dim}',
+                  f'valuelabels: field_x field_y field_z',
+                  'valueunits: None None None',
+                  '',
+                  'End: Header',
+                  '']
+
+        if representation == 'bin4':
+            header.append('Begin: Data Binary 4')
+            self.footer = ['End: Data Binary 4',
+                           'End: Segment']
+        elif representation == 'bin8':
+            header.append('Begin: Data Binary 8')
+            self.footer = ['End: Data Binary 8',
+                           'End: Segment']
+        elif representation == 'txt':
+            header.append('Begin: Data Text')
+            self.footer = ['End: Data Text',
+                           'End: Segment']
+
+        # The file is opened in binary mode for all representations.
+        self.file = open(filename, 'wb')
+        self.file.write(''.join(map(lambda line: f'# {line}\n',
+                                    header)).encode('utf-8'))
+
+        if representation in self.binary_reps:
+            # Add the binary checksum. OVF2.0 data is little-endian.
+            checkvalue, dtype = self.binary_reps[representation]
+            self.file.write(np.array(checkvalue, dtype=dtype).tobytes())
+
+    def write(self, values):
+        """Write a chunk of values in OVF order.
+
+        ``values`` are the values of consecutive cells, following the cells
+        written so far, in OVF order (x index changes fastest, then y, and z
+        slowest).
+
+        Parameters
+        ----------
+        values : array_like
+
+            Values with shape ``(N, dim)``. For scalar fields, shape ``(N,)``
+            is accepted as well.
+
+        Raises
+        ------
+        ValueError
+
+            If the shape of ``values`` is not valid or if more values than the
+            number of mesh cells are written.
+
+        """
+        values = np.asarray(values)
+        if self.dim == 1 and values.ndim == 1:
+            values = values[:, np.newaxis]
+
+        if values.ndim != 2 or values.shape[1] != self.dim:
+            msg = (f'Values must have shape (N, {self.dim}), '
+                   f'not {values.shape}.')
+            raise ValueError(msg)
+
+        if self.count + values.shape[0] > len(self.mesh):
+            msg = (f'Cannot write more than {len(self.mesh)} values '
+                   f'(the number of mesh cells).')
+            raise ValueError(msg)
+
+        if self.write_dim != self.dim:
+            # Extend scalar field with two zero components.
+            values = np.pad(values, [(0, 0), (0, 2)])
+
+        if self.representation in self.binary_reps:
+            dtype = self.binary_reps[self.representation][1]
+            self.file.write(values.astype(dtype).tobytes())
+        else:
+            # Shortest representation which round-trips (as str(float)).
+            line = ' %r' * self.write_dim + '\n'
+            data = tuple(values.ravel().tolist())
+            self.file.write(((line * values.shape[0]) % data).encode('utf-8'))
+
+        self.count += values.shape[0]
+
+    def write_slab(self, array):
+        """Write one or more z-layers.
+
+        ``array`` has the layout of ``discretisedfield.Field.array``, but it
+        contains only ``nz`` z-layers following the layers written so far.
+        Layers are written one by one.
+
+        Parameters
+        ----------
+        array : array_like
+
+            Array with shape ``(n[0], n[1], dim)`` (one layer) or ``(n[0],
+            n[1], nz, dim)``.
+
+        Raises
+        ------
+        ValueError
+
+            If the shape of ``array`` is not valid or if more values than the
+            number of mesh cells are written.
+
+        """
+        array = np.asarray(array)
+        if array.ndim == 3:
+            array = array[:, :, np.newaxis, :]
+
+        if array.ndim != 4 or array.shape[:2] != self.mesh.n[:2]:
+            msg = (f'Array must have shape ({self.mesh.n[0]}, '
+                   f'{self.mesh.n[1]}, nz, {self.dim}), not {array.shape}.')
+            raise ValueError(msg)
+
+        for k in range(array.shape[2]):
+            layer = array[:, :, k, :].transpose(1, 0, 2)
+            self.write(layer.reshape(-1, self.dim))
+
+    def close(self):
+        """Write the footer and close the file.
+
+        Raises
+        ------
+        ValueError
+
+            If fewer values than the number of mesh cells were written. The
+            file is closed without the footer.
+
+        """
+        if self.file.closed:
+            return
+
+        if self.count != len(self.mesh):
+            self.file.close()
+            msg = (f'Only {self.count} out of {len(self.mesh)} values were '
+                   'written.')
+            raise ValueError(msg)
+
+        self.file.write(''.join(map(lambda line: f'# {line}\n',
+                                    self.footer)).encode('utf-8'))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            # Do not hide the original exception.
+            self.file.close()
+        else:
+            self.close()
@@ -0,0 +1,103 @@
+import os
+import pytest
+import tempfile
+import numpy as np
+import discretisedfield as df
+
+
+class TestExpression:
+    def setup(self):
+        p1 = (0, 0, 0)
+        p2 = (10e-9, 8e-9, 6e-9)
+        cell = (1e-9, 1e-9, 1e-9)
+        self.mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), cell=cell)
+        self.f = df.Field(self.mesh, dim=3,
+                          value=np.random.random((*self.mesh.n, 3)) - 0.5)
+        self.g = df.Field(self.mesh, dim=3,
+                          value=np.random.random((*self.mesh.n, 3)) - 0.5)
+        self.s = df.Field(self.mesh, dim=1,
+                          value=np.random.random((*self.mesh.n, 1)) + 1)
+
+    def test_evaluate(self):
+        f, g, s = self.f, self.g, self.s
+        ef, eg, es = map(df.Expression, (f, g, s))
+        expressions = [
+            (ef + eg, f + g),
+            (ef - g, f - g),
+            (f - eg, f - g),
+            (-ef + (1, 2, 3), -f + (1, 2, 3)),
+            ((1, 2, 3) - ef, (1, 2, 3) - f),
+            (2 * ef * es / es ** 2, 2 * f * s / s ** 2),
+            (1 / es + 2, 1 / s + 2),
+            (es * (1, 0, 2), s * (1, 0, 2)),
+            ((0, 1, 2) / es, (0, 1, 2) / s),
+            (ef @ eg, f @ g),
+            (f & eg, f & g),
+            (ef.x * eg.y - ef.z, f.x * g.y - f.z),
+            (ef.norm, f.norm),
+            (ef * df.dV, f * df.dV),
+            (df.dx * ef, df.dx * f),
+            (ef.derivative('x'), f.derivative('x')),
+            (es.derivative('y', n=2), s.derivative('y', n=2)),
+            (ef @ (ef.derivative('x') & ef.derivative('y')),
+             f @ (f.derivative('x') & f.derivative('y'))),
+            (ef.derivative('x') + ef.derivative('y') + ef.derivative('z'),
+             f.derivative('x') + f.derivative('y') + f.derivative('z')),
+        ]
+        for expression, expected in expressions:
+            assert isinstance(expression, df.Expression)
+            assert expression.dim == expected.dim
+            # Blocks of a single layer and the whole mesh at once.
+            for size in [1, 2**24]:
+                res = expression.evaluate(size=size)
+                assert isinstance(res, df.Field)
+                assert res.mesh == self.mesh
+                assert res.dim == expected.dim
+                assert np.allclose(res.array, expected.array)
+
+    def test_boundary_conditions(self):
+        for bc in ['xyz', 'neumann']:
+            mesh = df.Mesh(region=self.mesh.region, n=self.mesh.n, bc=bc)
+            f = df.Field(mesh, dim=3, value=self.f.array)
+            ef = df.Expression(f)
+            res = (ef.derivative('x') @ ef.derivative('y')).evaluate(size=1)
+            assert np.allclose(res.array,
+                               (f.derivative('x') @ f.derivative('y')).array)
+
+    def test_common_subexpressions(self):
+        ef = df.Expression(self.f)
+        other = df.Expression(self.f)  # wraps the same field
+        expression = ((ef.derivative('x') & ef.derivative('y')) @
+                      (other.derivative('x') & other.derivative('y')))
+        nodes, uses = expression._nodes()
+        # field, two derivatives, cross product, and dot product
+        assert len(nodes) == 5
+        assert max(uses.values()) == 2
+
+        res = expression.evaluate(size=1)
+        cross = self.f.derivative('x') & self.f.derivative('y')
+        assert np.allclose(res.array, (cross @ cross).array)
+
+    def test_lazy(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'testfile.hdf5')
+            self.f.write(filename)
+            f = df.Field.fromfile(filename, lazy=True)
+            res = (df.Expression(f).norm * 2).evaluate(size=1)
+            assert f.lazy
+            assert np.allclose(res.array, (self.f.norm * 2).array)
+
+    def test_invalid(self):
+        ef = df.Expression(self.f)
+        with pytest.raises(TypeError):
+            df.Expression(self.f.array)
+
+        mesh = df.Mesh(p1=(0, 0, 0), p2=(5, 5, 5), cell=(1, 1, 1))
+        with pytest.raises(ValueError):
+            ef + df.Field(mesh, dim=3, value=(0, 0, 1))
+
+        # Errors of field operations are raised on evaluation.
+        with pytest.raises(ValueError):
+            (ef * ef).evaluate()
+        with pytest.raises(TypeError):
+            (ef + 1).evaluate()
@@ -1,6 +1,7 @@
 import os
 import re
 import k3d
+import h5py
 import types
 import random
 import pytest
@@ -9,6 +10,7 @@ import tempfile
 import itertools
 import numpy as np
 import discretisedfield as df
+import discretisedfield.util as dfu
 import matplotlib.pyplot as plt
 from .test_mesh import TestMesh
 
@@ -222,6 +224,35 @@ class TestField:
                 rp = f.mesh.index2point(f.mesh.point2index(rp))
                 assert np.all(f(rp) == func(rp))
 
+    def test_set_with_vectorised_callable(self):
+        for mesh in self.meshes:
+            for func in self.sfuncs + self.vfuncs:
+                dim = 1 if func in self.sfuncs else 3
+                f = df.Field(mesh, dim=dim, value=func)
+                vfunc = dfu.vectorised(lambda point, func=func: func(point))
+                vf = df.Field(mesh, dim=dim, value=vfunc)
+                check_field(vf)
+
+                assert vf.allclose(f)
+
+        mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 5, 2), cell=(1, 1, 1))
+
+        @dfu.vectorised
+        def value_fun(point):
+            x, y, z = point
+            return np.stack((x, y, 2*z), axis=-1)
+
+        f = df.Field(mesh, dim=3, value=value_fun)
+        assert f((2.5, 1.5, 0.5)) == (2.5, 1.5, 1)
+
+        @dfu.vectorised
+        def value_fun(point):
+            x, y, z = point
+            return x*y
+
+        f = df.Field(mesh, dim=1, value=value_fun)
+        assert f((2.5, 1.5, 0.5)) == 3.75
+
     def test_set_with_dict(self):
         p1 = (0, 0, 0)
         p2 = (10e-9, 10e-9, 10e-9)
@@ -259,6 +290,78 @@ class TestField:
         f.array[0, 0, 0, 0] = 3
         assert isinstance(f.value, np.ndarray)
 
+    def test_fromarray(self):
+        mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 10, 10), n=(5, 5, 5))
+        array = np.random.random((*mesh.n, 3))
+        f = df.Field._fromarray(mesh, array)
+        check_field(f)
+        assert f.dim == 3
+        assert f.array is array
+        assert f.value is array
+        assert f == df.Field(mesh, dim=3, value=array)
+
+        # Results of operations share the mesh.
+        for res in [f + f, f.x, f.norm, f.orientation, f.derivative('x')]:
+            assert res.mesh is mesh
+
+    def test_value_cached(self):
+        mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 10, 10), n=(5, 5, 5))
+        calls = []
+
+        def value_fun(point):
+            calls.append(point)
+            return (1, 2, 3)
+
+        f = df.Field(mesh, dim=3, value=value_fun)
+        assert len(calls) == len(mesh)
+
+        # Reading the value does not evaluate the function again.
+        for _ in range(3):
+            assert f.value is value_fun
+        assert len(calls) == len(mesh)
+
+        # Field operations do not access the array publicly.
+        assert f.average == (1, 2, 3)
+        assert f.value is value_fun
+        assert len(calls) == len(mesh)
+
+        # After the array is accessed, the value is checked only once.
+        assert f.array.shape == (*mesh.n, 3)
+        assert f.value is value_fun
+        assert f.value is value_fun
+        assert len(calls) == 2 * len(mesh)
+
+        # A changed array is the value from then on.
+        f.array[0, 0, 0, 0] = 3
+        assert f.value is f.array
+        assert f.value is f.array
+        assert len(calls) == 3 * len(mesh)
+
+        # Changes through a reference to the array obtained after the last
+        # read of the value.
+        f.value = value_fun
+        array = f.array
+        array[0, 0, 0] = (5, 5, 5)
+        assert f.value is array
+        assert len(calls) == 5 * len(mesh)
+        assert f.value is array
+        assert len(calls) == 5 * len(mesh)
+
+        # Setting the array.
+        f.value = (1, 1, 1)
+        f.array = np.ones((*mesh.n, 3))
+        assert f.value == (1, 1, 1)
+        f.array = np.zeros((*mesh.n, 3))
+        assert f.value is f.array
+
+        # Arrays are used as values.
+        array = np.ones((*mesh.n, 3))
+        f.value = array
+        assert f.value is array
+        f.array[0, 0, 0, 0] = 3
+        assert f.value is array
+        assert f.value[0, 0, 0, 0] == 3
+
     def test_norm(self):
         mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 10, 10), cell=(5, 5, 5))
         f = df.Field(mesh, dim=3, value=(2, 2, 2))
@@ -840,6 +943,109 @@ class TestField:
         with pytest.raises(ValueError):
             res = f1 & f2
 
+    def test_inplace(self):
+        p1 = (0, 0, 0)
+        p2 = (10e-9, 10e-9, 10e-9)
+        cell = (5e-9, 5e-9, 5e-9)
+        mesh = df.Mesh(p1=p1, p2=p2, cell=cell)
+
+        f = df.Field(mesh, dim=3, value=np.random.random((*mesh.n, 3)))
+        s = df.Field(mesh, dim=1, value=np.random.random((*mesh.n, 1)) + 1)
+        f_orig = df.Field(mesh, dim=3, value=f.array.copy())
+        array = f.array
+
+        f += f_orig
+        assert f.allclose(2 * f_orig)
+        f -= (1, 2, 3)
+        assert f.allclose(2 * f_orig - (1, 2, 3))
+        f += (1, 2, 3)
+        f *= s
+        assert f.allclose(2 * f_orig * s)
+        f /= s
+        f /= 2
+        assert f.allclose(f_orig)
+        f *= df.dV
+        assert f.allclose(f_orig * df.dV)
+        assert f.array is array
+
+        # Representation is updated.
+        f.value = (1, 2, 3)
+        f *= 2
+        assert isinstance(f.value, np.ndarray)
+        assert f.average == (2, 4, 6)
+
+        s += 1
+        s -= s
+        assert s.average == 0
+
+        with pytest.raises(TypeError):
+            f += 1
+        with pytest.raises(ValueError):
+            f *= f
+        with pytest.raises(ValueError):
+            s += f
+        with pytest.raises(ValueError):
+            f /= df.Field(df.Mesh(p1=p1, p2=p2, n=(3, 3, 3)), dim=1, value=1)
+        with pytest.raises(TypeError):
+            s *= (1, 2, 3)
+        with pytest.raises(TypeError):
+            f /= 'a'
+
+        # Division without the reciprocal field.
+        f = df.Field(mesh, dim=1, value=10)
+        assert (f / 3).allclose(df.Field(mesh, dim=1, value=10/3))
+        assert np.all((10 / df.Field(mesh, dim=1, value=5)).array == 2)
+        assert (10 / f).allclose(df.Field(mesh, dim=1, value=1))
+        assert np.allclose(((1, 2, 3) / f).average, (0.1, 0.2, 0.3))
+        with pytest.raises(ValueError):
+            f / df.Field(mesh, dim=3, value=(1, 2, 3))
+        with pytest.raises(ValueError):
+            10 / df.Field(mesh, dim=3, value=(1, 2, 3))
+        with pytest.raises(TypeError):
+            f / 'a'
+
+    def test_out(self):
+        p1 = (0, 0, 0)
+        p2 = (10e-9, 10e-9, 10e-9)
+        cell = (2e-9, 5e-9, 5e-9)
+        mesh = df.Mesh(p1=p1, p2=p2, cell=cell)
+
+        f1 = df.Field(mesh, dim=3, value=np.random.random((*mesh.n, 3)))
+        f2 = df.Field(mesh, dim=3, value=np.random.random((*mesh.n, 3)))
+        scalar = df.Field(mesh, dim=1)
+        vector = df.Field(mesh, dim=3)
+
+        assert f1.dot(f2, out=scalar) is scalar
+        assert scalar.allclose(f1 @ f2)
+        assert f1.dot((1, 2, 3), out=scalar) is scalar
+        assert scalar.allclose(f1 @ (1, 2, 3))
+
+        assert f1.cross(f2, out=vector) is vector
+        assert vector.allclose(f1 & f2)
+        expected = f1 & f2
+        assert f1.cross(f2, out=f1) is f1
+        assert f1.allclose(expected)
+
+        for component in 'xyz':
+            assert f2.component(component, out=scalar) is scalar
+            assert scalar.allclose(getattr(f2, component))
+
+        # Components are copies.
+        fx = f2.x
+        fx += 1
+        assert not f2.x.allclose(fx)
+
+        with pytest.raises(ValueError):
+            f1.dot(f2, out=vector)
+        with pytest.raises(ValueError):
+            f1.cross(f2, out=scalar)
+        with pytest.raises(TypeError):
+            f1.cross(f2, out=vector.array)
+        with pytest.raises(ValueError):
+            f1.component('x', out=df.Field(mesh.plane('z'), dim=1))
+        with pytest.raises(ValueError):
+            scalar.component('x')
+
     def test_lshift(self):
         p1 = (0, 0, 0)
         p2 = (10e6, 10e6, 10e6)
@@ -1145,6 +1351,55 @@ class TestField:
         assert f.plane('y').derivative('y').average == (0, 0, 0)
         assert f.derivative('z').average == (0, 0, 0)
 
+    def test_derivative_accuracy(self):
+        # f(x, y, z) = x**3 -> df/dx = 3x**2, d2f/dx2 = 6x are exact for
+        # accuracy >= 4 (the stencils near the boundaries have 4+ points).
+        mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 2, 2), cell=(1, 1, 1))
+        f = df.Field(mesh, dim=3, value=lambda point: (point[0]**3, 0, 1))
+        x = mesh.coordinates[0][:, None, None]
+        for accuracy in [4, 6]:
+            res = f.derivative('x', accuracy=accuracy)
+            assert np.allclose(res.x.array[..., 0], 3*x**2)
+            assert np.allclose(res.z.array, 0)
+            res = f.derivative('x', n=2, accuracy=accuracy)
+            assert np.allclose(res.x.array[..., 0], 6*x)
+
+        # Convergence with the cell size for all boundary conditions:
+        # f(x) = cos(x) on [0, pi] (compatible with Neumann BC)
+        for bc in ['', 'x', 'neumann']:
+            for n in [1, 2]:
+                for accuracy in [2, 4, 6]:
+                    errors = []
+                    for n_cells in [32, 64]:
+                        mesh = df.Mesh(p1=(0, 0, 0), p2=(np.pi, 1, 1),
+                                       n=(n_cells, 1, 1), bc=bc)
+                        f = df.Field(mesh, dim=1,
+                                     value=lambda point: np.cos(point[0]))
+                        exact = np.cos(mesh.coordinates[0] + n*np.pi/2)
+                        res = f.derivative('x', n=n, accuracy=accuracy)
+                        errors.append(abs(res.array[:, 0, 0, 0] -
+                                          exact).max())
+                    rate = np.log2(errors[0] / errors[1])
+                    if bc == 'x':
+                        # cos(x) is not periodic on [0, pi]
+                        assert errors[1] > 0.1
+                    elif bc == '':
+                        # one order less at the boundaries
+                        assert rate > accuracy - 1.5
+                    else:
+                        assert rate > accuracy - 0.5
+
+        # Two cells without BC
+        mesh = df.Mesh(p1=(0, 0, 0), p2=(2, 1, 1), cell=(1, 1, 1))
+        f = df.Field(mesh, dim=1, value=lambda point: point[0]**2)
+        assert f.derivative('x').average == 2
+        assert f.derivative('x', n=2).average == 0
+
+        with pytest.raises(ValueError):
+            f.derivative('x', accuracy=3)
+        with pytest.raises(NotImplementedError):
+            f.derivative('x', n=3)
+
     def test_grad(self):
         p1 = (0, 0, 0)
         p2 = (10, 10, 10)
@@ -1305,6 +1560,243 @@ class TestField:
 
         assert f.laplace.average == (4, 4, 6)
 
+    def test_differential_operators_fused(self):
+        # Fused operators give the same results as their composition from
+        # directional derivatives.
+        for bc in ['', 'xyz', 'neumann', 'y']:
+            for n in [(6, 5, 4), (4, 1, 3)]:
+                mesh = df.Mesh(p1=(0, 0, 0), p2=(6e-9, 10e-9, 2e-9), n=n,
+                               bc=bc)
+                s = df.Field(mesh, dim=1, value=np.random.random((*n, 1)))
+                v = df.Field(mesh, dim=3, value=np.random.random((*n, 3)))
+
+                grad = (s.derivative('x') << s.derivative('y') <<
+                        s.derivative('z'))
+                assert np.array_equal(s.grad.array, grad.array)
+
+                div = (v.x.derivative('x') + v.y.derivative('y') +
+                       v.z.derivative('z'))
+                assert np.array_equal(v.div.array, div.array)
+
+                curl = ((v.z.derivative('y') - v.y.derivative('z')) <<
+                        (v.x.derivative('z') - v.z.derivative('x')) <<
+                        (v.y.derivative('x') - v.x.derivative('y')))
+                assert np.array_equal(v.curl.array, curl.array)
+
+                laplace = (v.derivative('x', n=2) + v.derivative('y', n=2) +
+                           v.derivative('z', n=2))
+                assert np.array_equal(v.laplace.array, laplace.array)
+                assert np.array_equal(s.laplace.array,
+                                      (s << s << s).laplace.x.array)
+
+                # Fields with a halo reuse it as the padded buffer.
+                for field in [s, v]:
+                    padded = df.Field(mesh, dim=field.dim, value=field.array)
+                    padded.halo = 2
+                    for operator in ['grad', 'div', 'curl', 'laplace']:
+                        if operator == 'laplace' or (
+                                operator == 'grad') == (field.dim == 1):
+                            assert np.array_equal(
+                                getattr(padded, operator).array,
+                                getattr(field, operator).array)
+
+    def test_cache(self):
+        mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 10, 10), n=(5, 5, 5))
+        size = len(mesh) * 3 * 8  # bytes of one vector field
+        f = df.Field(mesh, dim=3, value=lambda point: point)
+        assert f.cache_size == 0
+        assert f.derivative('x') is not f.derivative('x')
+
+        f.cache_size = 10 * size
+        for name in ['norm', 'orientation']:
+            res = getattr(f, name)
+            assert getattr(f, name) is res
+            assert res.cache_size == f.cache_size
+        dx = f.derivative('x')
+        assert f.derivative('x') is dx
+        assert f.derivative('x', n=2) is not dx
+        assert f.derivative('x', accuracy=4) is not dx
+        assert f.derivative('x', n=1, accuracy=2) is dx
+        assert np.array_equal(dx.array, (2*f).derivative('x').array / 2)
+
+        # Cached quantities get their own array once it is accessed.
+        assert f.derivative('x') is not dx
+        dx = f.derivative('x')
+        assert not dx._data.flags.writeable
+        norm = f.norm
+        norm += 1
+        assert np.array_equal(norm.array, f.norm.array + 1)
+        assert f.norm is not norm
+        d = f.derivative('y')
+        d.array *= 2
+        assert np.array_equal(d.array, 2 * f.derivative('y').array)
+        assert f.derivative('y') is not d
+        assert f.derivative('x') is dx
+
+        # Field operations do not clear the cache.
+        f @ f, f & dx, f.x, f.average, f.integral(), f.plane('z')
+        assert f.derivative('x') is dx
+
+        # Derivatives of cached quantities are cached as well.
+        d = f.orientation.derivative('y')
+        assert f.orientation.derivative('y') is d
+
+        # A replaced array of a cached quantity is not used.
+        dx.value = (0, 0, 1)
+        assert f.derivative('x') is not dx
+
+        # Changes of values through the field invalidate the cache.
+        changes = [lambda: setattr(f, 'array', f.array + 1),
+                   lambda: setattr(f, 'value', (1, 2, 3)),
+                   lambda: setattr(f, 'norm', 2),
+                   lambda: f.__iadd__(f),
+                   lambda: f.__imul__(2)]
+        for change in changes:
+            dx = f.derivative('x')
+            norm = f.norm
+            assert f.derivative('x') is dx
+            change()
+            assert f.derivative('x') is not dx
+            assert f.norm is not norm
+            assert np.array_equal(f.norm.array,
+                                  np.linalg.norm(f.array, axis=-1)[..., None])
+
+        # Reading the array does not invalidate the cache and the array is
+        # not made read-only. In-place writes are not tracked until the array
+        # is set.
+        dx = f.derivative('x')
+        array = f.array
+        assert array.flags.writeable
+        assert f.derivative('x') is dx
+        array[0, 0, 0] = 0
+        f.array = array
+        assert f.derivative('x') is not dx
+
+        # Other fields sharing the array are not affected.
+        array = np.ones((*mesh.n, 3))
+        g = df.Field(mesh, dim=3, value=array)
+        h = df.Field(mesh, dim=3, value=array)
+        g.cache_size = 10 * size
+        g.derivative('x'), g.norm
+        h.array[0, 0, 0] = 2
+        array[0, 0, 0] = 3
+        assert array.flags.writeable
+
+        # Quantities of cached quantities share one budget.
+        f.cache_size = 4 * size
+        orientation = f.orientation
+        assert orientation.cache_size == f.cache_size
+        for direction in 'xyz':
+            for n in [1, 2]:
+                orientation.derivative(direction, n=n)
+                f.derivative(direction, n=n)
+                assert f._cache_nbytes <= f.cache_size
+        assert '_cache' not in orientation.__dict__
+        d = orientation.derivative('z', n=2)
+        assert orientation.derivative('z', n=2) is d
+        orientation.value = (0, 0, 1)
+        assert orientation.derivative('z', n=2) is not d
+        f.cache_size = 0
+        assert orientation.cache_size == 0
+
+        # Least recently used quantities are evicted.
+        f.cache_size = 10 * size
+        f.cache_size = 2 * size
+        dx, dy = f.derivative('x'), f.derivative('y')
+        assert f.derivative('x') is dx
+        dz = f.derivative('z')
+        assert f.derivative('x') is dx
+        assert f.derivative('z') is dz
+        assert f.derivative('y') is not dy
+        assert len(f._cache) == 2
+        assert f._cache_nbytes == 2 * size
+
+        # Quantities larger than the budget are not cached.
+        f.cache_size = size // 2
+        assert len(f._cache) == 0
+        assert f._cache_nbytes == 0
+        assert f.array.flags.writeable
+        assert f.derivative('x') is not f.derivative('x')
+        assert f.norm is f.norm
+
+        f.cache_size = 0
+        assert f.norm is not f.norm
+
+        for cache_size in [-1, '1']:
+            with pytest.raises(ValueError):
+                f.cache_size = cache_size
+
+    def test_halo(self):
+        for bc in ['xyz', 'neumann', 'x', '']:
+            for n in [(6, 5, 4), (2, 3, 1)]:
+                mesh = df.Mesh(p1=(0, 0, 0), p2=n, n=n, bc=bc)
+                f = df.Field(mesh, dim=3, value=np.random.random((*n, 3)))
+                g = df.Field(mesh, dim=3, value=f.array)
+                g.halo = 2
+                assert g.halo == 2
+                assert g.array.shape == f.array.shape
+                assert g.array.base is g._halo_array
+                assert g == f
+
+                for step in range(2):
+                    for direction in 'xyz':
+                        for accuracy in [2, 4, 6]:
+                            for order in [1, 2]:
+                                assert np.array_equal(
+                                    f.derivative(direction, n=order,
+                                                 accuracy=accuracy).array,
+                                    g.derivative(direction, n=order,
+                                                 accuracy=accuracy).array)
+                    assert np.array_equal(f.curl.array, g.curl.array)
+                    assert np.array_equal(f.laplace.array, g.laplace.array)
+
+                    # Ghost layers are refreshed after changes of values.
+                    value = np.random.random((*n, 3))
+                    if step == 0:
+                        f.array[...] = value
+                        g.array[...] = value
+                    else:
+                        f.array = value
+                        g.array = value
+                        assert g.array.base is g._halo_array
+
+        mesh = df.Mesh(p1=(0, 0, 0), p2=(4, 4, 4), cell=(1, 1, 1), bc='xyz')
+        f = df.Field(mesh, dim=3, value=(0, 0, 1))
+        f.halo = 1
+        f.value = (0, 3, 4)
+        assert f.value == (0, 3, 4)
+        f.norm = 1
+        f += (1, 0, 0)
+        assert np.allclose(f.average, (1, 0.6, 0.8))
+        assert f.array.base is f._halo_array
+
+        f.halo = 0
+        assert f.halo == 0
+        assert f.array.flags['C_CONTIGUOUS']
+        assert np.allclose(f.average, (1, 0.6, 0.8))
+
+        for halo in [-1, 1.5, '1']:
+            with pytest.raises(ValueError):
+                f.halo = halo
+
+        # The value set as an array is copied into the halo buffer, so that
+        # changing the array afterwards does not change the value.
+        f = df.Field(mesh, dim=3)
+        f.halo = 1
+        value = np.ones((4, 4, 4, 3))
+        f.value = value
+        value[...] = 7
+        assert np.array_equal(f.value, f.array)
+        assert f.average == (1.0, 1.0, 1.0)
+
+        # Similarly, integer arrays are converted to float.
+        f = df.Field(mesh, dim=3)
+        value = np.ones((4, 4, 4, 3), dtype=int)
+        f.value = value
+        value[...] = 7
+        assert np.array_equal(f.value, f.array)
+        assert f.average == (1.0, 1.0, 1.0)
+
     def test_integral(self):
         # Volume integral.
         p1 = (0, 0, 0)
@@ -1420,6 +1912,82 @@ class TestField:
         assert line.n == 20
         assert line.dim == 3
 
+    def test_sample(self):
+        mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 10, 10), n=(10, 10, 10))
+
+        def value_fun(point):
+            x, y, z = point
+            return (x, 2*y, x*y*z)
+
+        f = df.Field(mesh, dim=3, value=value_fun)
+        check_field(f)
+
+        points = np.random.default_rng(0).uniform(0, 10, size=(50, 3))
+        points = np.vstack([points, [(0, 0, 0), (10, 10, 10), (5, 5, 5)]])
+        values = f.sample(points)
+        assert values.shape == (53, 3)
+        assert np.allclose(values, [f(point) for point in points])
+
+        fs = df.Field(mesh, dim=1, value=5)
+        assert fs.sample(points).shape == (53, 1)
+
+        # Points outside the mesh region.
+        points = [(1, 1, 1), (11, 1, 1), (1, -1, 1)]
+        with pytest.raises(ValueError):
+            f.sample(points)
+        values = f.sample(points, fill_value=np.nan)
+        assert np.allclose(values[0], f((1, 1, 1)))
+        assert np.isnan(values[1:]).all()
+
+        with pytest.raises(ValueError):
+            f.sample((1, 1, 1))
+
+    def test_sample_interpolation(self):
+        mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 10, 10), n=(10, 10, 10))
+
+        def value_fun(point):
+            x, y, z = point
+            return (x + 2*y - z, 3, x*y)
+
+        f = df.Field(mesh, dim=3, value=value_fun)
+        check_field(f)
+
+        # Linear functions are reproduced exactly between cell centres (the
+        # cubic stencil needs one more cell on each side).
+        rng = np.random.default_rng(0)
+        for interpolation, margin in [('linear', 0.5), ('cubic', 1.5)]:
+            points = rng.uniform(margin, 10 - margin, size=(50, 3))
+            expected = np.array([value_fun(point) for point in points])
+            values = f.sample(points, interpolation=interpolation)
+            assert values.shape == (50, 3)
+            assert np.allclose(values[:, :2], expected[:, :2])
+
+        # Cell centres are reproduced exactly.
+        points = np.array(list(mesh))
+        for interpolation in ['nearest', 'linear', 'cubic']:
+            assert np.allclose(f.sample(points, interpolation=interpolation),
+                               [value for _, value in f])
+
+        # Outside the outermost cell centres values are constant.
+        assert np.allclose(f.sample([(0, 0, 0)], interpolation='linear'),
+                           f((0, 0, 0)))
+
+        # Periodic boundary conditions.
+        mesh = df.Mesh(p1=(0, 0, 0), p2=(10, 1, 1), n=(10, 1, 1), bc='x')
+        f = df.Field(mesh, dim=1, value=lambda point: point[0])
+        assert np.allclose(f.sample([(0, 0.5, 0.5), (10, 0.5, 0.5)],
+                                    interpolation='linear'), 5)
+
+        with pytest.raises(ValueError):
+            f.sample([(1, 0.5, 0.5)], interpolation='quadratic')
+
+        line = f.line(p1=(0.5, 0.5, 0.5), p2=(9.5, 0.5, 0.5), n=19,
+                      interpolation='linear')
+        assert np.allclose(line.data['v'], np.linspace(0.5, 9.5, 19))
+
+        plane = f.plane('z', n=(20, 1), interpolation='cubic')
+        assert plane.mesh.n == (20, 1, 1)
+
     def test_plane(self):
         for mesh, direction in itertools.product(self.meshes, ['x', 'y', 'z']):
             f = df.Field(mesh, dim=1, value=3)
@@ -1600,6 +2168,50 @@ class TestField:
             f_saved = df.Field(f_read.mesh, dim=3, value=(1, 0.1, 0), norm=1)
             assert f_saved.allclose(f_read)
 
+        # Memory-mapped data
+        filenames = ['oommf-ovf2-txt.omf',
+                     'oommf-ovf2-bin4.omf',
+                     'oommf-ovf2-bin8.omf',
+                     'oommf-ovf1-txt.omf',
+                     'oommf-ovf1-bin4.omf',
+                     'oommf-ovf1-bin8.omf',
+                     'mumax-bin4-linux.ovf',
+                     'mumax-bin4-windows.ovf']
+        for filename in filenames:
+            omffilename = os.path.join(dirname, filename)
+            f_read = df.Field.fromfile(omffilename)
+            f_mmap = df.Field.fromfile(omffilename, mmap=True)
+
+            assert f_mmap.mesh == f_read.mesh
+            assert np.array_equal(f_mmap.array, f_read.array)
+            if 'txt' not in filename:
+                assert isinstance(f_mmap.array.base, np.memmap)
+
+            # Modifying the array does not change the file.
+            f_mmap.array[0, 0, 0, :] = 0
+            assert np.array_equal(df.Field.fromfile(omffilename).array,
+                                  f_read.array)
+
+        # Memory-mapped data with '\r\n' line endings and with '\n\r' after
+        # the "Begin: Data" line
+        for filename in ['oommf-ovf2-bin8.omf', 'oommf-ovf1-bin4.omf']:
+            with open(os.path.join(dirname, filename), 'rb') as f:
+                content = f.read()
+            start = content.find(b'# Begin: Data Binary ')
+            start = content.find(b'\n', start) + 1
+            header, data = content[:start], content[start:]
+            f_read = df.Field.fromfile(os.path.join(dirname, filename))
+            for new_header in [header.replace(b'\n', b'\r\n'),
+                               header + b'\r']:
+                with tempfile.TemporaryDirectory() as tmpdir:
+                    tmpfilename = os.path.join(tmpdir, filename)
+                    with open(tmpfilename, 'wb') as f:
+                        f.write(new_header + data)
+                    for mmap in [False, True]:
+                        f_newline = df.Field.fromfile(tmpfilename, mmap=mmap)
+                        assert np.array_equal(f_newline.array, f_read.array)
+                    del f_newline  # release the memory map
+
         # Exception (dim=2)
         f = df.Field(mesh, dim=2, value=(1, 2))
         with pytest.raises(TypeError) as excinfo:
@@ -1626,6 +2238,88 @@ class TestField:
                 assert np.allclose(f.mesh.cell, f_read.mesh.cell)
                 assert f.mesh.n == f_read.mesh.n
 
+        # Binary legacy VTK and XML VTK files
+        p1 = (-5e-9, 0, 0)
+        p2 = (5e-9, 4e-9, 3e-9)
+        cell = (1e-9, 2e-9, 1e-9)
+        mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), cell=cell)
+        for dim in [1, 3]:
+            f = df.Field(mesh, dim=dim,
+                         value=np.random.random((*mesh.n, dim)))
+            for filename, representation, compression in [
+                    ('testfile.vtk', 'bin', None),
+                    ('testfile.vtr', 'txt', None),
+                    ('testfile.vtr', 'bin', None),
+                    ('testfile.vtr', 'bin', 'zlib'),
+                    ('testfile.vtr', 'base64', None),
+                    ('testfile.vtr', 'base64', 'zlib')]:
+                with tempfile.TemporaryDirectory() as tmpdir:
+                    tmpfilename = os.path.join(tmpdir, filename)
+                    f.write(tmpfilename, representation=representation,
+                            compression=compression)
+                    f_read = df.Field.fromfile(tmpfilename)
+
+                    assert f_read.dim == dim
+                    assert f_read.mesh.n == mesh.n
+                    assert np.allclose(f_read.mesh.region.pmin, p1)
+                    assert np.allclose(f_read.mesh.region.pmax, p2)
+                    assert np.array_equal(f_read.array, f.array)
+
+    def test_write_vtk_vtr(self):
+        p1 = (0, 0, 0)
+        p2 = (10e-9, 5e-9, 3e-9)
+        cell = (1e-9, 1e-9, 1e-9)
+        mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), cell=cell)
+
+        f = df.Field(mesh, dim=3, value=(1, 2, 3))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            txtfilename = os.path.join(tmpdir, 'txt.vtk')
+            binfilename = os.path.join(tmpdir, 'bin.vtk')
+            f.write(txtfilename)
+            f.write(binfilename, representation='bin')
+            assert (os.path.getsize(binfilename) <
+                    os.path.getsize(txtfilename))
+
+            with open(binfilename, 'rb') as vtkfile:
+                content = vtkfile.read()
+            assert b'BINARY' in content
+            start = content.find(b'VECTORS field double\n') + 21
+            values = np.frombuffer(content, dtype='>f8', offset=start,
+                                   count=3*len(mesh))
+            assert np.array_equal(values.reshape(-1, 3),
+                                  np.tile([1, 2, 3], (len(mesh), 1)))
+
+            sizes = dict()
+            for representation, compression in [('txt', None),
+                                                ('bin', None),
+                                                ('bin', 'zlib'),
+                                                ('base64', None),
+                                                ('base64', 'zlib')]:
+                filename = os.path.join(
+                    tmpdir, f'{representation}-{compression}.vtr')
+                f.write(filename, representation=representation,
+                        compression=compression)
+                with open(filename, 'rb') as vtrfile:
+                    content = vtrfile.read()
+                assert content.startswith(b'<?xml')
+                assert content.endswith(b'</VTKFile>\n')
+                assert (b'AppendedData' in content) == (representation ==
+                                                        'bin')
+                sizes[representation, compression] = len(content)
+
+            # Constant field is compressed well.
+            assert sizes['bin', 'zlib'] < sizes['bin', None]
+            assert sizes['base64', 'zlib'] < sizes['base64', None]
+
+            with pytest.raises(ValueError):
+                f.write(binfilename, representation='bin8')
+            with pytest.raises(ValueError):
+                f.write(filename, representation='txt', compression='zlib')
+            with pytest.raises(ValueError):
+                f.write(filename, representation='bin', compression='lz4')
+            with pytest.raises(TypeError):
+                df.Field(mesh, dim=2, value=(1, 2)).write(binfilename)
+
     def test_write_read_hdf5(self):
         filenames = ['testfile.hdf5', 'testfile.h5']
 
@@ -1644,6 +2338,119 @@ class TestField:
 
                     assert f == f_read
 
+    def test_write_hdf5_layout(self):
+        p1 = (0, 0, 0)
+        p2 = (10e-9, 6e-9, 4e-9)
+        cell = (1e-9, 1e-9, 1e-9)
+        mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), cell=cell)
+        f = df.Field(mesh, dim=3, value=np.random.random((*mesh.n, 3)))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'testfile.hdf5')
+
+            # Default: z-plane chunks, float64, no compression.
+            f.write(filename)
+            with h5py.File(filename, 'r') as h5file:
+                dset = h5file['field/array']
+                assert dset.chunks == (10, 6, 1, 3)
+                assert dset.dtype == np.float64
+                assert dset.compression is None
+            assert np.array_equal(df.Field.fromfile(filename).array, f.array)
+
+            for compression in ['gzip', 'lzf']:
+                f.write(filename, compression=compression)
+                with h5py.File(filename, 'r') as h5file:
+                    dset = h5file['field/array']
+                    assert dset.compression == compression
+                    assert dset.shuffle
+                assert np.array_equal(df.Field.fromfile(filename).array,
+                                      f.array)
+
+            f.write(filename, chunks=(5, 3, 2, 3), dtype='float32')
+            with h5py.File(filename, 'r') as h5file:
+                dset = h5file['field/array']
+                assert dset.chunks == (5, 3, 2, 3)
+                assert dset.dtype == np.float32
+            f_read = df.Field.fromfile(filename)
+            assert f_read.array.dtype == np.float64
+            assert np.allclose(f_read.array, f.array, atol=1e-6)
+
+            f.write(filename, chunks=False)
+            with h5py.File(filename, 'r') as h5file:
+                assert h5file['field/array'].chunks is None
+
+            with pytest.raises(ValueError):
+                f.write(filename, compression='zlib')
+            with pytest.raises(ValueError):
+                f.write(filename, chunks=False, compression='gzip')
+
+        # Large planes are split along x and y.
+        assert dfu.hdf5_chunks((1000, 1000, 10, 3), 8) == (125, 250, 1, 3)
+        assert dfu.hdf5_chunks((1, 1, 1, 1), 8) == (1, 1, 1, 1)
+
+    def test_read_hdf5_lazy(self):
+        p1 = (0, 0, 0)
+        p2 = (10e-9, 6e-9, 8e-9)
+        cell = (1e-9, 1e-9, 1e-9)
+        mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), cell=cell)
+        subregion = df.Region(p1=(2e-9, 1e-9, 3e-9), p2=(7e-9, 4e-9, 8e-9))
+
+        for dim in [1, 3]:
+            f = df.Field(mesh, dim=dim,
+                         value=np.random.random((*mesh.n, dim)))
+            with tempfile.TemporaryDirectory() as tmpdir:
+                filename = os.path.join(tmpdir, 'testfile.hdf5')
+                f.write(filename, chunks=(10, 6, 3, dim))
+
+                f_lazy = df.Field.fromfile(filename, lazy=True)
+                assert f_lazy.lazy
+                assert f_lazy.mesh == f.mesh
+                assert f_lazy.dim == dim
+
+                assert np.allclose(f_lazy.average, f.average)
+                for direction in ['x', 'z', 'xy', 'yz', 'xyz']:
+                    res = f_lazy.integral(direction=direction)
+                    expected = f.integral(direction=direction)
+                    if direction == 'xyz':
+                        assert np.allclose(res, expected)
+                    else:
+                        assert res.mesh == expected.mesh
+                        assert np.allclose(res.array, expected.array)
+
+                assert f_lazy[subregion].allclose(f[subregion])
+                for interpolation in ['nearest', 'linear', 'cubic']:
+                    assert f_lazy.plane(
+                        z=4.2e-9, interpolation=interpolation).allclose(
+                            f.plane(z=4.2e-9, interpolation=interpolation))
+                assert f_lazy.plane('x', n=(5, 5)).allclose(
+                    f.plane('x', n=(5, 5)))
+                assert np.allclose(f_lazy((1e-9, 2e-9, 3e-9)),
+                                   f((1e-9, 2e-9, 3e-9)))
+
+                # None of the above reads the whole array.
+                assert f_lazy.lazy
+
+                # Other operations read the array.
+                assert (f_lazy + f_lazy).allclose(2 * f)
+                assert not f_lazy.lazy
+                assert np.array_equal(f_lazy.array, f.array)
+                del f_lazy
+
+                # The file is closed.
+                f.write(filename)
+
+        # The file is closed if reading fails.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'testfile.hdf5')
+            with h5py.File(filename, 'w') as h5file:
+                h5file.create_group('field')
+            for lazy in [False, True]:
+                # The traceback (which references the file) is kept.
+                with pytest.raises(KeyError) as excinfo:
+                    df.Field.fromfile(filename, lazy=lazy)
+                with h5py.File(filename, 'w') as h5file:
+                    h5file.create_group('field')
+
     def test_read_write_invalid_extension(self):
         filename = 'testfile.jpg'
 
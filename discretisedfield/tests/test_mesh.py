@@ -375,6 +375,30 @@ class TestMesh:
         assert list(mesh.axis_points('y')) == [1.0, 3.0, 5.0]
         assert list(mesh.axis_points('z')) == [1.0, 3.0, 5.0, 7.0]
 
+    def test_coordinates_meshgrid(self):
+        p1 = (0, 0, 0)
+        p2 = (10, 6, 8)
+        cell = (2, 2, 2)
+        mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), cell=cell)
+
+        x, y, z = mesh.coordinates
+        assert np.allclose(x, [1, 3, 5, 7, 9])
+        assert np.allclose(y, [1, 3, 5])
+        assert np.allclose(z, [1, 3, 5, 7])
+        assert not x.flags.writeable
+        assert mesh.coordinates[0] is x  # cached
+
+        grid = mesh.meshgrid
+        assert [i.shape for i in grid] == [(5, 1, 1), (1, 3, 1), (1, 1, 4)]
+        for index, point in zip(mesh.indices, mesh):
+            assert np.allclose([grid[0][index[0], 0, 0],
+                                grid[1][0, index[1], 0],
+                                grid[2][0, 0, index[2]]], point)
+
+        # Changing the region invalidates the cache.
+        mesh.region = df.Region(p1=(10, 0, 0), p2=(20, 6, 8))
+        assert np.allclose(mesh.coordinates[0], [11, 13, 15, 17, 19])
+
     def test_neighbours(self):
         p1 = (0, 0, 0)
         p2 = (5, 3, 2)
@@ -1,9 +1,11 @@
 import os
 import sys
+import pytest
 import tempfile
 import subprocess
 import numpy as np
 import discretisedfield as df
+from discretisedfield.ovf2vtk import ovf2vtk
 
 
 def test_ovf2vtk():
@@ -57,3 +59,40 @@ def test_ovf2vtk():
            '-o', 'file1.vtk']
     proc_return = subprocess.run(cmd)
     assert proc_return.returncode != 0
+
+
+def test_ovf2vtk_batch():
+    p1 = (0, 0, 0)
+    p2 = (10e-9, 7e-9, 2e-9)
+    cell = (1e-9, 1e-9, 1e-9)
+    mesh = df.Mesh(p1=p1, p2=p2, cell=cell)
+    fields = [df.Field(mesh, dim=3, value=(i, 1, 2)) for i in range(5)]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for i, f in enumerate(fields):
+            f.write(os.path.join(tmpdir, f'm{i:03d}.omf'),
+                    representation='bin8')
+
+        for fmt, extension in [('vtk', 'vtk'), ('vtk-bin', 'vtk'),
+                               ('vtr', 'vtr'), ('hdf5', 'hdf5')]:
+            # Directory input.
+            ovf2vtk(['-i', tmpdir, '-f', fmt, '-j', '2', '--force'])
+            for i, f in enumerate(fields):
+                filename = os.path.join(tmpdir, f'm{i:03d}.{extension}')
+                assert df.Field.fromfile(filename).allclose(f)
+
+        # Glob input.
+        vtkfilename = os.path.join(tmpdir, 'm000.vtk')
+        os.remove(vtkfilename)
+        ovf2vtk(['-i', os.path.join(tmpdir, 'm00[0-1].omf')])
+        assert os.path.isfile(vtkfilename)
+
+        # Outputs newer than inputs are not converted again.
+        os.utime(vtkfilename, (0, 0))
+        mtime = os.path.getmtime(os.path.join(tmpdir, 'm001.vtk'))
+        ovf2vtk(['-i', os.path.join(tmpdir, '*.omf')])
+        assert os.path.getmtime(vtkfilename) > 0
+        assert os.path.getmtime(os.path.join(tmpdir, 'm001.vtk')) == mtime
+
+        with pytest.raises(ValueError):
+            ovf2vtk(['-i', os.path.join(tmpdir, '*.ovf')])
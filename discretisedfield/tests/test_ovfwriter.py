@@ -0,0 +1,95 @@
+import os
+import pytest
+import tempfile
+import numpy as np
+import discretisedfield as df
+
+
+class TestOVFWriter:
+    def setup(self):
+        p1 = (0, 0, 0)
+        p2 = (8e-9, 5e-9, 3e-9)
+        cell = (1e-9, 1e-9, 1e-9)
+        self.mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), cell=cell)
+
+    def test_write_slab(self):
+        for dim in [1, 3]:
+            f = df.Field(self.mesh, dim=dim,
+                         value=np.random.random((*self.mesh.n, dim)))
+            for rep in ['txt', 'bin4', 'bin8']:
+                with tempfile.TemporaryDirectory() as tmpdir:
+                    tmpfilename = os.path.join(tmpdir, 'testfile.omf')
+                    with df.OVFWriter(tmpfilename, self.mesh, dim=dim,
+                                      representation=rep) as writer:
+                        for k in range(self.mesh.n[2]):
+                            writer.write_slab(f.array[:, :, k, :])
+
+                    f_read = df.Field.fromfile(tmpfilename)
+                    assert f_read.dim == dim
+                    assert np.allclose(f_read.array, f.array, atol=1e-6)
+
+    def test_write(self):
+        f = df.Field(self.mesh, dim=3,
+                     value=lambda point: (point[0], point[1], point[2]))
+        values = f.array.transpose(2, 1, 0, 3).reshape(-1, 3)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpfilename = os.path.join(tmpdir, 'testfile.omf')
+            with df.OVFWriter(tmpfilename, self.mesh, dim=3,
+                              representation='bin8') as writer:
+                # Chunks do not have to be aligned with z-layers.
+                for chunk in np.array_split(values, 7):
+                    writer.write(chunk)
+
+            assert df.Field.fromfile(tmpfilename).allclose(f)
+
+        # Extend scalar
+        f = df.Field(self.mesh, dim=1, value=lambda point: point[0])
+        values = f.array.transpose(2, 1, 0, 3).ravel()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpfilename = os.path.join(tmpdir, 'testfile.omf')
+            with df.OVFWriter(tmpfilename, self.mesh, dim=1,
+                              extend_scalar=True) as writer:
+                writer.write(values)
+
+            f_read = df.Field.fromfile(tmpfilename)
+            assert f_read.dim == 3
+            assert f_read.x.allclose(f)
+
+    def test_write_txt(self):
+        # Values are written in the shortest form, which round-trips.
+        values = np.random.random((len(self.mesh), 3))
+        values[0] = (0.1, 1e-20, 3)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpfilename = os.path.join(tmpdir, 'testfile.omf')
+            with df.OVFWriter(tmpfilename, self.mesh, dim=3) as writer:
+                writer.write(values)
+
+            with open(tmpfilename) as f:
+                lines = [line for line in f if not line.startswith('#')]
+
+        assert lines[0] == ' 0.1 1e-20 3.0\n'
+        assert lines[1] == ''.join(f' {value}' for value in values[1]) + '\n'
+        assert np.array_equal(np.loadtxt(lines), values)
+
+    def test_invalid(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpfilename = os.path.join(tmpdir, 'testfile.omf')
+            with pytest.raises(TypeError):
+                df.OVFWriter(tmpfilename, self.mesh, dim=2)
+            with pytest.raises(ValueError):
+                df.OVFWriter(tmpfilename, self.mesh, dim=3,
+                             representation='bin16')
+
+            writer = df.OVFWriter(tmpfilename, self.mesh, dim=3)
+            with pytest.raises(ValueError):
+                writer.write(np.zeros((5, 2)))
+            with pytest.raises(ValueError):
+                writer.write_slab(np.zeros((2, 2, 3)))
+            with pytest.raises(ValueError):
+                writer.write(np.zeros((len(self.mesh) + 1, 3)))
+
+            # Not all values are written.
+            writer.write(np.zeros((5, 3)))
+            with pytest.raises(ValueError):
+                writer.close()
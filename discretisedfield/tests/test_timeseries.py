@@ -0,0 +1,101 @@
+import os
+import pytest
+import tempfile
+import numpy as np
+import discretisedfield as df
+
+
+class TestTimeSeries:
+    def setup(self):
+        p1 = (0, 0, 0)
+        p2 = (8e-9, 5e-9, 3e-9)
+        cell = (1e-9, 1e-9, 1e-9)
+        self.mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), cell=cell)
+
+    def test_append_read(self):
+        for dim in [1, 3]:
+            fields = [df.Field(self.mesh, dim=dim,
+                               value=np.random.random((*self.mesh.n, dim)))
+                      for _ in range(4)]
+            times = [0, 1e-12, 2e-12, 5e-12]
+            with tempfile.TemporaryDirectory() as tmpdir:
+                filename = os.path.join(tmpdir, 'testfile.h5')
+                with df.TimeSeries(filename, mode='w', mesh=self.mesh,
+                                   dim=dim) as series:
+                    assert len(series) == 0
+                    for field, time in zip(fields[:2], times[:2]):
+                        series.append(field, time)
+
+                # Append to the existing file.
+                with df.TimeSeries(filename, mode='a') as series:
+                    for field, time in zip(fields[2:], times[2:]):
+                        series.append(field, time=time)
+
+                with df.TimeSeries(filename) as series:
+                    assert series.mesh == self.mesh
+                    assert series.dim == dim
+                    assert len(series) == 4
+                    assert np.array_equal(series.time, times)
+                    assert np.array_equal(series[2].array, fields[2].array)
+                    assert np.array_equal(series[-1].array, fields[-1].array)
+                    for field, expected in zip(series, fields):
+                        assert field.mesh == self.mesh
+                        assert np.array_equal(field.array, expected.array)
+
+                    with pytest.raises(IndexError):
+                        series[4]
+                    with pytest.raises(IndexError):
+                        series[-5]
+
+    def test_compression_dtype(self):
+        field = df.Field(self.mesh, dim=3,
+                         value=np.random.random((*self.mesh.n, 3)))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'testfile.h5')
+            with df.TimeSeries(filename, mode='a', mesh=self.mesh, dim=3,
+                               compression='gzip',
+                               dtype='float32') as series:
+                series.append(field, 0)
+                assert series.array.chunks == (1, 8, 5, 1, 3)
+                assert series.array.compression == 'gzip'
+                assert series.array.dtype == np.float32
+
+            with df.TimeSeries(filename) as series:
+                assert series[0].array.dtype == np.float64
+                assert series[0].allclose(field, atol=1e-6)
+
+    def test_invalid(self):
+        field = df.Field(self.mesh, dim=3, value=(0, 0, 1))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'testfile.h5')
+            with pytest.raises(ValueError):
+                df.TimeSeries(filename, mode='x')
+            with pytest.raises(ValueError):
+                df.TimeSeries(filename, mode='w')
+            with pytest.raises(ValueError):
+                df.TimeSeries(filename, mode='w', mesh=self.mesh, dim=3,
+                              compression='zlib')
+
+            with df.TimeSeries(filename, mode='w', mesh=self.mesh,
+                               dim=3) as series:
+                with pytest.raises(TypeError):
+                    series.append(field.array, 0)
+                with pytest.raises(ValueError):
+                    series.append(field.x, 0)
+                with pytest.raises(ValueError):
+                    series.append(field.plane('z'), 0)
+
+            with pytest.raises(ValueError):
+                df.TimeSeries(filename, mode='a', mesh=self.mesh, dim=1)
+
+            # A time series is not a single field.
+            for lazy in [False, True]:
+                with pytest.raises(ValueError, match='TimeSeries'):
+                    df.Field.fromfile(filename, lazy=lazy)
+
+            # A single field is not a time series.
+            field.write(filename)
+            for mode in ['r', 'a']:
+                with pytest.raises(ValueError, match='fromfile'):
+                    df.TimeSeries(filename, mode=mode)
+            field.write(filename)  # the file is closed
@@ -1,7 +1,11 @@
 import os
+import cmath
 import pytest
+import itertools
+import numpy as np
 import discretisedfield as df
 import discretisedfield.tools as dft
+import discretisedfield.util as dfu
 
 
 def test_topological_charge():
@@ -62,6 +66,142 @@ def test_topological_charge():
             res = getattr(dft, function)(f.plane('z'), method='wrong')
 
 
+def bergluescher_angle(v1, v2, v3):
+    # Scalar Berg-Luescher angle (previous implementation).
+    if np.dot(v1, np.cross(v2, v3)) == 0:
+        return 0.0
+    rho = (2 *
+           (1 + np.dot(v1, v2)) *
+           (1 + np.dot(v2, v3)) *
+           (1 + np.dot(v3, v1)))**0.5
+    numerator = (1 + np.dot(v1, v2) + np.dot(v2, v3) + np.dot(v3, v1) +
+                 1j*(np.dot(v1, np.cross(v2, v3))))
+    return 2 * cmath.log(numerator/rho).imag / (4*np.pi)
+
+
+def bergluescher_density(field):
+    # Berg-Luescher topological charge density computed cell by cell
+    # (previous implementation).
+    axis1 = field.mesh.info['axis1']
+    axis2 = field.mesh.info['axis2']
+    of = field.orientation
+    n1, n2 = of.mesh.n[axis1], of.mesh.n[axis2]
+    area = 0.5 * field.mesh.cell[axis1] * field.mesh.cell[axis2]
+    q = np.zeros((*field.mesh.n, 1))
+
+    def vector(i, j):
+        if 0 <= i < n1 and 0 <= j < n2:
+            return of.array[dfu.assemble_index(0, 3, {axis1: i, axis2: j})]
+
+    for i, j in itertools.product(range(n1), range(n2)):
+        v0 = vector(i, j)
+        v1, v2, v3, v4 = (vector(i+1, j), vector(i, j+1),
+                          vector(i-1, j), vector(i, j-1))
+        charge = 0
+        triangle_count = 0
+        for va, vb in [(v1, v2), (v2, v3), (v3, v4), (v4, v1)]:
+            if va is not None and vb is not None:
+                triangle_count += 1
+                charge += bergluescher_angle(v0, va, vb)
+        if triangle_count > 0:
+            q[dfu.assemble_index(0, 3, {axis1: i, axis2: j})] = \
+                charge / (area * triangle_count)
+
+    return q
+
+
+def test_topological_charge_density_bergluescher():
+    test_filename = os.path.join(os.path.dirname(__file__),
+                                 'test_sample/',
+                                 'skyrmion.omf')
+    skyrmion = df.Field.fromfile(test_filename)
+    q = dft.topological_charge_density(skyrmion.plane('z'),
+                                       method='berg-luescher')
+    assert np.allclose(q.array, bergluescher_density(skyrmion.plane('z')))
+
+    # Random fields on all planes, including planes with a single cell along
+    # one or both in-plane directions (fewer or no triangles per cell).
+    for n in [(5, 4, 3), (1, 4, 3), (5, 1, 1), (1, 1, 1), (2, 2, 2)]:
+        mesh = df.Mesh(p1=(0, 0, 0), p2=(5e-9, 4e-9, 3e-9), n=n)
+        f = df.Field(mesh, dim=3, value=np.random.random((*n, 3)) - 0.5)
+        for direction in 'xyz':
+            plane = f.plane(direction)
+            q = dft.topological_charge_density(plane, method='berg-luescher')
+            assert q.mesh == plane.mesh
+            assert np.allclose(q.array, bergluescher_density(plane))
+
+
+def bergluescher_charge(field, absolute):
+    # Berg-Luescher topological charge computed plaquette by plaquette
+    # (previous implementation).
+    axis1 = field.mesh.info['axis1']
+    axis2 = field.mesh.info['axis2']
+    of = field.orientation
+
+    def vector(i, j):
+        return of.array[dfu.assemble_index(0, 3, {axis1: i, axis2: j})]
+
+    charge = 0
+    for i, j in itertools.product(range(of.mesh.n[axis1] - 1),
+                                  range(of.mesh.n[axis2] - 1)):
+        v1, v2, v3, v4 = (vector(i, j), vector(i+1, j),
+                          vector(i+1, j+1), vector(i, j+1))
+        triangle1 = bergluescher_angle(v1, v2, v4)
+        triangle2 = bergluescher_angle(v2, v3, v4)
+        if absolute:
+            triangle1, triangle2 = abs(triangle1), abs(triangle2)
+        charge += triangle1 + triangle2
+
+    return charge
+
+
+def test_topological_charge_layers():
+    n = (6, 5, 4)
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(6e-9, 5e-9, 4e-9), n=n)
+    f = df.Field(mesh, dim=3, value=np.random.random((*n, 3)) - 0.5)
+
+    for direction in 'xyz':
+        axis = dfu.axesdict[direction]
+        points = f.mesh.axis_points(direction)
+        planes = [f.plane(**{direction: point}) for point in points]
+        for absolute in [False, True]:
+            Q = dft.topological_charge(f, method='berg-luescher',
+                                       absolute=absolute,
+                                       direction=direction)
+            assert isinstance(Q, np.ndarray)
+            assert Q.shape == (n[axis],)
+            assert np.allclose(Q, [bergluescher_charge(plane, absolute)
+                                   for plane in planes])
+            assert np.allclose(Q, [dft.topological_charge(
+                plane, method='berg-luescher', absolute=absolute)
+                for plane in planes])
+
+            Q = dft.topological_charge(f, method='continuous',
+                                       absolute=absolute,
+                                       direction=direction)
+            assert Q.shape == (n[axis],)
+            # Derivatives in the plane are not affected by other layers.
+            assert np.allclose(Q, [dft.topological_charge(
+                plane, method='continuous', absolute=absolute)
+                for plane in planes])
+
+    # Single plane
+    plane = f.plane('z')
+    Q = dft.topological_charge(plane, method='berg-luescher')
+    assert isinstance(Q, float)
+    assert np.isclose(Q, bergluescher_charge(plane, absolute=False))
+    assert np.allclose(dft.topological_charge(plane, method='berg-luescher',
+                                              direction='z'), [Q])
+
+    # Layers with a single cell (no plaquettes)
+    Q = dft.topological_charge(f.plane('x'), method='berg-luescher',
+                               direction='y')
+    assert np.array_equal(Q, np.zeros(n[1]))
+
+    with pytest.raises(ValueError):
+        dft.topological_charge(f, method='berg-luescher', direction='l')
+
+
 def test_emergent_magnetic_field():
     p1 = (0, 0, 0)
     p2 = (10, 10, 10)
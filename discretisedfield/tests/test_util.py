@@ -8,6 +8,23 @@ def test_array2tuple():
     dfu.array2tuple(np.array([1, 2, 3])) == (1, 2, 3)
 
 
+def test_as_array():
+    mesh = df.Mesh(p1=(0, 0, 0), p2=(3, 4, 5), cell=(1, 1, 1))
+    # Floating-point arrays are not copied.
+    for dtype in [float, np.float32]:
+        val = np.ones((*mesh.n, 3), dtype=dtype)
+        assert dfu.as_array(mesh, 3, val) is val
+    # Other arrays are converted to float.
+    val = np.ones((*mesh.n, 3), dtype=int)
+    array = dfu.as_array(mesh, 3, val)
+    assert array.dtype == float
+    assert np.array_equal(array, val)
+
+    f = df.Field(mesh, dim=3, value=val)
+    f /= 2
+    assert f.average == (0.5, 0.5, 0.5)
+
+
 def test_bergluescher_angle():
     # 1/8 of the full angle
     v1 = (1, 0, 0)
@@ -35,6 +52,23 @@ def test_bergluescher_angle():
     assert dfu.bergluescher_angle(v3, v1, v2) == 0
 
 
+def test_fd_weights():
+    # Central differences
+    assert dfu.fd_weights((-1, 0, 1), 1) == ((-1, 0, 1), 2)
+    assert dfu.fd_weights((-1, 0, 1), 2) == ((1, -2, 1), 1)
+    assert dfu.fd_weights((-2, -1, 0, 1, 2), 1) == ((1, -8, 0, 8, -1), 12)
+    # One-sided difference
+    assert dfu.fd_weights((0, 1, 2), 1) == ((-3, 4, -1), 2)
+
+    # Weights are memoised for any sequence of offsets.
+    from discretisedfield.util.util import _fd_weights
+    _fd_weights.cache_clear()
+    for offsets in [(-1, 0, 1), [-1, 0, 1], np.arange(-1, 2)]:
+        assert dfu.fd_weights(offsets, 2) == ((1, -2, 1), 1)
+    info = _fd_weights.cache_info()
+    assert info.misses == 1 and info.hits == 2
+
+
 def test_assemble_index():
     index_dict = {0: 5, 1: 3, 2: 4}
     assert dfu.assemble_index(0, 3, index_dict) == (5, 3, 4)
@@ -0,0 +1,288 @@
+import os
+import h5py
+import numpy as np
+import discretisedfield as df
+import ubermagutil.typesystem as ts
+import discretisedfield.util as dfu
+
+
+@ts.typesystem(mesh=ts.Typed(expected_type=df.Mesh, const=True),
+               dim=ts.Scalar(expected_type=int, positive=True, const=True))
+class TimeSeries:
+    """HDF5 container for a time series of fields.
+
+    All fields in the series are defined on the same mesh and have the same
+    dimension. The file has the same layout as the HDF5 files written by
+    ``discretisedfield.Field.write``. The mesh (``field/mesh/...``) and the
+    dimension (``field/dim``) are written only once. Snapshots are appended
+    to an extendable dataset ``field/array`` with shape ``(t, *mesh.n,
+    dim)``, and their times are stored in ``field/time``. Every snapshot is
+    stored in its own chunks. This means that reading step ``k``
+    (``series[k]``) or iterating over the series reads only one snapshot at a
+    time. Because of the leading time axis, a time series cannot be read with
+    ``discretisedfield.Field.fromfile``, which raises ``ValueError``.
+
+    With ``mode='r'``, an existing file is opened for reading. With
+    ``mode='w'``, a new file is created and ``mesh`` and ``dim`` must be
+    passed. With ``mode='a'``, snapshots are appended to an existing file. If
+    the file does not exist, it is created as with ``mode='w'``. The object can
+    be used as a context manager, in which case ``close`` is called on exit.
+
+    Parameters
+    ----------
+    filename : str
+
+        Name of the HDF5 file.
+
+    mode : str, optional
+
+        ``'r'`` (read), ``'w'`` (create), or ``'a'`` (append). Defaults to
+        ``'r'``.
+
+    mesh : discretisedfield.Mesh, optional
+
+        Mesh of the fields in the series. It is required when a new file is
+        created.
+
+    dim : int, optional
+
+        Dimension of the fields' value. It is required when a new file is
+        created.
+
+    compression : str, optional
+
+        Compression filter (``'gzip'`` or ``'lzf'``) used in a new file.
+        Refer to ``discretisedfield.Field.write``. Defaults to ``None``.
+
+    dtype : str, optional
+
+        Data type of snapshots in a new file (e.g. ``'float32'``). Defaults to
+        ``None`` and snapshots are stored as ``float64``.
+
+    Raises
+    ------
+    ValueError
+
+        If ``mode`` or ``compression`` is not valid, if ``mesh`` or ``dim`` is
+        not passed when a new file is created, or if they do not match the
+        file. Also, if an existing file does not contain a time series (e.g.
+        a single field written by ``discretisedfield.Field.write``).
+
+    Examples
+    --------
+    1. Writing and reading a time series.
+
+    >>> import os
+    >>> import discretisedfield as df
+    ...
+    >>> p1 = (0, 0, 0)
+    >>> p2 = (10e-9, 5e-9, 3e-9)
+    >>> n = (10, 5, 3)
+    >>> mesh = df.Mesh(p1=p1, p2=p2, n=n)
+    ...
+    >>> filename = 'mytestfile.h5'
+    >>> with df.TimeSeries(filename, mode='w', mesh=mesh, dim=3) as series:
+    ...     for i in range(5):
+    ...         field = df.Field(mesh, dim=3, value=(0, 0, i))
+    ...         series.append(field, time=i * 1e-12)
+    ...
+    >>> series = df.TimeSeries(filename)
+    >>> len(series)
+    5
+    >>> series.time
+    array([0.e+00, 1.e-12, 2.e-12, 3.e-12, 4.e-12])
+    >>> series[2].average
+    (0.0, 0.0, 2.0)
+    >>> [field.average[2] for field in series]
+    [0.0, 1.0, 2.0, 3.0, 4.0]
+    >>> series.close()
+    >>> os.remove(filename)  # delete the file
+
+    .. seealso:: :py:func:`~discretisedfield.Field.write`
+
+    """
+    def __init__(self, filename, mode='r', mesh=None, dim=None,
+                 compression=None, dtype=None):
+        if mode not in ['r', 'w', 'a']:
+            msg = f'Mode {mode=} is not supported.'
+            raise ValueError(msg)
+
+        if compression not in [None, 'gzip', 'lzf']:
+            msg = f'Compression {compression=} is not supported.'
+            raise ValueError(msg)
+
+        if mode == 'a' and not os.path.isfile(filename):
+            mode = 'w'
+
+        if mode == 'w':
+            if mesh is None or dim is None:
+                msg = 'Mesh and dim must be passed to create a new file.'
+                raise ValueError(msg)
+
+            self.mesh = mesh
+            self.dim = dim
+            self.file = h5py.File(filename, 'w')
+
+            gfield = self.file.create_group('field')
+            gmesh = gfield.create_group('mesh')
+            gregion = gmesh.create_group('region')
+
+            gregion.create_dataset('p1', data=mesh.region.p1)
+            gregion.create_dataset('p2', data=mesh.region.p2)
+            gmesh.create_dataset('n', dtype='i4', data=mesh.n)
+            gfield.create_dataset('dim', dtype='i4', data=dim)
+
+            # One snapshot per chunk, split as in Field.write.
+            dtype = np.dtype(float if dtype is None else dtype)
+            shape = (*mesh.n, dim)
+            chunks = (1, *dfu.hdf5_chunks(shape, dtype.itemsize))
+            gfield.create_dataset('array', shape=(0, *shape),
+                                  maxshape=(None, *shape), dtype=dtype,
+                                  chunks=chunks, compression=compression,
+                                  shuffle=compression is not None)
+            gfield.create_dataset('time', shape=(0,), maxshape=(None,),
+                                  dtype='f8', chunks=(1024,))
+        else:
+            self.file = h5py.File(filename, 'r' if mode == 'r' else 'r+')
+            if 'field' not in self.file or 'time' not in self.file['field']:
+                self.file.close()
+                msg = (f'File {filename} does not contain a time series. Use '
+                       'discretisedfield.Field.fromfile to read a field.')
+                raise ValueError(msg)
+
+            p1 = self.file['field/mesh/region/p1'][...].tolist()
+            p2 = self.file['field/mesh/region/p2'][...].tolist()
+            n = self.file['field/mesh/n'][...].tolist()
+            self.mesh = df.Mesh(region=df.Region(p1=p1, p2=p2), n=n)
+            self.dim = self.file['field/dim'][()].tolist()
+
+            if (mesh is not None and mesh != self.mesh or
+                    dim is not None and dim != self.dim):
+                self.file.close()
+                msg = 'Mesh and dim do not match the file.'
+                raise ValueError(msg)
+
+        self.array = self.file['field/array']
+        self._time = self.file['field/time']
+
+    def append(self, field, time):
+        """Append a snapshot.
+
+        Parameters
+        ----------
+        field : discretisedfield.Field
+
+            Field appended to the series. It must be defined on the mesh of
+            the series and have the same dimension.
+
+        time : numbers.Real
+
+            Time of the snapshot.
+
+        Raises
+        ------
+        TypeError
+
+            If ``field`` is not ``discretisedfield.Field``.
+
+        ValueError
+
+            If the mesh or the dimension of ``field`` does not match the
+            series.
+
+        """
+        if not isinstance(field, df.Field):
+            msg = f'Cannot append {type(field)=} to the time series.'
+            raise TypeError(msg)
+
+        if field.mesh != self.mesh or field.dim != self.dim:
+            msg = 'Field mesh and dim must match the time series.'
+            raise ValueError(msg)
+
+        k = len(self)
+        self.array.resize(k + 1, axis=0)
+        self._time.resize(k + 1, axis=0)
+        self.array[k] = field.array
+        self._time[k] = time
+
+    @property
+    def time(self):
+        """Times of all snapshots.
+
+        Returns
+        -------
+        numpy.ndarray
+
+            Array with shape ``(len(series),)``.
+
+        """
+        return self._time[...]
+
+    def __len__(self):
+        """Number of snapshots.
+
+        Returns
+        -------
+        int
+
+            Number of snapshots in the series.
+
+        """
+        return self.array.shape[0]
+
+    def __getitem__(self, k):
+        """Snapshot at step ``k``.
+
+        Only step ``k`` is read from the file. Negative indices count from the
+        end of the series.
+
+        Parameters
+        ----------
+        k : int
+
+            Step index.
+
+        Returns
+        -------
+        discretisedfield.Field
+
+            Field at step ``k``.
+
+        Raises
+        ------
+        IndexError
+
+            If ``k`` is out of range.
+
+        """
+        if not -len(self) <= k < len(self):
+            msg = f'Step {k=} is out of range for {len(self)} snapshots.'
+            raise IndexError(msg)
+
+        value = self.array[k % len(self)].astype(float, copy=False)
+        return df.Field(self.mesh, dim=self.dim, value=value)
+
+    def __iter__(self):
+        """Iterate over snapshots.
+
+        Snapshots are read from the file one by one.
+
+        Yields
+        ------
+        discretisedfield.Field
+
+            Field at each step.
+
+        """
+        for k in range(len(self)):
+            yield self[k]
+
+    def close(self):
+        """Close the file."""
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
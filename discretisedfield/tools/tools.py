@@ -1,4 +1,3 @@
-import itertools
 import numpy as np
 import discretisedfield as df
 import discretisedfield.util as dfu
@@ -120,60 +119,48 @@ def topological_charge_density(field, /, method='continuous'):
                                    of.derivative(dfu.raxesdict[axis2]))
 
     elif method == 'berg-luescher':
-        q = field.__class__(field.mesh, dim=1, value=0)
+        # Orientation vectors in the plane with shape (n1, n2, 3).
+        v = np.moveaxis(of._data, (axis1, axis2), (0, 1))[:, :, 0]
+        n1, n2 = v.shape[:2]
+
+        # Every cell v0 has up to 4 neighbours: v1=(i+1, j), v2=(i, j+1),
+        # v3=(i-1, j), and v4=(i, j-1). Triangles (v0, v1, v2), (v0, v2, v3),
+        # (v0, v3, v4), and (v0, v4, v1) are computed for all cells at once
+        # using shifted views. A triangle exists only if both neighbours
+        # exist, which restricts the cells it is computed for.
+        charge = np.zeros((n1, n2))
+        triangle_count = np.zeros((n1, n2))
+        for s0, sa, sb in [((slice(None, -1), slice(None, -1)),  # v0, v1, v2
+                            (slice(1, None), slice(None, -1)),
+                            (slice(None, -1), slice(1, None))),
+                           ((slice(1, None), slice(None, -1)),  # v0, v2, v3
+                            (slice(1, None), slice(1, None)),
+                            (slice(None, -1), slice(None, -1))),
+                           ((slice(1, None), slice(1, None)),  # v0, v3, v4
+                            (slice(None, -1), slice(1, None)),
+                            (slice(1, None), slice(None, -1))),
+                           ((slice(None, -1), slice(1, None)),  # v0, v4, v1
+                            (slice(None, -1), slice(None, -1)),
+                            (slice(1, None), slice(1, None)))]:
+            triangle_count[s0] += 1
+            charge[s0] += dfu.bergluescher_angle(v[s0], v[sa], v[sb])
 
         # Area of a single triangle
         area = 0.5 * field.mesh.cell[axis1] * field.mesh.cell[axis2]
 
-        for i, j in itertools.product(range(of.mesh.n[axis1]),
-                                      range(of.mesh.n[axis2])):
-            index = dfu.assemble_index(0, 3, {axis1: i, axis2: j})
-            v0 = of.array[index]
-
-            # Extract 4 neighbouring vectors (if they exist)
-            v1 = v2 = v3 = v4 = None
-            if i + 1 < of.mesh.n[axis1]:
-                v1 = of.array[dfu.assemble_index(0, 3, {axis1: i+1,
-                                                        axis2: j})]
-            if j + 1 < of.mesh.n[axis2]:
-                v2 = of.array[dfu.assemble_index(0, 3, {axis1: i,
-                                                        axis2: j+1})]
-            if i - 1 >= 0:
-                v3 = of.array[dfu.assemble_index(0, 3, {axis1: i-1,
-                                                        axis2: j})]
-            if j - 1 >= 0:
-                v4 = of.array[dfu.assemble_index(0, 3, {axis1: i,
-                                                        axis2: j-1})]
-
-            charge = 0
-            triangle_count = 0
-
-            if v1 is not None and v2 is not None:
-                triangle_count += 1
-                charge += dfu.bergluescher_angle(v0, v1, v2)
-
-            if v2 is not None and v3 is not None:
-                triangle_count += 1
-                charge += dfu.bergluescher_angle(v0, v2, v3)
-
-            if v3 is not None and v4 is not None:
-                triangle_count += 1
-                charge += dfu.bergluescher_angle(v0, v3, v4)
-
-            if v4 is not None and v1 is not None:
-                triangle_count += 1
-                charge += dfu.bergluescher_angle(v0, v4, v1)
-
-            if triangle_count > 0:
-                q.array[index] = charge / (area * triangle_count)
-            else:
-                # If the cell has no neighbouring cells
-                q.array[index] = 0
+        # If the cell has no neighbouring cells, the density is zero.
+        density = np.divide(charge, area * triangle_count,
+                            out=np.zeros_like(charge),
+                            where=triangle_count > 0)
+
+        q_array = np.empty((*field.mesh.n, 1))
+        np.moveaxis(q_array, (axis1, axis2), (0, 1))[:, :, 0, 0] = density
 
-        return q
+        return field._fromarray(field.mesh, q_array)
 
 
-def topological_charge(field, /, method='continuous', absolute=False):
+def topological_charge(field, /, method='continuous', absolute=False,
+                       direction=None):
     """Topological charge.
 
     This function computes topological charge for a vector field (``dim=3``).
@@ -188,6 +175,11 @@ def topological_charge(field, /, method='continuous', absolute=False):
     method. If the field is not three-dimensional or the field is not
     sliced and ``ValueError`` is raised.
 
+    Alternatively, ``direction`` can be passed, in which case the field does
+    not have to be sliced. It is treated as a stack of planes perpendicular to
+    ``direction`` and the topological charges of all layers are computed in a
+    single call and returned as an array.
+
     Parameters
     ----------
     field : discretisedfield.Field
@@ -204,17 +196,25 @@ def topological_charge(field, /, method='continuous', absolute=False):
         If ``True`` the absolute topological charge is computed.
         Defaults to ``False``.
 
+    direction : str, optional
+
+        Direction perpendicular to the layers (``'x'``, ``'y'``, or ``'z'``)
+        for which the topological charges are computed. Defaults to ``None``
+        and the field must be sliced.
+
     Returns
     -------
-    float
+    float, numpy.ndarray
 
-        Topological charge.
+        Topological charge. If ``direction`` is passed, one-dimensional array
+        of topological charges of all layers along ``direction``.
 
     Raises
     ------
     ValueError
 
-        If the field is not three-dimensional or the field is not sliced.
+        If the field is not three-dimensional, the field is not sliced and
+        ``direction`` is not passed, or ``direction`` is invalid.
 
     Example
     -------
@@ -258,6 +258,11 @@ def topological_charge(field, /, method='continuous', absolute=False):
     ...
     ValueError: ...
 
+    4. Compute the topological charges of all layers along the z direction.
+
+    >>> dft.topological_charge(f, method='berg-luescher', direction='z')
+    array([0., 0., 0., 0., 0.])
+
     .. seealso::
 
         :py:func:`~discretisedfield.tools.topological_charge_density`
@@ -267,7 +272,11 @@ def topological_charge(field, /, method='continuous', absolute=False):
         msg = f'Cannot compute topological charge for {field.dim=} field.'
         raise ValueError(msg)
 
-    if not hasattr(field.mesh, 'info'):
+    if direction is not None:
+        if direction not in dfu.axesdict.keys():
+            msg = f'Cannot compute topological charge for {direction=}.'
+            raise ValueError(msg)
+    elif not hasattr(field.mesh, 'info'):
         msg = ('The field must be sliced before the '
                'topological charge can be computed.')
         raise ValueError(msg)
@@ -276,40 +285,62 @@ def topological_charge(field, /, method='continuous', absolute=False):
         msg = 'Method can be either continuous or berg-luescher'
         raise ValueError(msg)
 
-    if method == 'continuous':
-        q = topological_charge_density(field, method=method)
-        if absolute:
-            return df.integral(abs(q) * abs(df.dS))
-        else:
-            return df.integral(q * abs(df.dS))
-
-    elif method == 'berg-luescher':
+    if direction is None:
         axis1 = field.mesh.info['axis1']
         axis2 = field.mesh.info['axis2']
+        planeaxis = field.mesh.info['planeaxis']
+    else:
+        planeaxis = dfu.axesdict[direction]
+        axis1, axis2 = (axis for axis in dfu.axesdict.values()
+                        if axis != planeaxis)
+
+    if method == 'continuous':
+        if direction is None:
+            q = topological_charge_density(field, method=method)
+            if absolute:
+                return df.integral(abs(q) * abs(df.dS))
+            else:
+                return df.integral(q * abs(df.dS))
+
         of = field.orientation
+        q = 1/(4*np.pi) * of @ (of.derivative(dfu.raxesdict[axis1]) &
+                                of.derivative(dfu.raxesdict[axis2]))
+        q_array = abs(q._data) if absolute else q._data
+        area = field.mesh.cell[axis1] * field.mesh.cell[axis2]
+        return np.sum(q_array[..., 0], axis=(axis1, axis2)) * area
 
-        topological_charge = 0
-        for i, j in itertools.product(range(of.mesh.n[axis1] - 1),
-                                      range(of.mesh.n[axis2] - 1)):
-            v1 = of.array[dfu.assemble_index(0, 3, {axis1: i,
-                                                    axis2: j})]
-            v2 = of.array[dfu.assemble_index(0, 3, {axis1: i + 1,
-                                                    axis2: j})]
-            v3 = of.array[dfu.assemble_index(0, 3, {axis1: i + 1,
-                                                    axis2: j + 1})]
-            v4 = of.array[dfu.assemble_index(0, 3, {axis1: i,
-                                                    axis2: j + 1})]
-
-            triangle1 = dfu.bergluescher_angle(v1, v2, v4)
-            triangle2 = dfu.bergluescher_angle(v2, v3, v4)
+    elif method == 'berg-luescher':
+        # Orientation vectors with shape (nlayers, n1, n2, 3).
+        v = np.moveaxis(field.orientation._data, (planeaxis, axis1, axis2),
+                        (0, 1, 2))
+
+        # Plaquettes (v1, v2, v3, v4) with v1=(i, j), v2=(i+1, j),
+        # v3=(i+1, j+1), and v4=(i, j+1) are split into triangles
+        # (v1, v2, v4) and (v2, v3, v4), which are computed for blocks of
+        # layers at once using shifted views.
+        layer = 3 * 8 * v.shape[1] * v.shape[2]
+        step = max(1, 2**24 // layer)
+        charges = np.empty(v.shape[0])
+        for start in range(0, v.shape[0], step):
+            block = v[start:start+step]
+            triangle1 = dfu.bergluescher_angle(block[:, :-1, :-1],
+                                               block[:, 1:, :-1],
+                                               block[:, :-1, 1:])
+            triangle2 = dfu.bergluescher_angle(block[:, 1:, :-1],
+                                               block[:, 1:, 1:],
+                                               block[:, :-1, 1:])
 
             if absolute:
                 triangle1 = abs(triangle1)
                 triangle2 = abs(triangle2)
 
-            topological_charge += triangle1 + triangle2
+            charges[start:start+step] = np.sum(triangle1 + triangle2,
+                                               axis=(1, 2))
 
-        return topological_charge
+        if direction is None:
+            return float(charges[0])
+        else:
+            return charges
 
 
 def emergent_magnetic_field(field):
@@ -357,9 +388,12 @@ def emergent_magnetic_field(field):
                f'for {field.dim=} field.')
         raise ValueError(msg)
 
-    Fx = field @ (field.derivative('y') & field.derivative('z'))
-    Fy = field @ (field.derivative('z') & field.derivative('x'))
-    Fz = field @ (field.derivative('x') & field.derivative('y'))
+    # Each directional derivative is computed only once.
+    dx, dy, dz = (field.derivative(direction) for direction in 'xyz')
+
+    Fx = field @ (dy & dz)
+    Fy = field @ (dz & dx)
+    Fz = field @ (dx & dy)
 
     return Fx << Fy << Fz
 
@@ -464,7 +498,7 @@ def neigbouring_cell_angle(field, /, direction, units='rad'):
     if units == 'deg':
         angles = np.degrees(angles)
 
-    return df.Field(mesh, dim=1, value=angles.reshape(*angles.shape, 1))
+    return df.Field._fromarray(mesh, angles.reshape(*angles.shape, 1))
 
 
 def max_neigbouring_cell_angle(field, /, units='rad'):
@@ -525,4 +559,4 @@ def max_neigbouring_cell_angle(field, /, units='rad'):
     max_angles[:, :, :-1, 5] = z_angles
     max_angles = max_angles.max(axis=-1, keepdims=True)
 
-    return df.Field(field.mesh, dim=1, value=max_angles)
+    return df.Field._fromarray(field.mesh, max_angles)
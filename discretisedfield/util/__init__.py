@@ -1,3 +1,5 @@
 from .util import axesdict, raxesdict, cp_int, cp_hex, array2tuple, as_array, \
-    bergluescher_angle, assemble_index, plot_line, plot_box, vtk_scalar_data, \
-    vtk_vector_data, normalise_to_range, hls2rgb
+    vectorised, bergluescher_angle, assemble_index, plot_line, plot_box, \
+    vtk_scalar_data, vtk_vector_data, vtk_binary_block, vtk_binary_data, \
+    vtk_mesh_parameters, hdf5_chunks, fd_weights, \
+    normalise_to_range, hls2rgb
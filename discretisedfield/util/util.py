@@ -1,5 +1,9 @@
-import cmath
+import math
+import zlib
+import h5py
 import numbers
+import fractions
+import functools
 import colorsys
 import collections
 import numpy as np
@@ -21,6 +25,16 @@ def array2tuple(array):
 
 
 def as_array(mesh, dim, val):
+    if (isinstance(val, (np.ndarray, h5py.Dataset)) and
+            val.shape == (*mesh.n, dim)):
+        # Floating-point arrays (including memory-mapped arrays) are used
+        # without a copy and HDF5 datasets (lazy fields) are not read. Other
+        # arrays (e.g. integer) are converted to float.
+        if isinstance(val, h5py.Dataset) or np.issubdtype(val.dtype,
+                                                          np.floating):
+            return val
+        return val.astype(float)
+
     array = np.empty((*mesh.n, dim))
     if isinstance(val, numbers.Real) and (dim == 1 or val == 0):
         # The array for a scalar field with numbers.Real value or any
@@ -28,44 +42,72 @@ def as_array(mesh, dim, val):
         array.fill(val)
     elif isinstance(val, (tuple, list, np.ndarray)) and len(val) == dim:
         array[..., :] = val
-    elif isinstance(val, np.ndarray) and val.shape == array.shape:
-        array = val
+    elif callable(val) and getattr(val, 'vectorised', False):
+        res = val(tuple(np.broadcast_arrays(*mesh.meshgrid)))
+        if isinstance(res, (tuple, list)) and len(res) == dim:
+            # Components are assigned one by one so that constant components
+            # are broadcast over the whole mesh.
+            for i, component in enumerate(res):
+                array[..., i] = component
+        else:
+            res = np.asarray(res)
+            if dim == 1 and res.shape == mesh.n:
+                res = res[..., np.newaxis]
+            array[...] = res
     elif callable(val):
         for index, point in zip(mesh.indices, mesh):
             array[index] = val(point)
     elif isinstance(val, dict) and mesh.subregions:
-        for index, point in zip(mesh.indices, mesh):
-            for region in mesh.subregions.keys():
-                if point in mesh.subregions[region]:
-                    array[index] = val[region]
-                    break
+        # Each cell takes the value of the first subregion it belongs to.
+        assigned = np.zeros(mesh.n, dtype=bool)
+        for region in mesh.subregions.keys():
+            subregion = mesh.subregions[region]
+            mask = ~assigned
+            for coordinate, pmin, pmax in zip(mesh.meshgrid,
+                                              subregion.pmin,
+                                              subregion.pmax):
+                mask = mask & (pmin <= coordinate) & (coordinate <= pmax)
+            if mask.any():
+                array[mask] = val[region]
+                assigned |= mask
     else:
         msg = f'Unsupported {type(val)} or invalid value dimensions.'
         raise ValueError(msg)
     return array
 
 
+def vectorised(function):
+    """Mark ``function`` as vectorised.
+
+    A vectorised function takes a tuple of coordinate arrays ``(x, y, z)``,
+    each with shape ``mesh.n``, instead of a single point and returns values
+    for the whole mesh at once.
+
+    """
+    function.vectorised = True
+    return function
+
+
 def bergluescher_angle(v1, v2, v3):
-    if np.dot(v1, np.cross(v2, v3)) == 0:
-        # If the triple product is zero, then rho=0 and division by zero is
-        # encountered. In this case, all three vectors are in-plane and the
-        # space angle is zero.
-        return 0.0
-    else:
-        rho = (2 *
-               (1 + np.dot(v1, v2)) *
-               (1 + np.dot(v2, v3)) *
-               (1 + np.dot(v3, v1)))**0.5
+    # Vectors can be arrays of shape (..., 3), in which case the angles of all
+    # triangles are computed at once and an array of shape (...) is returned.
+    v1, v2, v3 = map(np.asarray, (v1, v2, v3))
+    triple = np.sum(v1 * np.cross(v2, v3), axis=-1)
 
-        numerator = (1 +
-                     np.dot(v1, v2) +
-                     np.dot(v2, v3) +
-                     np.dot(v3, v1) +
-                     1j*(np.dot(v1, np.cross(v2, v3))))
+    # exp(i*omega/2) = numerator/rho, where rho is the (positive) modulus of
+    # the numerator. Therefore, the argument of the numerator is omega/2.
+    numerator = (1 +
+                 np.sum(v1 * v2, axis=-1) +
+                 np.sum(v2 * v3, axis=-1) +
+                 np.sum(v3 * v1, axis=-1) +
+                 1j*triple)
+    angle = 2 * np.angle(numerator) / (4*np.pi)
 
-        exp_omega = numerator/rho
+    # If the triple product is zero, all three vectors are in-plane and the
+    # space angle is zero.
+    angle = np.where(triple == 0, 0.0, angle)
 
-        return 2 * cmath.log(exp_omega).imag / (4*np.pi)
+    return float(angle) if angle.ndim == 0 else angle
 
 
 def assemble_index(value, n, dictionary):
@@ -79,18 +121,123 @@ def assemble_index(value, n, dictionary):
 def vtk_scalar_data(field, name):
     header = [f'SCALARS {name} double',
               'LOOKUP_TABLE default']
-    data = [str(value) for point, value in field]
+    # VTK order: x index changes fastest, then y, and z slowest.
+    values = field.array.transpose(2, 1, 0, 3).ravel().tolist()
+    data = list(map(str, values))
 
     return header + data
 
 
 def vtk_vector_data(field, name):
     header = [f'VECTORS {name} double']
-    data = ['{} {} {}'.format(*value) for point, value in field]
+    values = field.array.transpose(2, 1, 0, 3).ravel().tolist()
+    data = ('%r %r %r\n' * len(field.mesh) % tuple(values)).splitlines()
 
     return header + data
 
 
+def vtk_binary_block(array, compression=None, blocksize=2**15):
+    # Header and data of a binary VTK XML DataArray (UInt64 header type).
+    data = np.ascontiguousarray(array, dtype='<f8').tobytes()
+    if compression is None:
+        header = np.array([len(data)], dtype='<u8')
+    elif compression == 'zlib':
+        blocks = [zlib.compress(data[i:i+blocksize])
+                  for i in range(0, len(data), blocksize)]
+        header = np.array([len(blocks), blocksize, len(data) % blocksize,
+                           *map(len, blocks)], dtype='<u8')
+        data = b''.join(blocks)
+    else:
+        msg = f'Compression {compression=} is not supported.'
+        raise ValueError(msg)
+
+    return header.tobytes(), data
+
+
+def vtk_binary_data(content, start, header_type, compressed):
+    # Inverse of vtk_binary_block: data bytes of a raw binary block starting
+    # at index start of content.
+    nheader = 1
+    if compressed:
+        nheader = 3 + int(np.frombuffer(content, dtype=header_type, count=1,
+                                        offset=start)[0])
+    header = np.frombuffer(content, dtype=header_type, count=nheader,
+                           offset=start)
+    start += header.nbytes
+
+    if not compressed:
+        return content[start:start + int(header[0])]
+
+    offsets = np.cumsum([start, *header[3:].tolist()]).tolist()
+    return b''.join(zlib.decompress(content[i:j])
+                    for i, j in zip(offsets[:-1], offsets[1:]))
+
+
+def vtk_mesh_parameters(coordinates):
+    # Region points and the number of cells of a mesh whose cell centres are
+    # at VTK point coordinates.
+    n, cell, origin = [], [], []
+    for array in coordinates:
+        n.append(len(array))
+        origin.append(array[0])
+        if len(array) > 1:
+            cell.append(array[1] - array[0])
+        else:
+            # If only one cell exists, 1nm cell is used by default.
+            cell.append(1e-9)
+
+    p1 = np.subtract(origin, np.multiply(cell, 0.5))
+    p2 = np.add(p1, np.multiply(n, cell))
+
+    return p1, p2, n
+
+
+def hdf5_chunks(shape, itemsize, size=2**20):
+    # Default HDF5 chunk shape for a field array with shape (nx, ny, nz, dim):
+    # one z-layer per chunk, so that reading a plane touches only the chunks
+    # it intersects. Layers larger than size bytes are split along x and y.
+    chunks = [shape[0], shape[1], 1, shape[3]]
+    while (np.prod(chunks) * itemsize > size and max(chunks[:2]) > 1):
+        axis = 0 if chunks[0] >= chunks[1] else 1
+        chunks[axis] = -(-chunks[axis] // 2)
+
+    return tuple(chunks)
+
+
+def fd_weights(offsets, n):
+    # Finite-difference weights of the n-th derivative on a stencil with
+    # integer offsets for a unit cell. The weights are computed exactly, by
+    # solving sum_j w_j * offset_j**k = k! * delta(k, n) for k < m with
+    # fractions. They are returned as integers with their common denominator,
+    # so that derivative = sum_j w_j * f_j / (d * h**n). The weights depend
+    # only on (offsets, n) and they are memoised, so that the linear system is
+    # solved only once for every stencil.
+    return _fd_weights(tuple(map(int, offsets)), int(n))
+
+
+@functools.lru_cache(maxsize=None)
+def _fd_weights(offsets, n):
+    m = len(offsets)
+    matrix = [[fractions.Fraction(offset)**k for offset in offsets] +
+              [fractions.Fraction(math.factorial(n) if k == n else 0)]
+              for k in range(m)]
+    for i in range(m):
+        pivot = next(j for j in range(i, m) if matrix[j][i] != 0)
+        matrix[i], matrix[pivot] = matrix[pivot], matrix[i]
+        for j in range(m):
+            if j != i and matrix[j][i] != 0:
+                factor = matrix[j][i] / matrix[i][i]
+                matrix[j] = [a - factor*b for a, b in zip(matrix[j],
+                                                          matrix[i])]
+    weights = [matrix[i][m] / matrix[i][i] for i in range(m)]
+
+    d = 1
+    for weight in weights:
+        d = d * weight.denominator // math.gcd(d, weight.denominator)
+
+    return tuple(int(weight * d) for weight in weights), d
+
+
 def plot_line(ax, p1, p2, *args, **kwargs):
     ax.plot(*zip(p1, p2), *args, **kwargs)
 